@@ -6,29 +6,57 @@ Designed for robust, scalable job board scraping with anti-detection capabilitie
 import asyncio
 import json
 import re
+import tempfile
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any, Set, Tuple
 from urllib.parse import urljoin, urlparse
 
-from crawlee import PlaywrightCrawler, Router
+from crawlee import PlaywrightCrawler, Request, Router
+from crawlee.request_loaders import RequestManager
 from crawlee.storages import Dataset
-from crawlee.playwright_crawler import PlaywrightCrawlingContext
+from crawlee.playwright_crawler import PlaywrightCrawlingContext, PlaywrightPreNavCrawlingContext
 from pydantic import BaseModel, Field
 from loguru import logger
 
-from ..config.scraper_config import ScraperConfig
+from ..config.scraper_config import ScraperConfig, get_enabled_job_boards
 from ..utils.data_processor import JobDataProcessor
 from ..utils.job_normalizer import JobNormalizer
+from ..utils.known_jobs import KnownJobsStore
+from ..utils.search_watermarks import SearchWatermarkStore
+from ..utils.search_yields import SearchYieldStore
+from ..utils.crawl_budget import CrawlBudget
+from ..utils.crawl_checkpoint import CrawlCheckpoint
+from ..utils.search_handles import SearchTracker
+from ..utils.redis_request_queue import RedisRequestQueue
+from ..utils.metrics import get_shared_metrics
+from ..utils.dom_extraction import extract_generic_job, extract_listing_cards, extract_json_ld
+from ..utils.selector_engine import get_shared_selector_engine
+from ..utils.structured_data import find_job_posting, job_posting_to_job_data
+from ..utils.url_canonicalizer import UrlCanonicalizer
+from ..utils.search_planner import SearchPlanner, SearchSeed
+from ..utils.resource_blocking import ResourceBlocker
+from ..utils.wait_policy import WaitPolicyEngine
+from ..utils.browser_pool import create_browser_pool
+from ..utils.rate_limiter import DomainRateLimiter, RateLimitDeferred, get_shared_rate_limiter
+from ..utils.tiered_fetcher import TieredFetcher
+from ..utils.response_cache import ResponseCache, get_shared_response_cache
+from ..utils.replay import ReplayArchive, ReplayRouter, ResponseRecorder
+from ..utils.crawler_lifecycle import RestartableCrawler
+from ..utils.concurrency import ConcurrencyMonitor, build_concurrency_settings, build_crawlee_configuration
 from ..services.database_service import DatabaseService
 
+# Marks the end of a streamed crawl on the job queue
+_STREAM_END = object()
+
 
 class JobData(BaseModel):
     """Structured job data model"""
     title: str
     company: str
     location: Optional[str] = None
-    remote_type: str = "on_site"
-    employment_type: str = "full_time"
+    remote_type: Optional[str] = None
+    employment_type: Optional[str] = None
     experience_level: str = "mid"
     salary_min: Optional[int] = None
     salary_max: Optional[int] = None
@@ -52,23 +80,87 @@ class CrawleeJobScraper:
     Handles multiple job boards with intelligent routing and data extraction.
     """
     
-    def __init__(self, config: ScraperConfig):
+    def __init__(self, config: ScraperConfig, request_manager: Optional[RequestManager] = None,
+                 keep_alive: bool = False):
         self.config = config
         self.router = Router()
         self.data_processor = JobDataProcessor()
         self.job_normalizer = JobNormalizer()
         self.database_service = DatabaseService()
+        self.url_canonicalizer = UrlCanonicalizer(config.job_boards, config.tracking_params)
+        self.search_planner = SearchPlanner(config.job_boards)
+        self.selector_engine = get_shared_selector_engine(config)
+        self.resource_blocker = ResourceBlocker(config.resource_blocking, config.job_boards)
+        self.wait_policies = WaitPolicyEngine(config.wait_policies, config.job_boards)
+        self.rate_limiter = get_shared_rate_limiter(config)
+        self.response_cache = get_shared_response_cache(config)
+        self.tiered_fetcher = TieredFetcher(config, self.rate_limiter, self.response_cache)
+        self._http_tasks: Set[asyncio.Task] = set()
+        self.known_jobs = KnownJobsStore.from_config(config)
+        self.search_watermarks = SearchWatermarkStore(config.data_storage_path)
+        self.search_yields = SearchYieldStore.from_config(config)
+        self.pagination_stats = {
+            'listing_pages': 0,
+            'stopped_at_max_pages': 0,
+            'stopped_caught_up': 0,
+            'pages_saved': 0,
+            'pages_synthesized': 0,
+            'pages_clicked': 0,
+        }
+        self.listing_stats = {
+            'cards_extracted': 0,
+            'partial_jobs_pushed': 0,
+            'detail_pages_enqueued': 0,
+        }
+        self.extraction_stats = {
+            'structured_data': 0,
+            'selectors': 0,
+            'http_structured_data': 0,
+            'http_selectors': 0,
+        }
         
-        # Initialize crawler with anti-detection settings
-        self.crawler = PlaywrightCrawler(
-            max_requests_per_crawl=config.max_requests_per_crawl,
-            headless=config.headless,
-            browser_type=config.browser_type,
-            request_handler_timeout=timedelta(seconds=config.request_timeout),
-            max_request_retries=config.max_retries,
-            use_session_pool=True,
-            session_pool_size=config.session_pool_size,
-            persist_cookies_per_session=True,
+        # Named dataset and counters per board for the crawl in progress
+        self.run_id: Optional[str] = None
+        self.board_datasets: Dict[str, str] = {}
+        self.board_stats: Dict[str, Dict[str, Any]] = {}
+        
+        # Set while stream_job_board runs; handlers hand jobs to it instead of a dataset
+        self._stream_queue: Optional[asyncio.Queue] = None
+        self._stream_detached = False
+        
+        # Request ledger of the named crawl in progress, checkpointed so it can be resumed
+        self.checkpoint: Optional[CrawlCheckpoint] = None
+        
+        # Set by CrawlerService; attributes requests and jobs to the searches submitted to a kept-alive crawl
+        self.search_tracker: Optional[SearchTracker] = None
+        
+        # Time and page budget of the crawl in progress, which schedules listing pages by yield
+        self.crawl_budget: Optional[CrawlBudget] = None
+        
+        # Record-and-replay of crawl traffic, and handler latency per label
+        self.recorder: Optional[ResponseRecorder] = None
+        self.replay_router: Optional[ReplayRouter] = None
+        self._crawl_state_dir: Optional[tempfile.TemporaryDirectory] = None
+        self.handler_stats: Dict[str, Dict[str, float]] = {}
+        
+        # Prometheus metrics, and navigation start times of requests being loaded
+        self.metrics = get_shared_metrics(config)
+        self._navigation_started: Dict[str, float] = {}
+        
+        # Warm browsers shared by all requests; headless and browser type are set on the pool
+        self.browser_pool = create_browser_pool(config)
+        
+        # Workers sharing a Redis frontier split one crawl instead of each running their own
+        if request_manager is None and config.distributed_queue_enabled:
+            request_manager = RedisRequestQueue.from_config(config)
+        self.request_manager = request_manager
+        
+        # A stopped crawlee crawler never runs again, so stop_crawl has the next run build a new one
+        self.keep_alive = keep_alive
+        self.crawler_lifecycle = RestartableCrawler(self._build_crawler)
+        
+        self.concurrency_monitor = ConcurrencyMonitor(
+            self.crawler, config.concurrency_sample_interval, metrics=self.metrics
         )
         
         # Set up routing
@@ -76,6 +168,49 @@ class CrawleeJobScraper:
         
         logger.info(f"Initialized CrawleeJobScraper with config: {config.dict()}")
     
+    def _build_crawler(self) -> PlaywrightCrawler:
+        """Create the crawler with anti-detection settings, navigation hooks and error handlers"""
+        # (a kept-alive crawler waits for new requests when its queue drains, with no request cap)
+        crawler = PlaywrightCrawler(
+            browser_pool=self.browser_pool,
+            request_manager=self.request_manager,
+            request_handler=self._route_request,
+            configuration=build_crawlee_configuration(self.config),
+            concurrency_settings=build_concurrency_settings(self.config),
+            max_requests_per_crawl=None if self.keep_alive else self.config.max_requests_per_crawl,
+            keep_alive=self.keep_alive,
+            request_handler_timeout=timedelta(seconds=self.config.request_timeout),
+            max_request_retries=self.config.max_retries,
+            use_session_pool=True,
+            session_pool_size=self.config.session_pool_size,
+            persist_cookies_per_session=True,
+        )
+        
+        # Block heavy resources before each navigation
+        crawler.pre_navigation_hook(self._pre_navigation_hook)
+        crawler.error_handler(self._handle_request_error)
+        crawler.failed_request_handler(self._handle_failed_request)
+        return crawler
+    
+    @property
+    def crawler(self) -> PlaywrightCrawler:
+        """The crawler of the current (or next) crawl"""
+        return self.crawler_lifecycle.crawler
+    
+    def stop_crawl(self, reason: str):
+        """
+        Stop the crawl in progress once its in-flight requests finish
+        
+        crawlee cannot restart a stopped crawler, so the next crawl of this
+        scraper runs on a newly built one.
+        """
+        self.crawler_lifecycle.stop(reason)
+    
+    async def _replace_stopped_crawler(self, purge_request_queue: bool):
+        """Build a new crawler after stop_crawl, dropping the old run's leftover requests unless they are kept"""
+        if await self.crawler_lifecycle.prepare(purge_request_queue):
+            self.concurrency_monitor.crawler = self.crawler
+    
     def _setup_routes(self):
         """Set up URL routing for different job boards"""
         
@@ -107,13 +242,210 @@ class CrawleeJobScraper:
         async def default_handler(context: PlaywrightCrawlingContext):
             await self._handle_generic_job_page(context)
     
-    async def scrape_job_board(self, board_name: str, search_params: Dict[str, Any]) -> List[JobData]:
+    async def _route_request(self, context: PlaywrightCrawlingContext):
+        """Dispatch a loaded page to its label's handler"""
+        self.browser_pool.record_success()
+        board_name = self._board_for_request(context.request)
+        
+        navigation_started = self._navigation_started.get(context.request.unique_key)
+        if navigation_started is not None:
+            self.metrics.navigation_seconds.labels(board=board_name or 'generic').observe(
+                time.perf_counter() - navigation_started
+            )
+        self.metrics.pages_fetched.labels(
+            board=board_name or 'generic', label=context.request.label or 'default', tier='browser'
+        ).inc()
+        
+        board_stats = self.board_stats.get(board_name)
+        if board_stats is not None:
+            board_stats['requests_handled'] += 1
+            board_stats['last_activity'] = time.monotonic()
+        
+        if self.checkpoint:
+            self.checkpoint.mark_in_flight(context.request)
+        
+        start_time = time.perf_counter()
+        try:
+            await self.router(context)
+            if self.checkpoint:
+                self.checkpoint.mark_handled(context.request)
+            if self.search_tracker:
+                self.search_tracker.settle(context.request)
+        finally:
+            self._record_handler_time(context.request.label or 'default', time.perf_counter() - start_time)
+            self._navigation_started.pop(context.request.unique_key, None)
+            self._charge_page(board_name, context.request.label, time.perf_counter() - (navigation_started or start_time))
+    
+    def _charge_page(self, board_name: Optional[str], label: Optional[str], seconds: float):
+        """Count a fetched page against the crawl budget, stopping the crawl once it is spent"""
+        if self.crawl_budget is None:
+            return
+        
+        self.crawl_budget.charge_page(board_name, label, seconds)
+        if self.crawl_budget.request_stop():
+            self.stop_crawl('Crawl budget exhausted')
+    
+    def _record_handler_time(self, label: str, seconds: float):
+        """Accumulate the time a label's handler spent extracting a page"""
+        stats = self.handler_stats.setdefault(label, {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0})
+        stats['count'] += 1
+        stats['total_seconds'] += seconds
+        stats['max_seconds'] = max(stats['max_seconds'], seconds)
+    
+    def get_handler_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get handler latency per label"""
+        return {
+            label: {**stats, 'avg_seconds': round(stats['total_seconds'] / stats['count'], 4)}
+            for label, stats in self.handler_stats.items()
+        }
+    
+    def record_to(self, archive: ReplayArchive):
+        """
+        Capture every page, API response and redirect of the next crawls into an archive
+        
+        The response cache is bypassed so full responses reach the network and the archive,
+        and cross-run state is isolated so every search is recorded in full.
+        """
+        self._isolate_crawl_state()
+        self.recorder = ResponseRecorder(archive)
+        self.response_cache = ResponseCache(self.config.data_storage_path, self.config.job_boards, enabled=False)
+        self.tiered_fetcher = TieredFetcher(self.config, self.rate_limiter, self.response_cache)
+        self.tiered_fetcher.response_hooks.append(self.recorder.record_httpx_response)
+    
+    def replay_from(self, archive: ReplayArchive):
+        """Serve the next crawls entirely from an archive, with no network, pacing, caching or cross-run state"""
+        self._isolate_crawl_state()
+        self.replay_router = ReplayRouter(archive)
+        self.rate_limiter = DomainRateLimiter(delay=0.0, randomize=False)
+        self.response_cache = ResponseCache(self.config.data_storage_path, self.config.job_boards, enabled=False)
+        self.tiered_fetcher = TieredFetcher(
+            self.config, self.rate_limiter, self.response_cache, transport=self.replay_router.httpx_transport()
+        )
+    
+    def _isolate_crawl_state(self):
+        """
+        Keep the known jobs, search watermarks and search yields of the next crawls in a scratch directory
+        
+        Recorded and replayed crawls then start from empty state, so neither
+        incremental pagination nor search pruning cuts them short, and they
+        never advance the production watermarks or yield statistics.
+        """
+        if self._crawl_state_dir is None:
+            self._crawl_state_dir = tempfile.TemporaryDirectory(prefix='crawl-state-')
+        state_path = self._crawl_state_dir.name
+        self.known_jobs = KnownJobsStore.from_config(self.config, state_path)
+        self.search_watermarks = SearchWatermarkStore(state_path)
+        self.search_yields = SearchYieldStore.from_config(self.config, state_path)
+        logger.info(f"Isolated cross-run crawl state under {state_path}")
+    
+    async def _handle_request_error(self, context, error: Exception):
+        """Track failed navigations so a misbehaving browser gets recycled"""
+        if isinstance(error, RateLimitDeferred):
+            # Nothing was fetched: put the request back without spending one of its retries
+            context.request.retry_count -= 1
+            self._navigation_started.pop(context.request.unique_key, None)
+            logger.debug(f"Deferred {context.request.url}: {error}")
+            return
+        
+        logger.warning(f"Request failed for {context.request.url}: {error}")
+        self.browser_pool.record_error()
+        self.metrics.record_error(context.request.label or 'default')
+        self._navigation_started.pop(context.request.unique_key, None)
+        # The cached page may be what broke the handler; the retry refetches it
+        self.response_cache.evict(context.request.url)
+        board_stats = self.board_stats.get(self._board_for_request(context.request))
+        if board_stats is not None:
+            board_stats['requests_failed'] += 1
+    
+    async def _handle_failed_request(self, context, error: Exception):
+        """Settle a request that ran out of retries, so the search it belongs to can finish"""
+        logger.error(f"Giving up on {context.request.url} after {context.request.retry_count} retries: {error}")
+        self.response_cache.evict(context.request.url)
+        if self.search_tracker:
+            self.search_tracker.settle(context.request, failed=True)
+    
+    async def _pre_navigation_hook(self, context: PlaywrightPreNavCrawlingContext):
+        """Pace the request's domain and install resource blocking and response caching before navigating"""
+        try:
+            board_name = self._board_for_request(context.request)
+            
+            # Retries bypass the cache, as the cached page may be what failed.
+            # A page served from the cache sends no request, so it needs no rate limit slot
+            refresh = context.request.retry_count > 0
+            if refresh or not self.response_cache.is_fresh(board_name, context.request.url):
+                await self._acquire_navigation_slot(context.request)
+            
+            self._track_navigation_status(context.page)
+            if self.recorder:
+                self.recorder.attach(context.page)
+            
+            # Route handlers run newest first: cache, then resource blocking, then replay
+            if self.replay_router:
+                await self.replay_router.apply(context.page)
+            await self.resource_blocker.apply(context.page, board_name)
+            await self.response_cache.apply(context.page, board_name, refresh=refresh)
+            
+            self._navigation_started[context.request.unique_key] = time.perf_counter()
+        except RateLimitDeferred:
+            raise
+        except Exception as e:
+            logger.error(f"Error preparing navigation to {context.request.url}: {e}")
+            # Without its routes a replayed page would go to the live site
+            if self.replay_router:
+                raise
+    
+    async def _acquire_navigation_slot(self, request):
+        """
+        Wait for the rate limit slot of a navigation without exhausting the handler timeout
+        
+        The hook runs inside ``request_handler_timeout``, so a slot further away
+        than a share of it defers the request instead: it waits out part of the
+        gap and raises, and the crawler reclaims it without spending a retry.
+        A request on its last attempt cannot be reclaimed and waits regardless.
+        """
+        if request.retry_count >= self.config.max_retries:
+            await self.rate_limiter.acquire(request.url)
+            return
+        
+        max_wait = self.config.request_timeout * self.config.rate_limit_max_wait_share
+        try:
+            await self.rate_limiter.acquire(request.url, max_wait=max_wait)
+        except RateLimitDeferred as e:
+            await asyncio.sleep(min(e.wait, max_wait))
+            raise
+    
+    def _track_navigation_status(self, page):
+        """Feed main-frame navigation statuses to the rate limiter so 429s slow only that domain"""
+        def on_response(response):
+            try:
+                if response.request.is_navigation_request() and response.frame == page.main_frame:
+                    self.rate_limiter.record_response(
+                        response.url, response.status, response.headers.get('retry-after')
+                    )
+            except Exception as e:
+                logger.debug(f"Error recording response status: {e}")
+        
+        page.on('response', on_response)
+    
+    def _board_for_request(self, request) -> Optional[str]:
+        """Resolve the job board of a request from its label, falling back to its domain"""
+        label = request.label or ''
+        board_name = label.split('_', 1)[0]
+        if board_name in self.config.job_boards:
+            return board_name
+        
+        domain = urlparse(request.url).netloc.lower()
+        return next((board for board in self.config.job_boards if board in domain), None)
+    
+    async def scrape_job_board(self, board_name: str, search_params: Dict[str, Any],
+                               crawl_name: Optional[str] = None) -> List[JobData]:
         """
         Scrape jobs from a specific job board
         
         Args:
             board_name: Name of the job board (linkedin, indeed, glassdoor, etc.)
             search_params: Search parameters (keywords, location, etc.)
+            crawl_name: Checkpoint the crawl under this name so resume_crawl can continue it
         
         Returns:
             List of scraped job data
@@ -121,379 +453,1145 @@ class CrawleeJobScraper:
         try:
             logger.info(f"Starting scrape for {board_name} with params: {search_params}")
             
-            # Generate search URLs based on board and parameters
-            search_urls = self._generate_search_urls(board_name, search_params)
+            results = await self._crawl_boards({board_name: search_params}, crawl_name)
+            return results[board_name]['jobs'] if board_name in results else []
+        
+        except Exception as e:
+            logger.error(f"Error scraping {board_name}: {e}")
+            return []
+    
+    async def scrape_all_boards(self, search_params: Optional[Dict[str, Any]] = None,
+                                boards: Optional[List[str]] = None,
+                                crawl_name: Optional[str] = None,
+                                time_budget: Optional[float] = None,
+                                page_budget: Optional[int] = None,
+                                prune: Optional[bool] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Scrape several job boards concurrently in a single crawler run
+        
+        Parameter values may be lists; every combination is searched, so a full
+        sweep over default_search_params is a single crawl. With a time or page
+        budget, pages go to the searches finding the most new jobs per second
+        and the crawl stops when the budget is spent. Searches of a scheduled
+        sweep are pruned by their yield in previous runs; searches asked for
+        explicitly always run.
+        
+        Args:
+            search_params: Search parameters shared by all boards, or a mapping of
+                board name to that board's search parameters (defaults to default_search_params)
+            boards: Boards to scrape (defaults to the enabled job boards)
+            crawl_name: Checkpoint the crawl under this name so resume_crawl can continue it
+            time_budget: Seconds the crawl may run (defaults to crawl_time_budget)
+            page_budget: Pages the crawl may fetch (defaults to crawl_page_budget)
+            prune: Whether this is a scheduled sweep whose searches may be pruned (defaults to
+                whether search_params was left to default_search_params); only applies when
+                search_pruning_enabled is set
+        
+        Returns:
+            Mapping of board name to {'jobs': List[JobData], 'stats': Dict}
+        """
+        boards = boards or get_enabled_job_boards(self.config)
+        prune = (not search_params) if prune is None else prune
+        search_params = search_params or self.config.default_search_params
+        board_params = {
+            board_name: search_params[board_name] if isinstance(search_params.get(board_name), dict) else search_params
+            for board_name in boards
+        }
+        
+        try:
+            logger.info(f"Starting concurrent scrape of {', '.join(boards)} with params: {search_params}")
+            return await self._crawl_boards(
+                board_params, crawl_name, time_budget=time_budget, page_budget=page_budget, prune=prune
+            )
+        
+        except Exception as e:
+            logger.error(f"Error scraping job boards {boards}: {e}")
+            return {}
+    
+    async def resume_crawl(self, crawl_name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Continue a named crawl from its last checkpoint, e.g. after a crash or deploy
+        
+        Pending and in-flight requests are re-queued, completed pages are skipped,
+        and jobs keep going to the crawl's original datasets.
+        
+        Args:
+            crawl_name: Name the crawl was started with
+        
+        Returns:
+            Mapping of board name to {'jobs': List[JobData], 'stats': Dict}, including
+            jobs scraped before the interruption
+        """
+        try:
+            logger.info(f"Resuming crawl {crawl_name}")
+            return await self._crawl_boards({}, crawl_name, resume=True)
+        
+        except Exception as e:
+            logger.error(f"Error resuming crawl {crawl_name}: {e}")
+            return {}
+    
+    async def stream_job_board(self, board_name: str, search_params: Dict[str, Any],
+                               queue_size: Optional[int] = None) -> AsyncIterator[JobData]:
+        """
+        Scrape a job board, yielding each normalized job as soon as a handler produces it
+        
+        Jobs pass through a bounded queue instead of the dataset, so handlers wait
+        when the consumer falls behind and memory stays bounded by the queue size.
+        Closing the iterator early stops the crawl.
+        
+        Args:
+            board_name: Name of the job board (linkedin, indeed, glassdoor, etc.)
+            search_params: Search parameters (keywords, location, etc.)
+            queue_size: Maximum jobs buffered between handlers and the consumer
+        
+        Yields:
+            Scraped job data
+        """
+        logger.info(f"Starting streaming scrape for {board_name} with params: {search_params}")
+        
+        seeds = self._prepare_crawl({board_name: search_params})
+        if not seeds:
+            return
+        
+        queue = asyncio.Queue(maxsize=queue_size or self.config.stream_queue_size)
+        self._stream_queue = queue
+        start_time = time.monotonic()
+        
+        async def crawl():
+            try:
+                await self._run_crawl(seeds)
+            except Exception as e:
+                logger.error(f"Error scraping {board_name}: {e}")
+            if not self._stream_detached:
+                await queue.put(_STREAM_END)
+        
+        crawl_task = asyncio.create_task(crawl())
+        jobs_yielded = 0
+        
+        try:
+            while True:
+                item = await queue.get()
+                if item is _STREAM_END:
+                    break
+                
+                try:
+                    job_data = JobData(**item)
+                except Exception as e:
+                    logger.error(f"Error parsing job data: {e}")
+                    self.board_stats[board_name]['parse_errors'] += 1
+                    continue
+                
+                jobs_yielded += 1
+                yield job_data
+        
+        finally:
+            # crawlee swallows the cancellation of a running crawl, so a consumer that
+            # closes early stops it instead, dropping the jobs still being pushed and
+            # draining the queue so handlers blocked on it can finish
+            self._stream_detached = True
+            if not crawl_task.done():
+                self.stop_crawl('Stream consumer closed')
+                while not crawl_task.done():
+                    while not queue.empty():
+                        queue.get_nowait()
+                    await asyncio.wait({crawl_task}, timeout=0.1)
+            self._stream_queue = None
+            self._stream_detached = False
             
-            if not search_urls:
+            board_stats = self._finish_board_stats(board_name, start_time, jobs_yielded)
+            logger.info(f"Streamed {jobs_yielded} jobs from {board_name}: {board_stats}")
+            self._log_crawl_stats()
+    
+    def _prepare_crawl(self, board_params: Dict[str, Dict[str, Any]],
+                       crawl_name: Optional[str] = None, prune: bool = False) -> List[Request]:
+        """Start a new crawl run and build the labeled search seeds of every board, pruned for scheduled sweeps"""
+        self.run_id = datetime.now().strftime('%Y%m%d%H%M%S')
+        self.board_datasets = {}
+        self.board_stats = {}
+        self.crawl_budget = None
+        
+        # Expand and deduplicate the searches of every board, highest priority first
+        search_seeds = self.search_planner.plan(board_params)
+        
+        # Drop or demote searches that kept yielding few new jobs in previous runs
+        if prune and self.config.search_pruning_enabled:
+            search_seeds = self.search_yields.review(search_seeds)
+        
+        for board_name in board_params:
+            board_seeds = [seed for seed in search_seeds if seed.board == board_name]
+            if not board_seeds:
                 logger.warning(f"No search URLs generated for {board_name}")
-                return []
+                continue
+            
+            # Detail URLs enqueued by a previous crawl must be fetchable again
+            self.url_canonicalizer.reset_seen(board_name)
             
-            # Run the crawler
-            await self.crawler.run(search_urls)
+            self.board_datasets[board_name] = f"{board_name}-jobs-{self.run_id}"
+            self.board_stats[board_name] = {
+                'search_urls': len(board_seeds),
+                'searches_collapsed': sum(seed.equivalent_searches - 1 for seed in board_seeds),
+                'requests_handled': 0,
+                'requests_failed': 0,
+                'jobs_pushed': 0,
+                'duplicate_jobs': 0,
+                'parse_errors': 0,
+                'last_activity': None,
+            }
+        
+        logger.info(f"Planned {len(search_seeds)} searches: {self.search_planner.get_stats()}")
+        seeds = self._seed_requests(search_seeds)
+        
+        self.checkpoint = None
+        if crawl_name:
+            self.checkpoint = CrawlCheckpoint(
+                self.config.data_storage_path, crawl_name, self.config.checkpoint_interval,
+                state_provider=self._checkpoint_state
+            )
+            self.checkpoint.track(seeds)
+        
+        return seeds
+    
+    async def serve(self):
+        """
+        Run a kept-alive crawl that handles requests added by submit_searches
+        until stop_crawl, then commit crawl-wide state
+        
+        Requests enqueued before the crawl starts, or left by a stopped one, are kept.
+        """
+        try:
+            await self._run_crawl([], purge_request_queue=False)
+        finally:
+            self._log_crawl_stats()
+    
+    async def submit_searches(self, board_params: Dict[str, Dict[str, Any]], search_id: str) -> int:
+        """
+        Plan searches and enqueue their first pages into the running crawl
+        
+        Returns:
+            Number of search pages enqueued
+        """
+        seeds = self._seed_requests(self.search_planner.plan(board_params), search_id)
+        if seeds:
+            await self._add_requests(None, seeds)
+        return len(seeds)
+    
+    def _seed_requests(self, search_seeds: List[SearchSeed], search_id: Optional[str] = None) -> List[Request]:
+        """
+        Labeled first-page requests of planned searches
+        
+        Listing pages of a submitted search (search_id) get their own unique keys,
+        so the same search submitted again to a kept-alive crawl is fetched again.
+        """
+        return [
+            Request.from_url(
+                seed.url,
+                label=f"{seed.board}_jobs",
+                unique_key=f"{seed.url}#search={search_id}" if search_id else None,
+                user_data={
+                    'search': seed.params, 'priority': seed.priority, 'search_key': seed.url, 'page': 1,
+                    'max_pages': seed.max_pages, 'search_id': search_id,
+                }
+            )
+            for seed in search_seeds
+        ]
+    
+    def _checkpoint_state(self) -> Dict[str, Any]:
+        """Scraper state saved with every checkpoint and restored by resume_crawl"""
+        return {
+            'run_id': self.run_id,
+            'board_datasets': self.board_datasets,
+            'board_stats': {
+                board_name: {key: value for key, value in stats.items() if key != 'last_activity'}
+                for board_name, stats in self.board_stats.items()
+            },
+            'pagination': self.search_watermarks.export_pending(),
+            'search_yields': self.search_yields.export_pending(),
+            'pagination_stats': self.pagination_stats,
+        }
+    
+    def _restore_crawl(self, crawl_name: str) -> List[Request]:
+        """Reload a named crawl's last checkpoint and rebuild the requests it had not completed"""
+        checkpoint = CrawlCheckpoint.load(self.config.data_storage_path, crawl_name, self.config.checkpoint_interval)
+        if checkpoint is None or checkpoint.status == 'finished':
+            logger.warning(f"No unfinished checkpoint of crawl {crawl_name} to resume")
+            self.checkpoint = None
+            return []
+        
+        state = checkpoint.state
+        self.run_id = state.get('run_id') or datetime.now().strftime('%Y%m%d%H%M%S')
+        self.board_datasets = state.get('board_datasets', {})
+        self.board_stats = {
+            board_name: {**stats, 'last_activity': None} for board_name, stats in state.get('board_stats', {}).items()
+        }
+        self.search_watermarks.restore_pending(state.get('pagination', []))
+        self.search_yields.restore_pending(state.get('search_yields', []))
+        self.pagination_stats.update(state.get('pagination_stats', {}))
+        
+        # Detail pages enqueued before the interruption are not enqueued again by re-run listings
+        for board_name in self.board_datasets:
+            self.url_canonicalizer.reset_seen(board_name)
+        for entry in checkpoint.requests.values():
+            label = entry['user_data'].get('label') or ''
+            if label.endswith('_job_detail'):
+                self.url_canonicalizer.register(label.split('_', 1)[0], entry['url'])
+        
+        checkpoint.state_provider = self._checkpoint_state
+        self.checkpoint = checkpoint
+        requests = checkpoint.unfinished_requests()
+        logger.info(f"Resuming crawl {crawl_name} (run {self.run_id}) with {len(requests)} unfinished requests")
+        return requests
+    
+    async def _run_crawl(self, seeds: List[Request], purge_request_queue: bool = True):
+        """Run the crawler over the seeds while sampling concurrency"""
+        distributed_queue = self.request_manager if isinstance(self.request_manager, RedisRequestQueue) else None
+        if distributed_queue:
+            # A completed sweep's dedup set would otherwise swallow this sweep's seeds
+            await distributed_queue.reset_if_finished()
+        
+        await self._replace_stopped_crawler(purge_request_queue)
+        
+        await self.concurrency_monitor.start()
+        if self.checkpoint:
+            await self.checkpoint.start()
+        metrics_task = asyncio.create_task(self._sample_metrics())
+        budget_task = asyncio.create_task(self._schedule_budget()) if self.crawl_budget else None
+        try:
+            await self.crawler.run(seeds, purge_request_queue=purge_request_queue)
             
-            # Get scraped data from dataset
-            dataset = await Dataset.open()
-            scraped_data = []
+            # HTTP fetches still in flight may escalate detail pages after the browser queue drained,
+            # and a budgeted crawl may still hold back listing pages of slower searches
+            while self._http_tasks or (self.crawl_budget and self.crawl_budget.has_deferred):
+                await asyncio.gather(*list(self._http_tasks), return_exceptions=True)
+                await self._release_deferred_pages(self.config.max_concurrent_requests)
+                if self.crawler_lifecycle.stopped or (self.crawl_budget and self.crawl_budget.exhausted):
+                    break
+                request_manager = await self.crawler.get_request_manager()
+                if not await request_manager.is_finished():
+                    await self.crawler.run(purge_request_queue=False)
+        finally:
+            for task in self._http_tasks:
+                task.cancel()
+            metrics_task.cancel()
+            if budget_task:
+                budget_task.cancel()
+            await self.concurrency_monitor.stop()
+            if self.checkpoint:
+                await self.checkpoint.stop()
+            if distributed_queue:
+                logger.info(f"Distributed queue stats: {await distributed_queue.get_stats()}")
+    
+    async def _sample_metrics(self):
+        """Refresh the queue depth and browser pool gauges while a crawl runs"""
+        while True:
+            try:
+                self.metrics.sample_browser_pool(self.browser_pool)
+                self.metrics.http_tasks_in_flight.set(len(self._http_tasks))
+                await self.metrics.sample_queue(await self.crawler.get_request_manager())
+            except Exception as e:
+                logger.debug(f"Error sampling metrics: {e}")
+            await asyncio.sleep(self.config.concurrency_sample_interval)
+            
+    async def _schedule_budget(self):
+        """Stop the crawl when its time budget runs out, and hand held-back listing pages to idle capacity"""
+        while True:
+            # Checked every second, as time budgets are much shorter-grained than metric samples
+            await asyncio.sleep(1.0)
+            try:
+                if self.crawl_budget.request_stop():
+                    self.stop_crawl('Crawl budget exhausted')
+                    return
+                
+                request_manager = await self.crawler.get_request_manager()
+                pending = await request_manager.get_total_count() - await request_manager.get_handled_count()
+                if pending < self.config.max_concurrent_requests:
+                    await self._release_deferred_pages(self.config.max_concurrent_requests - pending)
+            except Exception as e:
+                logger.debug(f"Error scheduling crawl budget: {e}")
+    
+    async def _release_deferred_pages(self, limit: int) -> int:
+        """Enqueue held-back listing pages of the searches with the best yield, up to limit"""
+        if self.crawl_budget is None:
+            return 0
+        
+        requests = self.crawl_budget.release(limit)
+        if requests:
+            await self._add_requests(None, requests, forefront=True)
+        return len(requests)
+    
+    def _finish_board_stats(self, board_name: str, start_time: float, jobs: int) -> Dict[str, Any]:
+        """Close out a board's counters once the crawl is over"""
+        board_stats = self.board_stats[board_name]
+        last_activity = board_stats.pop('last_activity', None)
+        board_stats.update({
+            'jobs': jobs,
+            'dataset': self.board_datasets[board_name],
+            'duration_seconds': round((last_activity or start_time) - start_time, 2),
+        })
+        return board_stats
+    
+    async def _crawl_boards(self, board_params: Dict[str, Dict[str, Any]], crawl_name: Optional[str] = None,
+                            resume: bool = False, time_budget: Optional[float] = None,
+                            page_budget: Optional[int] = None, prune: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Seed one crawler run with the search pages of every board (or with the
+        unfinished requests of a checkpointed crawl), then read each board's jobs
+        back from the named dataset its handlers pushed to
+        """
+        seeds = self._restore_crawl(crawl_name) if resume else self._prepare_crawl(board_params, crawl_name, prune)
+        if not seeds:
+            return {}
+        
+        self.crawl_budget = CrawlBudget.from_config(self.config, time_budget, page_budget)
+        
+        # Run the crawler
+        start_time = time.monotonic()
+        await self._run_crawl(seeds)
+        
+        results = {}
+        for board_name, dataset_name in self.board_datasets.items():
+            # Get scraped data from the board's dataset. A request that pushed its jobs after the
+            # last checkpoint save ran again on resume, so later copies of a job replace earlier ones
+            dataset = await Dataset.open(name=dataset_name)
+            jobs_by_key: Dict[str, JobData] = {}
+            duplicates = 0
             
             async for item in dataset.iterate_items():
                 try:
                     job_data = JobData(**item)
-                    scraped_data.append(job_data)
                 except Exception as e:
                     logger.error(f"Error parsing job data: {e}")
+                    self.board_stats[board_name]['parse_errors'] += 1
                     continue
             
-            logger.info(f"Scraped {len(scraped_data)} jobs from {board_name}")
-            return scraped_data
+                key = job_data.external_id or job_data.source_url
+                if key in jobs_by_key:
+                    duplicates += 1
+                jobs_by_key[key] = job_data
             
-        except Exception as e:
-            logger.error(f"Error scraping {board_name}: {e}")
-            return []
+            scraped_data = list(jobs_by_key.values())
+            self.board_stats[board_name]['duplicate_jobs'] = duplicates
+            board_stats = self._finish_board_stats(board_name, start_time, len(scraped_data))
+            results[board_name] = {'jobs': scraped_data, 'stats': board_stats}
+            logger.info(f"Scraped {len(scraped_data)} jobs from {board_name}: {board_stats}")
+        
+        logger.info(f"Crawl {self.run_id} finished in {time.monotonic() - start_time:.1f}s")
+        self._log_crawl_stats()
+        
+        if self.checkpoint:
+            self.checkpoint.finish()
+            logger.info(f"Checkpoint stats: {self.checkpoint.get_stats()}")
+            self.checkpoint = None
+        return results
     
-    def _generate_search_urls(self, board_name: str, search_params: Dict[str, Any]) -> List[str]:
-        """Generate search URLs for different job boards"""
+    def _log_crawl_stats(self):
+        """Log the crawl-wide stats of every component"""
+        logger.info(f"URL canonicalization stats: {self.url_canonicalizer.get_stats()}")
+        if self.config.listing_only_mode:
+            self.known_jobs.save()
+            logger.info(f"Listing-only stats: {self.listing_stats}")
+        self.search_watermarks.commit()
+        logger.info(f"Pagination stats: {self.pagination_stats} (watermarks: {self.search_watermarks.get_stats()})")
+        self.search_yields.commit(self.run_id)
+        logger.info(f"Search yield stats: {self.search_yields.get_stats()}")
+        logger.info(f"Extraction stats: {self.extraction_stats} (selectors: {self.selector_engine.get_stats()})")
+        logger.info(f"Resource blocking stats: {self.resource_blocker.get_stats()}")
+        logger.info(f"Wait policy stats: {self.wait_policies.get_stats()}")
+        logger.info(
+            f"Browser pool stats: {self.browser_pool.get_stats()} "
+            f"(session_pool_size={self.config.session_pool_size}, "
+            f"max_concurrent_requests={self.config.max_concurrent_requests})"
+        )
+        logger.info(f"Concurrency stats: {self.concurrency_monitor.get_stats()}")
+        logger.info(f"Rate limiter stats: {self.rate_limiter.get_stats()}")
+        logger.info(f"Tiered fetching stats: {self.tiered_fetcher.get_stats()}")
+        logger.info(f"Response cache stats: {self.response_cache.get_stats()}")
+        logger.info(f"Handler latency stats: {self.get_handler_stats()}")
+        if self.crawl_budget:
+            logger.info(f"Crawl budget stats: {self.crawl_budget.get_stats()}")
+            
+    async def _push_jobs(self, context: Optional[PlaywrightCrawlingContext], board_name: Optional[str], data,
+                         request: Optional[Request] = None):
+        """
+        Push job data to the board's dataset for the current crawl, the stream consumer,
+        or the handle of the submitted search the request belongs to
         
-        keywords = search_params.get('keywords', '')
-        location = search_params.get('location', '')
-        experience_level = search_params.get('experience_level', '')
-        job_type = search_params.get('job_type', '')
+        Jobs produced outside a request handler (context is None) are written to the dataset directly.
+        """
+        source_request = context.request if context is not None else request
+        search_id = source_request.user_data.get('search_id') if source_request is not None else None
+        if self.search_tracker and search_id:
+            self.search_tracker.add_jobs(source_request, data if isinstance(data, list) else [data])
+        elif self._stream_queue is not None:
+            # Jobs of a stream whose consumer has gone are dropped
+            if self._stream_detached:
+                return
+            for item in data if isinstance(data, list) else [data]:
+                await self._stream_queue.put(item)
+        elif context is not None:
+            await context.push_data(data, dataset_name=self.board_datasets.get(board_name))
+        else:
+            dataset = await Dataset.open(name=self.board_datasets.get(board_name))
+            await dataset.push_data(data)
         
-        urls = []
+        # A listing card's job becomes known once its detail page produced the job
+        known_job = source_request.user_data.get('known_job') if source_request is not None else None
+        if board_name and known_job:
+            self.known_jobs.record(board_name, known_job['external_id'], known_job['fingerprint'])
         
-        if board_name == 'linkedin':
-            base_url = "https://www.linkedin.com/jobs/search"
-            params = []
-            
-            if keywords:
-                params.append(f"keywords={keywords.replace(' ', '%20')}")
-            if location:
-                params.append(f"location={location.replace(' ', '%20')}")
-            if experience_level:
-                exp_map = {'entry': '1', 'mid': '2', 'senior': '3', 'executive': '4'}
-                if experience_level in exp_map:
-                    params.append(f"f_E={exp_map[experience_level]}")
-            
-            url = f"{base_url}?{'&'.join(params)}" if params else base_url
-            urls.append(url)
-            
-        elif board_name == 'indeed':
-            base_url = "https://www.indeed.com/jobs"
-            params = []
-            
-            if keywords:
-                params.append(f"q={keywords.replace(' ', '+')}")
-            if location:
-                params.append(f"l={location.replace(' ', '+')}")
+        board_stats = self.board_stats.get(board_name)
+        if board_stats is not None:
+            board_stats['jobs_pushed'] += len(data) if isinstance(data, list) else 1
+    
+    async def _normalize_jobs(self, board_name: Optional[str], data):
+        """Normalize one job or a batch, timing it and counting the normalized jobs"""
+        with self.metrics.time(self.metrics.normalization_seconds, board=board_name or 'generic'):
+            if isinstance(data, list):
+                normalized = await self.job_normalizer.batch_normalize(data)
+            else:
+                normalized = await self.job_normalizer.normalize_job_data(data)
+        
+        self.metrics.jobs_normalized.labels(board=board_name or 'generic').inc(
+            len(normalized) if isinstance(normalized, list) else 1
+        )
+        return normalized
+    
+    async def _wait_for_page(self, context: PlaywrightCrawlingContext, page_type: str,
+                             previous_url: Optional[str] = None) -> str:
+        """Wait for the page under the board's wait policy for the page type, returning the outcome"""
+        board_name = self._board_for_request(context.request)
+        outcome, elapsed = await self.wait_policies.wait(context.page, board_name, page_type, previous_url)
+        self.metrics.page_wait_seconds.labels(
+            board=board_name or 'generic', page_type=page_type, outcome=outcome
+        ).observe(elapsed)
+        return outcome
+    
+    def _track_requests(self, context: Optional[PlaywrightCrawlingContext], requests: List[Request]):
+        """Record new requests in the checkpoint and against the submitted search of the page that found them"""
+        search_id = context.request.user_data.get('search_id') if context is not None else None
+        if search_id:
+            for request in requests:
+                request.user_data.setdefault('search_id', search_id)
+        
+        if self.checkpoint:
+            self.checkpoint.track(requests)
+        if self.search_tracker:
+            self.search_tracker.track(requests)
+    
+    async def _add_requests(self, context: Optional[PlaywrightCrawlingContext], requests: List[Request],
+                            forefront: bool = False):
+        """
+        Enqueue requests from a handler, or on the crawler when there is no context, recording them in the checkpoint
+        
+        Requests put at the front of the queue always go through the crawler, as handler contexts only append.
+        """
+        self._track_requests(context, requests)
+        
+        if context is not None and not forefront:
+            await context.add_requests(requests)
+        else:
+            await self.crawler.add_requests(requests, forefront=forefront)
+    
+    async def _enqueue_job_details(self, context: PlaywrightCrawlingContext, board_name: str,
+                                   urls: List[str], label: str,
+                                   user_data: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Canonicalize detail URLs and enqueue the ones not seen in this crawl in a single batch
+        
+        Args:
+            user_data: Extra user data of the requests, by URL
+        """
+        user_data = user_data or {}
+        requests = []
+        duplicates = []
+        for url in urls:
+            canonical_url = self.url_canonicalizer.canonicalize(board_name, url)
+            if self.url_canonicalizer.register(board_name, canonical_url):
+                requests.append(Request.from_url(canonical_url, label=label, user_data=user_data.get(url, {})))
+            else:
+                duplicates.append(Request.from_url(canonical_url, label=label))
+        
+        # A submitted search still gets the jobs of detail pages another search enqueued
+        search_id = context.request.user_data.get('search_id')
+        if self.search_tracker and search_id and duplicates:
+            self.search_tracker.reference(search_id, duplicates)
+        
+        # Charged to the listing page's search by the crawl budget
+        context.request.user_data['detail_pages_enqueued'] = len(requests)
+        
+        if requests and self.tiered_fetcher.use_http(board_name):
+            self._track_requests(context, requests)
             
-            url = f"{base_url}?{'&'.join(params)}" if params else base_url
-            urls.append(url)
+            # Try the HTTP tier first; pages it cannot handle are escalated to the browser
+            for request in requests:
+                task = asyncio.create_task(self._fetch_detail_over_http(board_name, request))
+                self._http_tasks.add(task)
+                task.add_done_callback(self._http_tasks.discard)
+        elif requests:
+            await self._add_requests(context, requests)
+        
+        skipped = len(urls) - len(requests)
+        if skipped:
+            logger.debug(f"Skipped {skipped} duplicate {board_name} job URLs on {context.request.url}")
+    
+    async def _fetch_detail_over_http(self, board_name: str, request: Request):
+        """Build a job from a detail page fetched over HTTP, or enqueue the page for the browser"""
+        url = request.url
+        start_time = time.perf_counter()
+        pushed = False
+        try:
+            result = await self.tiered_fetcher.fetch_job(board_name, url)
+            self.metrics.pages_fetched.labels(board=board_name, label=request.label or 'default', tier='http').inc()
+            self._charge_page(board_name, request.label, time.perf_counter() - start_time)
+            if result is None:
+                await self._add_requests(None, [request])
+                return
             
-        elif board_name == 'glassdoor':
-            base_url = "https://www.glassdoor.com/Job/jobs.htm"
-            params = []
+            fields, method = result
+            fields.setdefault('external_id', self._extract_job_id(board_name, url))
+            fields.setdefault('posted_date', datetime.now())
             
-            if keywords:
-                params.append(f"sc.keyword={keywords.replace(' ', '%20')}")
-            if location:
-                params.append(f"locT=C&locId={location.replace(' ', '%20')}")
+            job_data = JobData(
+                **fields,
+                source=board_name,
+                source_url=url,
+                quality_score=self._calculate_quality_score(
+                    fields['title'], fields.get('company', ''), fields.get('description', '')
+                )
+            )
             
-            url = f"{base_url}?{'&'.join(params)}" if params else base_url
-            urls.append(url)
+            normalized_data = await self._normalize_jobs(board_name, job_data.dict())
+            await self._push_jobs(None, board_name, normalized_data, request)
+            pushed = True
+            self.extraction_stats[f'http_{method}'] += 1
+            self.metrics.jobs_extracted.labels(board=board_name, method=f'http_{method}').inc()
+            if self.checkpoint:
+                self.checkpoint.mark_handled(request)
+            if self.search_tracker:
+                self.search_tracker.settle(request)
         
-        return urls
+        except Exception as e:
+            logger.error(f"Error processing {board_name} job over HTTP {url}: {e}")
+            self.metrics.record_error(request.label or 'default')
+            if not pushed:
+                # Let the browser tier try the page, like a page the HTTP tier could not extract
+                try:
+                    await self._add_requests(None, [request])
+                    return
+                except Exception as escalation_error:
+                    logger.error(f"Could not hand {url} to the browser: {escalation_error}")
+            if self.search_tracker:
+                self.search_tracker.settle(request, failed=not pushed)
+    
+    async def _process_listing_cards(self, context: PlaywrightCrawlingContext, board_name: str,
+                                     detail_label: str) -> List[Tuple[str, Optional[datetime]]]:
+        """
+        Build partial jobs straight from listing cards and push them in bulk
+        
+        Detail pages are only enqueued for new or changed jobs, and only when
+        enqueue_changed_details is enabled; those jobs are pushed by the detail handler instead.
+        
+        Returns:
+            (external_id, posted_date) of every card, in page order
+        """
+        board_config = self.config.job_boards.get(board_name, {})
+        card_config = board_config.get('listing_cards', {})
+        job_list_selector = board_config.get('selectors', {}).get('job_list')
+        
+        if not card_config or not job_list_selector:
+            logger.warning(f"No listing card config for {board_name}, skipping listing-only extraction")
+            return []
+        
+        with self.metrics.time(self.metrics.extraction_seconds, board=board_name, method='listing_cards'):
+            cards = await extract_listing_cards(
+                context.page, job_list_selector, card_config, self.config.max_jobs_per_page
+            )
+        self.listing_stats['cards_extracted'] += len(cards)
+        
+        partial_jobs = []
+        detail_urls = []
+        page_jobs = []
+        known_jobs = []
+        detail_user_data = {}
+        
+        for card in cards:
+            try:
+                url = card.get('url')
+                if not url and card.get('external_id') and card_config.get('detail_url_template'):
+                    url = card_config['detail_url_template'].format(id=card['external_id'])
+                if not url or not card.get('title'):
+                    continue
+                
+                url = self.url_canonicalizer.canonicalize(board_name, urljoin(context.request.url, url))
+                external_id = card.get('external_id') or self._extract_job_id(board_name, url) or url
+                posted_date = self.job_normalizer.parse_posted_date(card.get('posted_date', ''))
+                page_jobs.append((external_id, posted_date))
+                
+                fingerprint = self.known_jobs.fingerprint(card)
+                status = self.known_jobs.classify(board_name, external_id, fingerprint)
+                
+                # A new or changed job is only recorded once its detail page has been scraped
+                if self.config.enqueue_changed_details and status != KnownJobsStore.UNCHANGED:
+                    detail_urls.append(url)
+                    detail_user_data[url] = {'known_job': {'external_id': external_id, 'fingerprint': fingerprint}}
+                    continue
+                
+                job_data = JobData(
+                    title=card['title'],
+                    company=card.get('company') or "",
+                    location=card.get('location') or None,
+                    source=board_name,
+                    source_url=url,
+                    external_id=external_id,
+                    posted_date=posted_date,
+                    quality_score=self._calculate_quality_score(card['title'], card.get('company') or "", "")
+                )
+                partial_jobs.append(job_data.dict())
+                known_jobs.append((external_id, fingerprint))
+                
+            except Exception as e:
+                logger.error(f"Error building job from {board_name} listing card: {e}")
+                continue
+        
+        if partial_jobs:
+            normalized_jobs = await self._normalize_jobs(board_name, partial_jobs)
+            await self._push_jobs(context, board_name, normalized_jobs)
+            for external_id, fingerprint in known_jobs:
+                self.known_jobs.record(board_name, external_id, fingerprint)
+            self.listing_stats['partial_jobs_pushed'] += len(normalized_jobs)
+            self.metrics.jobs_extracted.labels(board=board_name, method='listing_cards').inc(len(partial_jobs))
+        
+        if detail_urls:
+            await self._enqueue_job_details(context, board_name, detail_urls, detail_label, detail_user_data)
+            self.listing_stats['detail_pages_enqueued'] += len(detail_urls)
+    
+        return page_jobs
+    
+    def _should_paginate(self, context: PlaywrightCrawlingContext, board_name: str,
+                         page_jobs: List[Tuple[str, Optional[datetime]]]) -> bool:
+        """
+        Decide whether to follow a listing page's "Next" link
+        
+        Paging stops at the search's max_pages (the board's, unless the search was
+        demoted) and, with incremental_pagination, as soon as a page shows the
+        search has caught up with the previous run's high-water mark, so scheduled
+        runs load roughly as many pages as there are new postings.
+        """
+        page = context.request.user_data.get('page', 1)
+        search_key = context.request.user_data.get('search_key') or context.request.url
+        max_pages = self._max_pages(context, board_name)
+        
+        self.pagination_stats['listing_pages'] += 1
+        self._record_search_page(context, board_name, page_jobs)
+        caught_up = self.search_watermarks.observe_page(
+            board_name, search_key, page, page_jobs, self.search_planner.date_sorted(board_name)
+        )
+        
+        # Pages enqueued up front by page 1 never enqueue further pages themselves
+        if context.request.user_data.get('fanned_out'):
+            return False
+        
+        if page >= max_pages:
+            self.pagination_stats['stopped_at_max_pages'] += 1
+            return False
+        
+        if self.config.incremental_pagination and caught_up:
+            logger.info(f"{board_name} search caught up with the previous run on page {page}, not paginating further")
+            self.pagination_stats['stopped_caught_up'] += 1
+            self.pagination_stats['pages_saved'] += max_pages - page
+            return False
+        
+        return True
+    
+    def _max_pages(self, context: PlaywrightCrawlingContext, board_name: str) -> int:
+        """Listing pages the current search may fetch"""
+        return context.request.user_data.get('max_pages') or self.config.job_boards.get(board_name, {}).get('max_pages', 1)
+    
+    def _record_search_page(self, context: PlaywrightCrawlingContext, board_name: str,
+                            page_jobs: List[Tuple[str, Optional[datetime]]]):
+        """Add a listing page's new jobs to its search's cross-run yield and, in a budgeted crawl, to its yield rate"""
+        search_key = context.request.user_data.get('search_key') or context.request.url
+        new_jobs = self.search_watermarks.count_new(board_name, search_key, page_jobs)
+        self.search_yields.observe_page(board_name, search_key, [external_id for external_id, _ in page_jobs], new_jobs)
+        
+        if self.crawl_budget:
+            navigation_started = self._navigation_started.get(context.request.unique_key)
+            self.crawl_budget.record_listing(
+                board_name, search_key, new_jobs,
+                context.request.user_data.get('detail_pages_enqueued', 0),
+                time.perf_counter() - navigation_started if navigation_started is not None else 0.0,
+            )
+    
+    def _next_page_request(self, context: PlaywrightCrawlingContext, url: str, page: Optional[int] = None,
+                           fanned_out: bool = False) -> Request:
+        """Listing request for a later page of the current search (by default the next one)"""
+        search_id = context.request.user_data.get('search_id')
+        return Request.from_url(
+            url,
+            label=context.request.label,
+            unique_key=f"{url}#search={search_id}" if search_id else None,
+            user_data={
+                'search': context.request.user_data.get('search'),
+                'priority': context.request.user_data.get('priority'),
+                'search_key': context.request.user_data.get('search_key') or context.request.url,
+                'page': page or context.request.user_data.get('page', 1) + 1,
+                'max_pages': context.request.user_data.get('max_pages'),
+                'fanned_out': fanned_out,
+                'search_id': search_id,
+            }
+        )
+    
+    async def _enqueue_synthesized_pages(self, context: PlaywrightCrawlingContext, board_name: str) -> bool:
+        """
+        Enqueue later listing pages by URL when the board's pagination is URL-addressable
+        
+        A search seen for the first time (or any search without incremental_pagination)
+        fans out from page 1 to every page up to max_pages, so they are crawled in
+        parallel. A search with a high-water mark gets one page at a time, so it can
+        still stop as soon as it catches up.
+        
+        Returns:
+            False if the board needs click navigation instead
+        """
+        page = context.request.user_data.get('page', 1)
+        search_key = context.request.user_data.get('search_key') or context.request.url
+        if self.search_planner.page_url(board_name, search_key, page + 1) is None:
+            return False
+        
+        fan_out = page == 1 and (
+            not self.config.incremental_pagination or self.search_watermarks.get(board_name, search_key) is None
+        )
+        last_page = self._max_pages(context, board_name) if fan_out else page + 1
+        
+        requests = [
+            self._next_page_request(
+                context, self.search_planner.page_url(board_name, search_key, number), number, fanned_out=fan_out
+            )
+            for number in range(page + 1, last_page + 1)
+        ]
+        await self._enqueue_listing_pages(context, board_name, requests)
+        self.pagination_stats['pages_synthesized'] += len(requests)
+        return True
+    
+    async def _enqueue_listing_pages(self, context: PlaywrightCrawlingContext, board_name: str,
+                                     requests: List[Request]):
+        """Enqueue later listing pages of the current search, scheduled by yield when the crawl is budgeted"""
+        forefront = False
+        if self.crawl_budget:
+            search_key = context.request.user_data.get('search_key') or context.request.url
+            requests, forefront = self.crawl_budget.admit(board_name, search_key, requests)
+        if requests:
+            await self._add_requests(context, requests, forefront=forefront)
     
     async def _handle_linkedin_jobs(self, context: PlaywrightCrawlingContext):
         """Handle LinkedIn job listing pages"""
         try:
             logger.info(f"Processing LinkedIn jobs page: {context.request.url}")
             
-            # Wait for job listings to load
-            await context.page.wait_for_selector('.jobs-search__results-list', timeout=10000)
+            # Wait for job listings to load, stopping early on an empty search
+            if await self._wait_for_page(context, 'listing') == WaitPolicyEngine.NO_RESULTS:
+                logger.info(f"No LinkedIn jobs on {context.request.url}")
+                self._record_search_page(context, 'linkedin', [])
+                return
             
-            # Extract job listing URLs
-            job_links = await context.page.locator('.jobs-search__results-list li .base-card__full-link').all()
-            
-            for link in job_links[:self.config.max_jobs_per_page]:
-                href = await link.get_attribute('href')
-                if href:
-                    full_url = urljoin(context.request.url, href)
-                    await context.add_requests([{
-                        'url': full_url,
-                        'label': 'linkedin_job_detail'
-                    }])
+            if self.config.listing_only_mode:
+                page_jobs = await self._process_listing_cards(context, 'linkedin', 'linkedin_job_detail')
+            else:
+                # Extract job listing URLs
+                job_links = await context.page.locator('.jobs-search__results-list li .base-card__full-link').all()
+                
+                detail_urls = []
+                for link in job_links[:self.config.max_jobs_per_page]:
+                    href = await link.get_attribute('href')
+                    if href:
+                        detail_urls.append(urljoin(context.request.url, href))
+                
+                await self._enqueue_job_details(context, 'linkedin', detail_urls, 'linkedin_job_detail')
+                page_jobs = [(self._extract_job_id('linkedin', url) or url, None) for url in detail_urls]
             
             # Look for pagination
+            if not self._should_paginate(context, 'linkedin', page_jobs):
+                return
+            if await self._enqueue_synthesized_pages(context, 'linkedin'):
+                return
+            
             next_button = context.page.locator('[aria-label="Next"]')
             if await next_button.count() > 0 and await next_button.is_enabled():
                 next_url = await next_button.get_attribute('href')
                 if next_url:
-                    await context.add_requests([{
-                        'url': urljoin(context.request.url, next_url),
-                        'label': 'linkedin_jobs'
-                    }])
+                    await self._enqueue_listing_pages(context, 'linkedin', [
+                        self._next_page_request(context, urljoin(context.request.url, next_url))
+                    ])
                     
         except Exception as e:
             logger.error(f"Error processing LinkedIn jobs page: {e}")
+            self.metrics.record_error(context.request.label or 'default')
     
-    async def _handle_linkedin_job_detail(self, context: PlaywrightCrawlingContext):
-        """Handle LinkedIn job detail pages"""
+    async def _push_structured_job(self, context: PlaywrightCrawlingContext, board_name: str) -> bool:
+        """
+        Build the job from the page's JSON-LD JobPosting and push it
+        
+        Returns:
+            True if a usable JobPosting was found and pushed, False to fall back to selectors
+        """
         try:
-            logger.info(f"Processing LinkedIn job detail: {context.request.url}")
+            with self.metrics.time(self.metrics.extraction_seconds, board=board_name, method='structured_data'):
+                posting = find_job_posting(await extract_json_ld(context.page))
+            if not posting:
+                return False
+            
+            fields = job_posting_to_job_data(posting)
+            if not fields.get('title') or not fields.get('company'):
+                return False
+            
+            fields.setdefault('external_id', self._extract_job_id(board_name, context.request.url))
+            fields.setdefault('posted_date', datetime.now())
             
-            # Wait for job details to load
-            await context.page.wait_for_selector('.top-card-layout__entity-info', timeout=10000)
-            
-            # Extract job data
-            title_elem = context.page.locator('.top-card-layout__title')
-            company_elem = context.page.locator('.topcard__flavor a')
-            location_elem = context.page.locator('.topcard__flavor--bullet')
-            description_elem = context.page.locator('.show-more-less-html__markup')
-            
-            title = await title_elem.text_content() if await title_elem.count() > 0 else ""
-            company = await company_elem.text_content() if await company_elem.count() > 0 else ""
-            location = await location_elem.text_content() if await location_elem.count() > 0 else ""
-            description = await description_elem.text_content() if await description_elem.count() > 0 else ""
-            
-            # Clean and normalize data
-            title = re.sub(r'\s+', ' ', title.strip())
-            company = re.sub(r'\s+', ' ', company.strip())
-            location = re.sub(r'\s+', ' ', location.strip())
-            description = re.sub(r'\s+', ' ', description.strip())
-            
-            # Extract additional details
             job_data = JobData(
-                title=title,
-                company=company,
-                location=location,
-                description=description,
-                source="linkedin",
+                **fields,
+                source=board_name,
                 source_url=context.request.url,
-                external_id=self._extract_linkedin_job_id(context.request.url),
-                posted_date=datetime.now(),
-                quality_score=self._calculate_quality_score(title, company, description)
+                quality_score=self._calculate_quality_score(
+                    fields['title'], fields['company'], fields.get('description', '')
+                )
             )
             
-            # Normalize and enrich data
-            normalized_data = await self.job_normalizer.normalize_job_data(job_data.dict())
+            normalized_data = await self._normalize_jobs(board_name, job_data.dict())
+            await self._push_jobs(context, board_name, normalized_data)
+            self.extraction_stats['structured_data'] += 1
+            self.metrics.jobs_extracted.labels(board=board_name, method='structured_data').inc()
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error extracting structured data from {context.request.url}: {e}")
+            return False
+    
+    async def _push_selector_job(self, context: PlaywrightCrawlingContext, board_name: str):
+        """Extract the board's compiled detail fields in one page call, then normalize and push the job"""
+        with self.metrics.time(self.metrics.extraction_seconds, board=board_name, method='selectors'):
+            fields = await self.selector_engine.extract_playwright(context.page, board_name)
+        
+        title = fields.get('title', '')
+        company = fields.get('company', '')
+        location = fields.get('location', '')
+        description = fields.get('description', '')
+        
+        job_data = JobData(
+            title=title,
+            company=company,
+            location=location,
+            description=description,
+            source=board_name,
+            source_url=context.request.url,
+            external_id=self._extract_job_id(board_name, context.request.url),
+            posted_date=datetime.now(),
+            quality_score=self._calculate_quality_score(title, company, description)
+        )
+        self.extraction_stats['selectors'] += 1
+        self.metrics.jobs_extracted.labels(board=board_name, method='selectors').inc()
+        
+        # Normalize and save
+        normalized_data = await self._normalize_jobs(board_name, job_data.dict())
+        await self._push_jobs(context, board_name, normalized_data)
+    
+    async def _handle_linkedin_job_detail(self, context: PlaywrightCrawlingContext):
+        """Handle LinkedIn job detail pages"""
+        try:
+            logger.info(f"Processing LinkedIn job detail: {context.request.url}")
+            
+            # Structured data is in the initial HTML, so no selector waits are needed
+            if await self._push_structured_job(context, 'linkedin'):
+                return
             
-            # Save to dataset
-            await context.push_data(normalized_data)
+            # Wait for job details to load
+            await self._wait_for_page(context, 'detail')
+            
+            await self._push_selector_job(context, 'linkedin')
             
         except Exception as e:
             logger.error(f"Error processing LinkedIn job detail: {e}")
+            self.metrics.record_error(context.request.label or 'default')
     
     async def _handle_indeed_jobs(self, context: PlaywrightCrawlingContext):
         """Handle Indeed job listing pages"""
         try:
             logger.info(f"Processing Indeed jobs page: {context.request.url}")
             
-            # Wait for job listings to load
-            await context.page.wait_for_selector('[data-jk]', timeout=10000)
-            
-            # Extract job listing URLs
-            job_cards = await context.page.locator('[data-jk]').all()
+            # Wait for job listings to load, stopping early on an empty search
+            if await self._wait_for_page(context, 'listing') == WaitPolicyEngine.NO_RESULTS:
+                logger.info(f"No Indeed jobs on {context.request.url}")
+                self._record_search_page(context, 'indeed', [])
+                return
             
-            for card in job_cards[:self.config.max_jobs_per_page]:
-                job_id = await card.get_attribute('data-jk')
-                if job_id:
-                    job_url = f"https://www.indeed.com/viewjob?jk={job_id}"
-                    await context.add_requests([{
-                        'url': job_url,
-                        'label': 'indeed_job_detail'
-                    }])
+            if self.config.listing_only_mode:
+                page_jobs = await self._process_listing_cards(context, 'indeed', 'indeed_job_detail')
+            else:
+                # Extract job listing URLs
+                job_cards = await context.page.locator('[data-jk]').all()
+                
+                detail_urls = []
+                for card in job_cards[:self.config.max_jobs_per_page]:
+                    job_id = await card.get_attribute('data-jk')
+                    if job_id:
+                        detail_urls.append(f"https://www.indeed.com/viewjob?jk={job_id}")
+                
+                await self._enqueue_job_details(context, 'indeed', detail_urls, 'indeed_job_detail')
+                page_jobs = [(self._extract_job_id('indeed', url) or url, None) for url in detail_urls]
             
             # Look for pagination
+            if not self._should_paginate(context, 'indeed', page_jobs):
+                return
+            if await self._enqueue_synthesized_pages(context, 'indeed'):
+                return
+            
+            # Fall back to clicking through when the board exposes no offset parameter
             next_button = context.page.locator('[aria-label="Next Page"]')
             if await next_button.count() > 0:
+                self.pagination_stats['pages_clicked'] += 1
+                previous_url = context.page.url
                 await next_button.click()
-                await context.page.wait_for_load_state('networkidle')
-                current_url = context.page.url
-                await context.add_requests([{
-                    'url': current_url,
-                    'label': 'indeed_jobs'
-                }])
+                await self._wait_for_page(context, 'pagination', previous_url)
+                await self._enqueue_listing_pages(context, 'indeed', [self._next_page_request(context, context.page.url)])
                     
         except Exception as e:
             logger.error(f"Error processing Indeed jobs page: {e}")
+            self.metrics.record_error(context.request.label or 'default')
     
     async def _handle_indeed_job_detail(self, context: PlaywrightCrawlingContext):
         """Handle Indeed job detail pages"""
         try:
             logger.info(f"Processing Indeed job detail: {context.request.url}")
             
-            # Wait for job details to load
-            await context.page.wait_for_selector('[data-testid="jobsearch-JobInfoHeader-title"]', timeout=10000)
-            
-            # Extract job data
-            title_elem = context.page.locator('[data-testid="jobsearch-JobInfoHeader-title"]')
-            company_elem = context.page.locator('[data-testid="inlineHeader-companyName"]')
-            location_elem = context.page.locator('[data-testid="job-location"]')
-            description_elem = context.page.locator('#jobDescriptionText')
-            
-            title = await title_elem.text_content() if await title_elem.count() > 0 else ""
-            company = await company_elem.text_content() if await company_elem.count() > 0 else ""
-            location = await location_elem.text_content() if await location_elem.count() > 0 else ""
-            description = await description_elem.text_content() if await description_elem.count() > 0 else ""
-            
-            # Clean data
-            title = re.sub(r'\s+', ' ', title.strip())
-            company = re.sub(r'\s+', ' ', company.strip())
-            location = re.sub(r'\s+', ' ', location.strip())
-            description = re.sub(r'\s+', ' ', description.strip())
+            # Structured data is in the initial HTML, so no selector waits are needed
+            if await self._push_structured_job(context, 'indeed'):
+                return
             
-            job_data = JobData(
-                title=title,
-                company=company,
-                location=location,
-                description=description,
-                source="indeed",
-                source_url=context.request.url,
-                external_id=self._extract_indeed_job_id(context.request.url),
-                posted_date=datetime.now(),
-                quality_score=self._calculate_quality_score(title, company, description)
-            )
+            # Wait for job details to load
+            await self._wait_for_page(context, 'detail')
             
-            # Normalize and save
-            normalized_data = await self.job_normalizer.normalize_job_data(job_data.dict())
-            await context.push_data(normalized_data)
+            await self._push_selector_job(context, 'indeed')
             
         except Exception as e:
             logger.error(f"Error processing Indeed job detail: {e}")
+            self.metrics.record_error(context.request.label or 'default')
     
     async def _handle_glassdoor_jobs(self, context: PlaywrightCrawlingContext):
         """Handle Glassdoor job listing pages"""
         try:
             logger.info(f"Processing Glassdoor jobs page: {context.request.url}")
             
-            # Wait for job listings to load
-            await context.page.wait_for_selector('[data-test="job-link"]', timeout=10000)
-            
-            # Extract job listing URLs
-            job_links = await context.page.locator('[data-test="job-link"]').all()
+            # Wait for job listings to load, stopping early on an empty search
+            if await self._wait_for_page(context, 'listing') == WaitPolicyEngine.NO_RESULTS:
+                logger.info(f"No Glassdoor jobs on {context.request.url}")
+                self._record_search_page(context, 'glassdoor', [])
+                return
             
-            for link in job_links[:self.config.max_jobs_per_page]:
-                href = await link.get_attribute('href')
-                if href:
-                    full_url = urljoin("https://www.glassdoor.com", href)
-                    await context.add_requests([{
-                        'url': full_url,
-                        'label': 'glassdoor_job_detail'
-                    }])
+            if self.config.listing_only_mode:
+                page_jobs = await self._process_listing_cards(context, 'glassdoor', 'glassdoor_job_detail')
+            else:
+                # Extract job listing URLs
+                job_links = await context.page.locator('[data-test="job-link"]').all()
+                
+                detail_urls = []
+                for link in job_links[:self.config.max_jobs_per_page]:
+                    href = await link.get_attribute('href')
+                    if href:
+                        detail_urls.append(urljoin("https://www.glassdoor.com", href))
+                
+                await self._enqueue_job_details(context, 'glassdoor', detail_urls, 'glassdoor_job_detail')
+                page_jobs = [(self._extract_job_id('glassdoor', url) or url, None) for url in detail_urls]
             
             # Look for pagination
+            if not self._should_paginate(context, 'glassdoor', page_jobs):
+                return
+            if await self._enqueue_synthesized_pages(context, 'glassdoor'):
+                return
+            
+            # Fall back to clicking through when the board exposes no offset parameter
             next_button = context.page.locator('[data-test="pagination-next"]')
             if await next_button.count() > 0 and await next_button.is_enabled():
+                self.pagination_stats['pages_clicked'] += 1
+                previous_url = context.page.url
                 await next_button.click()
-                await context.page.wait_for_load_state('networkidle')
-                current_url = context.page.url
-                await context.add_requests([{
-                    'url': current_url,
-                    'label': 'glassdoor_jobs'
-                }])
+                await self._wait_for_page(context, 'pagination', previous_url)
+                await self._enqueue_listing_pages(context, 'glassdoor', [self._next_page_request(context, context.page.url)])
                     
         except Exception as e:
             logger.error(f"Error processing Glassdoor jobs page: {e}")
+            self.metrics.record_error(context.request.label or 'default')
     
     async def _handle_glassdoor_job_detail(self, context: PlaywrightCrawlingContext):
         """Handle Glassdoor job detail pages"""
         try:
             logger.info(f"Processing Glassdoor job detail: {context.request.url}")
             
-            # Wait for job details to load
-            await context.page.wait_for_selector('[data-test="job-title"]', timeout=10000)
-            
-            # Extract job data
-            title_elem = context.page.locator('[data-test="job-title"]')
-            company_elem = context.page.locator('[data-test="employer-name"]')
-            location_elem = context.page.locator('[data-test="job-location"]')
-            description_elem = context.page.locator('[data-test="jobDescriptionContent"]')
-            
-            title = await title_elem.text_content() if await title_elem.count() > 0 else ""
-            company = await company_elem.text_content() if await company_elem.count() > 0 else ""
-            location = await location_elem.text_content() if await location_elem.count() > 0 else ""
-            description = await description_elem.text_content() if await description_elem.count() > 0 else ""
-            
-            # Clean data
-            title = re.sub(r'\s+', ' ', title.strip())
-            company = re.sub(r'\s+', ' ', company.strip())
-            location = re.sub(r'\s+', ' ', location.strip())
-            description = re.sub(r'\s+', ' ', description.strip())
+            # Structured data is in the initial HTML, so no selector waits are needed
+            if await self._push_structured_job(context, 'glassdoor'):
+                return
             
-            job_data = JobData(
-                title=title,
-                company=company,
-                location=location,
-                description=description,
-                source="glassdoor",
-                source_url=context.request.url,
-                external_id=self._extract_glassdoor_job_id(context.request.url),
-                posted_date=datetime.now(),
-                quality_score=self._calculate_quality_score(title, company, description)
-            )
+            # Wait for job details to load
+            await self._wait_for_page(context, 'detail')
             
-            # Normalize and save
-            normalized_data = await self.job_normalizer.normalize_job_data(job_data.dict())
-            await context.push_data(normalized_data)
+            await self._push_selector_job(context, 'glassdoor')
             
         except Exception as e:
             logger.error(f"Error processing Glassdoor job detail: {e}")
+            self.metrics.record_error(context.request.label or 'default')
     
     async def _handle_generic_job_page(self, context: PlaywrightCrawlingContext):
         """Handle generic job pages from unknown sources"""
         try:
             logger.info(f"Processing generic job page: {context.request.url}")
             
-            # Try to extract job data using common selectors
-            page_text = await context.page.text_content('body')
+            board_name = self._board_for_request(context.request)
             
-            # Use basic heuristics to extract job information
-            job_data = await self._extract_generic_job_data(context.request.url, page_text)
+            with self.metrics.time(self.metrics.extraction_seconds, board=board_name or 'generic', method='generic'):
+                # Title, company and main content are picked in the page, so only they cross CDP
+                fields = await extract_generic_job(context.page, self.config.generic_description_length)
+                job_data = self._generic_job_from_fields(context.request.url, fields)
             
             if job_data:
-                normalized_data = await self.job_normalizer.normalize_job_data(job_data.dict())
-                await context.push_data(normalized_data)
+                self.metrics.jobs_extracted.labels(board=board_name or 'generic', method='generic').inc()
+                normalized_data = await self._normalize_jobs(board_name, job_data.dict())
+                await self._push_jobs(context, board_name, normalized_data)
             
         except Exception as e:
             logger.error(f"Error processing generic job page: {e}")
+            self.metrics.record_error(context.request.label or 'default')
     
-    async def _extract_generic_job_data(self, url: str, page_text: str) -> Optional[JobData]:
-        """Extract job data from generic pages using heuristics"""
+    def _generic_job_from_fields(self, url: str, fields: Dict[str, Any]) -> Optional[JobData]:
+        """Build a job from the fields picked on a generic page, naming the company after the domain if none was found"""
         try:
-            # This is a simplified implementation
-            # In practice, you'd use more sophisticated NLP techniques
-            
-            lines = page_text.split('\n')
-            title = ""
-            company = ""
-            
-            # Look for job title patterns
-            for line in lines[:20]:  # Check first 20 lines
-                line = line.strip()
-                if len(line) > 10 and any(keyword in line.lower() for keyword in ['developer', 'engineer', 'manager', 'analyst', 'specialist']):
-                    title = line
-                    break
+            title = fields.get('title')
+            if not title:
+                return None
             
-            # Look for company name patterns
             domain = urlparse(url).netloc
-            company = domain.replace('www.', '').replace('.com', '').replace('.org', '').title()
-            
-            if title and company:
-                return JobData(
-                    title=title,
-                    company=company,
-                    description=page_text[:1000],  # First 1000 chars
-                    source="generic",
-                    source_url=url,
-                    posted_date=datetime.now(),
-                    quality_score=0.3  # Lower quality for generic extraction
-                )
+            company = fields.get('company') or domain.replace('www.', '').replace('.com', '').replace('.org', '').title()
             
-            return None
+            return JobData(
+                title=title,
+                company=company,
+                description=fields.get('description') or None,
+                source="generic",
+                source_url=url,
+                posted_date=datetime.now(),
+                quality_score=0.3  # Lower quality for generic extraction
+            )
             
         except Exception as e:
-            logger.error(f"Error extracting generic job data: {e}")
+            logger.error(f"Error building generic job data: {e}")
             return None
     
+    def _extract_job_id(self, board_name: str, url: str) -> Optional[str]:
+        """Extract job ID from a URL of any supported board"""
+        extractors = {
+            'linkedin': self._extract_linkedin_job_id,
+            'indeed': self._extract_indeed_job_id,
+            'glassdoor': self._extract_glassdoor_job_id,
+        }
+        extractor = extractors.get(board_name)
+        return extractor(url) if extractor else None
+    
     def _extract_linkedin_job_id(self, url: str) -> Optional[str]:
         """Extract job ID from LinkedIn URL"""
         match = re.search(r'/jobs/view/(\d+)', url)
@@ -534,10 +1632,15 @@ class CrawleeJobScraper:
     async def close(self):
         """Clean up resources"""
         try:
+            await self.tiered_fetcher.close()
             await self.crawler.teardown()
             await self.database_service.close()
         except Exception as e:
             logger.error(f"Error closing scraper: {e}")
+        
+        if self._crawl_state_dir is not None:
+            self._crawl_state_dir.cleanup()
+            self._crawl_state_dir = None
 
 
 # Example usage
@@ -555,6 +1658,15 @@ async def main():
     scraper = CrawleeJobScraper(config)
     
     try:
+        # Scrape all enabled boards in one crawl
+        results = await scraper.scrape_all_boards({
+            'keywords': 'python developer',
+            'location': 'San Francisco'
+        })
+        
+        for board_name, result in results.items():
+            print(f"Scraped {len(result['jobs'])} jobs from {board_name} in {result['stats']['duration_seconds']}s")
+        
         # Scrape LinkedIn jobs
         linkedin_jobs = await scraper.scrape_job_board('linkedin', {
             'keywords': 'python developer',
@@ -0,0 +1,184 @@
+"""
+Long-lived crawler service: one kept-alive crawl whose browsers and request
+queue stay up while searches are submitted into its frontier on demand
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Any
+
+import uvicorn
+from fastapi import FastAPI, HTTPException
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from ..config.scraper_config import ScraperConfig, get_enabled_job_boards, scraper_config
+from ..utils.search_handles import SearchHandle, SearchTracker
+from .crawlee_job_scraper import CrawleeJobScraper, JobData
+
+
+class CrawlerService:
+    """
+    Runs a CrawleeJobScraper with ``keep_alive`` so it keeps waiting for
+    requests when its queue drains, and merges each submitted search into the
+    running frontier instead of starting and tearing down a crawler per search.
+    
+    Every submitted search gets a SearchHandle that finishes once all requests
+    descended from its search pages are handled. Detail pages already scraped
+    by an earlier search of the same service are not fetched again; their
+    jobs are attached to every later search whose listing pages reference them.
+    A stopped service can be started again and resumes the requests it left,
+    but searches still running when its crawl ends are failed with the jobs
+    they have so far.
+    """
+    
+    def __init__(self, config: Optional[ScraperConfig] = None, scraper: Optional[CrawleeJobScraper] = None):
+        self.config = config or scraper_config
+        self.scraper = scraper or CrawleeJobScraper(self.config, keep_alive=True)
+        self.tracker = SearchTracker()
+        self.scraper.search_tracker = self.tracker
+        self._crawl_task: Optional[asyncio.Task] = None
+    
+    @property
+    def running(self) -> bool:
+        return self._crawl_task is not None and not self._crawl_task.done()
+    
+    async def start(self):
+        """Start the kept-alive crawl in the background"""
+        if self.running:
+            return
+        
+        self._crawl_task = asyncio.create_task(self._run())
+        logger.info("Crawler service started")
+    
+    async def _run(self):
+        try:
+            await self.scraper.serve()
+        except Exception as e:
+            logger.error(f"Crawler service crawl stopped with an error: {e}")
+            self.tracker.fail_outstanding(f"Crawl stopped with an error: {e}")
+        finally:
+            self.tracker.fail_outstanding('Crawl ended')
+    
+    async def stop(self):
+        """Let in-flight requests finish, stop the crawl and commit crawl-wide state"""
+        if not self.running:
+            return
+        
+        self.scraper.stop_crawl('Crawler service stopped')
+        await self._crawl_task
+        self._crawl_task = None
+        self.tracker.fail_outstanding('Crawler service stopped')
+        logger.info(f"Crawler service stopped: {self.get_stats()}")
+    
+    async def submit(self, search_params: Dict[str, Any], boards: Optional[List[str]] = None) -> SearchHandle:
+        """
+        Plan a search and enqueue its search pages into the running crawl
+        
+        Args:
+            search_params: Search parameters shared by all boards, or a mapping of board
+                name to that board's search parameters (values may be lists, as in scrape_all_boards)
+            boards: Boards to search (defaults to the enabled job boards)
+        
+        Returns:
+            Handle to wait on and read the search's jobs from
+        """
+        if not self.running:
+            await self.start()
+        
+        boards = boards or get_enabled_job_boards(self.config)
+        board_params = {
+            board_name: search_params[board_name] if isinstance(search_params.get(board_name), dict) else search_params
+            for board_name in boards
+        }
+        
+        handle = self.tracker.open(board_params)
+        search_pages = await self.scraper.submit_searches(board_params, handle.search_id)
+        self.tracker.finish_empty(handle)
+        
+        logger.info(f"Submitted search {handle.search_id} with {search_pages} search pages: {board_params}")
+        return handle
+    
+    def get(self, search_id: str) -> Optional[SearchHandle]:
+        """Get the handle of a submitted search"""
+        return self.tracker.get(search_id)
+    
+    async def results(self, search_id: str, timeout: Optional[float] = None) -> List[JobData]:
+        """
+        Wait for a submitted search to finish and return its jobs
+        
+        Raises:
+            KeyError: if no search has this id
+            asyncio.TimeoutError: if the search is still running after timeout seconds
+        """
+        handle = self.get(search_id)
+        if handle is None:
+            raise KeyError(search_id)
+        
+        jobs = []
+        for item in await handle.wait(timeout):
+            try:
+                jobs.append(JobData(**item))
+            except Exception as e:
+                logger.error(f"Error parsing job data of search {search_id}: {e}")
+        return jobs
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get search counters and whether the crawl is running"""
+        return {'running': self.running, **self.tracker.get_stats()}
+
+
+class SearchRequest(BaseModel):
+    """Body of POST /searches"""
+    search_params: Dict[str, Any] = Field(..., description="Search parameters, shared or per board")
+    boards: Optional[List[str]] = Field(default=None, description="Boards to search (defaults to the enabled boards)")
+
+
+def create_app(service: Optional[CrawlerService] = None) -> FastAPI:
+    """FastAPI app that submits searches to a crawler service started and stopped with the app"""
+    service = service or CrawlerService()
+    
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        await service.start()
+        yield
+        await service.stop()
+    
+    app = FastAPI(title="Web scraping crawler service", lifespan=lifespan)
+    app.state.crawler_service = service
+    
+    def get_handle(search_id: str) -> SearchHandle:
+        handle = service.get(search_id)
+        if handle is None:
+            raise HTTPException(status_code=404, detail=f"Unknown search {search_id}")
+        return handle
+    
+    @app.post("/searches", status_code=202)
+    async def submit_search(body: SearchRequest) -> Dict[str, Any]:
+        handle = await service.submit(body.search_params, body.boards)
+        return handle.to_dict()
+    
+    @app.get("/searches/{search_id}")
+    async def get_search(search_id: str, include_jobs: bool = False) -> Dict[str, Any]:
+        return get_handle(search_id).to_dict(include_jobs=include_jobs)
+    
+    @app.get("/searches/{search_id}/jobs")
+    async def get_search_jobs(search_id: str, wait: float = 0.0) -> Dict[str, Any]:
+        """Jobs of a search, optionally waiting up to ``wait`` seconds for it to finish"""
+        handle = get_handle(search_id)
+        if wait > 0 and not handle.done:
+            try:
+                await handle.wait(wait)
+            except asyncio.TimeoutError:
+                pass
+        return {'search_id': search_id, 'status': handle.status, 'jobs': handle.jobs}
+    
+    @app.get("/stats")
+    async def get_stats() -> Dict[str, Any]:
+        return service.get_stats()
+    
+    return app
+
+
+if __name__ == "__main__":
+    uvicorn.run(create_app(), host=scraper_config.service_host, port=scraper_config.service_port)
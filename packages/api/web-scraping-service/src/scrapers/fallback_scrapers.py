@@ -5,9 +5,8 @@ Used when Crawlee fails or for specific use cases
 
 import asyncio
 import time
-import random
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from urllib.parse import urljoin, urlparse
 from dataclasses import dataclass
 
@@ -25,8 +24,12 @@ from scrapy.utils.project import get_project_settings
 
 from loguru import logger
 
-from ..config.scraper_config import FallbackScraperConfig
+from ..config.scraper_config import FallbackScraperConfig, scraper_config
 from ..utils.job_normalizer import JobNormalizer
+from ..utils.structured_data import find_job_posting, job_posting_to_job_data
+from ..utils.rate_limiter import DomainRateLimiter, get_shared_rate_limiter
+from ..utils.response_cache import ResponseCache, get_shared_response_cache
+from ..utils.selector_engine import SelectorEngine, get_shared_selector_engine
 
 
 @dataclass
@@ -39,7 +42,29 @@ class ScrapedJob:
     source: str = ""
     source_url: str = ""
     posted_date: Optional[datetime] = None
+    expires_date: Optional[datetime] = None
     external_id: Optional[str] = None
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    salary_currency: str = "USD"
+    employment_type: Optional[str] = None
+    remote_type: Optional[str] = None
+
+
+def scraped_job_from_fields(fields: Dict[str, str], board_name: Optional[str], url: str) -> Optional[ScrapedJob]:
+    """Build a job from fields read by the selector engine, or None without a title and company"""
+    if not fields.get('title') or not fields.get('company'):
+        return None
+    
+    return ScrapedJob(
+        title=fields['title'],
+        company=fields['company'],
+        location=fields.get('location', ''),
+        description=fields.get('description', ''),
+        source=board_name or 'generic',
+        source_url=url,
+        posted_date=datetime.now()
+    )
 
 
 class BeautifulSoupScraper:
@@ -48,178 +73,105 @@ class BeautifulSoupScraper:
     Good for simple HTML pages without heavy JavaScript
     """
     
-    def __init__(self, config: FallbackScraperConfig):
+    def __init__(self, config: FallbackScraperConfig, rate_limiter: Optional[DomainRateLimiter] = None,
+                 response_cache: Optional[ResponseCache] = None, selector_engine: Optional[SelectorEngine] = None):
         self.config = config
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
+        self.response_cache = response_cache or get_shared_response_cache()
+        self.selector_engine = selector_engine or get_shared_selector_engine()
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
         
     async def scrape_jobs(self, urls: List[str]) -> List[ScrapedJob]:
-        """Scrape jobs from a list of URLs"""
-        jobs = []
+        """Scrape jobs from a list of URLs, fetching different domains in parallel"""
+        semaphore = asyncio.Semaphore(max(self.config.requests_concurrency, 1))
         
-        for url in urls:
-            try:
-                logger.info(f"Scraping with BeautifulSoup: {url}")
-                
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, self.config.beautifulsoup_parser)
-                
-                # Determine the job board and use appropriate selectors
-                domain = urlparse(url).netloc.lower()
-                
-                if 'indeed' in domain:
-                    job_data = self._scrape_indeed_job(soup, url)
-                elif 'glassdoor' in domain:
-                    job_data = self._scrape_glassdoor_job(soup, url)
-                elif 'dice' in domain:
-                    job_data = self._scrape_dice_job(soup, url)
-                else:
-                    job_data = self._scrape_generic_job(soup, url)
-                
-                if job_data:
-                    jobs.append(job_data)
-                
-                # Rate limiting
-                await asyncio.sleep(random.uniform(1, 3))
-                
-            except Exception as e:
-                logger.error(f"Error scraping {url} with BeautifulSoup: {e}")
-                continue
+        async def scrape_with_limit(url: str) -> Optional[ScrapedJob]:
+            async with semaphore:
+                return await self._scrape_url(url)
         
-        return jobs
+        results = await asyncio.gather(*(scrape_with_limit(url) for url in urls))
+        return [job for job in results if job]
     
-    def _scrape_indeed_job(self, soup: BeautifulSoup, url: str) -> Optional[ScrapedJob]:
-        """Scrape Indeed job page"""
+    async def _scrape_url(self, url: str) -> Optional[ScrapedJob]:
+        """Fetch and parse a single job page, paced by the shared per-domain rate limiter"""
         try:
-            title_elem = soup.find('h1', {'data-testid': 'jobsearch-JobInfoHeader-title'})
-            company_elem = soup.find('a', {'data-testid': 'inlineHeader-companyName'})
-            location_elem = soup.find('div', {'data-testid': 'job-location'})
-            description_elem = soup.find('div', id='jobDescriptionText')
+            # Determine the job board and use appropriate selectors
+            domain = urlparse(url).netloc.lower()
+            board_name = self.selector_engine.board_for_url(url)
             
-            title = title_elem.get_text(strip=True) if title_elem else ""
-            company = company_elem.get_text(strip=True) if company_elem else ""
-            location = location_elem.get_text(strip=True) if location_elem else ""
-            description = description_elem.get_text(strip=True) if description_elem else ""
+            # Serve fresh pages from the response cache, revalidating stale ones
+            response = self.response_cache.get_fresh(board_name, url)
+            if response is None:
+                await self.rate_limiter.acquire(url)
+                logger.info(f"Scraping with BeautifulSoup: {url}")
             
-            if title and company:
-                return ScrapedJob(
-                    title=title,
-                    company=company,
-                    location=location,
-                    description=description,
-                    source="indeed",
-                    source_url=url,
-                    posted_date=datetime.now()
+                raw = await asyncio.to_thread(
+                    self.session.get, url, timeout=30, headers=self.response_cache.revalidation_headers(url)
+                )
+                self.rate_limiter.record_response(url, raw.status_code, raw.headers.get('Retry-After'))
+                response = self.response_cache.update(
+                    url, raw.status_code, raw.headers, raw.content, store=not raw.history
                 )
-                
-        except Exception as e:
-            logger.error(f"Error scraping Indeed job: {e}")
-        
-        return None
-    
-    def _scrape_glassdoor_job(self, soup: BeautifulSoup, url: str) -> Optional[ScrapedJob]:
-        """Scrape Glassdoor job page"""
-        try:
-            title_elem = soup.find('h1', {'data-test': 'job-title'})
-            company_elem = soup.find('a', {'data-test': 'employer-name'})
-            location_elem = soup.find('span', {'data-test': 'job-location'})
-            description_elem = soup.find('div', {'data-test': 'jobDescriptionContent'})
             
-            title = title_elem.get_text(strip=True) if title_elem else ""
-            company = company_elem.get_text(strip=True) if company_elem else ""
-            location = location_elem.get_text(strip=True) if location_elem else ""
-            description = description_elem.get_text(strip=True) if description_elem else ""
+            response.raise_for_status()
             
-            if title and company:
-                return ScrapedJob(
-                    title=title,
-                    company=company,
-                    location=location,
-                    description=description,
-                    source="glassdoor",
-                    source_url=url,
-                    posted_date=datetime.now()
-                )
-                
-        except Exception as e:
-            logger.error(f"Error scraping Glassdoor job: {e}")
-        
-        return None
-    
-    def _scrape_dice_job(self, soup: BeautifulSoup, url: str) -> Optional[ScrapedJob]:
-        """Scrape Dice job page"""
-        try:
-            title_elem = soup.find('h1', class_='jobTitle')
-            company_elem = soup.find('a', class_='employer')
-            location_elem = soup.find('li', class_='location')
-            description_elem = soup.find('div', class_='jobdescSec')
+            soup = BeautifulSoup(response.content, self.config.beautifulsoup_parser)
             
-            title = title_elem.get_text(strip=True) if title_elem else ""
-            company = company_elem.get_text(strip=True) if company_elem else ""
-            location = location_elem.get_text(strip=True) if location_elem else ""
-            description = description_elem.get_text(strip=True) if description_elem else ""
+            # Prefer embedded JobPosting structured data over selectors
+            job_data = self._scrape_structured_job(soup, url, domain)
+            
+            if not job_data:
+                job_data = scraped_job_from_fields(self.selector_engine.extract_soup(soup, board_name), board_name, url)
+            
+            return job_data
             
-            if title and company:
-                return ScrapedJob(
-                    title=title,
-                    company=company,
-                    location=location,
-                    description=description,
-                    source="dice",
-                    source_url=url,
-                    posted_date=datetime.now()
-                )
-                
         except Exception as e:
-            logger.error(f"Error scraping Dice job: {e}")
+            logger.error(f"Error scraping {url} with BeautifulSoup: {e}")
         
         return None
     
-    def _scrape_generic_job(self, soup: BeautifulSoup, url: str) -> Optional[ScrapedJob]:
-        """Scrape generic job page using common patterns"""
+    def _scrape_structured_job(self, soup: BeautifulSoup, url: str, domain: str) -> Optional[ScrapedJob]:
+        """Scrape job from schema.org JobPosting JSON-LD, if the page embeds one"""
         try:
-            # Try common title selectors
-            title_selectors = ['h1', '.job-title', '.title', '[class*="title"]', '[id*="title"]']
-            title = ""
-            
-            for selector in title_selectors:
-                elem = soup.select_one(selector)
-                if elem and len(elem.get_text(strip=True)) > 5:
-                    title = elem.get_text(strip=True)
-                    break
+            scripts = soup.find_all('script', attrs={'type': 'application/ld+json'})
+            posting = find_job_posting([script.string or script.get_text() for script in scripts])
+            if not posting:
+                return None
             
-            # Try common company selectors
-            company_selectors = ['.company', '.employer', '[class*="company"]', '[class*="employer"]']
-            company = ""
+            fields = job_posting_to_job_data(posting)
+            if not fields.get('title') or not fields.get('company'):
+                return None
             
-            for selector in company_selectors:
-                elem = soup.select_one(selector)
-                if elem and len(elem.get_text(strip=True)) > 2:
-                    company = elem.get_text(strip=True)
-                    break
+            source = next(
+                (board for board in ('linkedin', 'indeed', 'glassdoor', 'dice') if board in domain),
+                'generic'
+            )
             
-            # Get page text as description
-            description = soup.get_text()[:1000]  # First 1000 characters
+            return ScrapedJob(
+                title=fields['title'],
+                company=fields['company'],
+                location=fields.get('location'),
+                description=fields.get('description'),
+                source=source,
+                source_url=url,
+                posted_date=fields.get('posted_date') or datetime.now(),
+                expires_date=fields.get('expires_date'),
+                external_id=fields.get('external_id'),
+                salary_min=fields.get('salary_min'),
+                salary_max=fields.get('salary_max'),
+                salary_currency=fields.get('salary_currency', 'USD'),
+                employment_type=fields.get('employment_type'),
+                remote_type=fields.get('remote_type')
+            )
             
-            if title and company:
-                return ScrapedJob(
-                    title=title,
-                    company=company,
-                    description=description,
-                    source="generic",
-                    source_url=url,
-                    posted_date=datetime.now()
-                )
-                
         except Exception as e:
-            logger.error(f"Error scraping generic job: {e}")
+            logger.error(f"Error scraping structured data from {url}: {e}")
         
         return None
-
+    
 
 class SeleniumScraper:
     """
@@ -227,8 +179,14 @@ class SeleniumScraper:
     Good for JavaScript-heavy pages that require interaction
     """
     
-    def __init__(self, config: FallbackScraperConfig):
+    def __init__(self, config: FallbackScraperConfig, rate_limiter: Optional[DomainRateLimiter] = None,
+                 url_rewriter: Optional[Callable[[str], str]] = None,
+                 selector_engine: Optional[SelectorEngine] = None):
         self.config = config
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
+        self.selector_engine = selector_engine or get_shared_selector_engine()
+        # Maps a job URL to the URL the browser actually loads (e.g. a replay server)
+        self.url_rewriter = url_rewriter
         self.driver = None
         
     def _setup_driver(self):
@@ -255,9 +213,10 @@ class SeleniumScraper:
         try:
             for url in urls:
                 try:
+                    await self.rate_limiter.acquire(url)
                     logger.info(f"Scraping with Selenium: {url}")
                     
-                    self.driver.get(url)
+                    self.driver.get(self.url_rewriter(url) if self.url_rewriter else url)
                     
                     # Wait for page to load
                     WebDriverWait(self.driver, 10).until(
@@ -265,23 +224,12 @@ class SeleniumScraper:
                     )
                     
                     # Determine the job board and use appropriate selectors
-                    domain = urlparse(url).netloc.lower()
-                    
-                    if 'linkedin' in domain:
-                        job_data = self._scrape_linkedin_job_selenium(url)
-                    elif 'indeed' in domain:
-                        job_data = self._scrape_indeed_job_selenium(url)
-                    elif 'glassdoor' in domain:
-                        job_data = self._scrape_glassdoor_job_selenium(url)
-                    else:
-                        job_data = self._scrape_generic_job_selenium(url)
+                    board_name = self.selector_engine.board_for_url(url)
+                    job_data = self._scrape_job_selenium(url, board_name)
                     
                     if job_data:
                         jobs.append(job_data)
                     
-                    # Rate limiting
-                    await asyncio.sleep(random.uniform(2, 5))
-                    
                 except Exception as e:
                     logger.error(f"Error scraping {url} with Selenium: {e}")
                     continue
@@ -292,161 +240,34 @@ class SeleniumScraper:
         
         return jobs
     
-    def _scrape_linkedin_job_selenium(self, url: str) -> Optional[ScrapedJob]:
-        """Scrape LinkedIn job page with Selenium"""
+    def _scrape_job_selenium(self, url: str, board_name: Optional[str]) -> Optional[ScrapedJob]:
+        """Scrape a job page with the board's compiled selectors in one script call"""
         try:
-            # Wait for job details to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".top-card-layout__entity-info"))
-            )
-            
-            title_elem = self.driver.find_element(By.CSS_SELECTOR, ".top-card-layout__title")
-            company_elem = self.driver.find_element(By.CSS_SELECTOR, ".topcard__flavor a")
-            location_elem = self.driver.find_element(By.CSS_SELECTOR, ".topcard__flavor--bullet")
+            board_config = scraper_config.job_boards.get(board_name, {})
             
-            # Try to expand description
-            try:
-                show_more_btn = self.driver.find_element(By.CSS_SELECTOR, ".show-more-less-html__button--more")
-                if show_more_btn.is_displayed():
-                    show_more_btn.click()
-                    time.sleep(1)
-            except NoSuchElementException:
-                pass
-            
-            description_elem = self.driver.find_element(By.CSS_SELECTOR, ".show-more-less-html__markup")
-            
-            title = title_elem.text.strip() if title_elem else ""
-            company = company_elem.text.strip() if company_elem else ""
-            location = location_elem.text.strip() if location_elem else ""
-            description = description_elem.text.strip() if description_elem else ""
-            
-            if title and company:
-                return ScrapedJob(
-                    title=title,
-                    company=company,
-                    location=location,
-                    description=description,
-                    source="linkedin",
-                    source_url=url,
-                    posted_date=datetime.now()
-                )
-                
-        except Exception as e:
-            logger.error(f"Error scraping LinkedIn job with Selenium: {e}")
-        
-        return None
-    
-    def _scrape_indeed_job_selenium(self, url: str) -> Optional[ScrapedJob]:
-        """Scrape Indeed job page with Selenium"""
-        try:
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='jobsearch-JobInfoHeader-title']"))
-            )
-            
-            title_elem = self.driver.find_element(By.CSS_SELECTOR, "[data-testid='jobsearch-JobInfoHeader-title']")
-            company_elem = self.driver.find_element(By.CSS_SELECTOR, "[data-testid='inlineHeader-companyName']")
-            location_elem = self.driver.find_element(By.CSS_SELECTOR, "[data-testid='job-location']")
-            description_elem = self.driver.find_element(By.ID, "jobDescriptionText")
-            
-            title = title_elem.text.strip() if title_elem else ""
-            company = company_elem.text.strip() if company_elem else ""
-            location = location_elem.text.strip() if location_elem else ""
-            description = description_elem.text.strip() if description_elem else ""
-            
-            if title and company:
-                return ScrapedJob(
-                    title=title,
-                    company=company,
-                    location=location,
-                    description=description,
-                    source="indeed",
-                    source_url=url,
-                    posted_date=datetime.now()
-                )
-                
-        except Exception as e:
-            logger.error(f"Error scraping Indeed job with Selenium: {e}")
-        
-        return None
-    
-    def _scrape_glassdoor_job_selenium(self, url: str) -> Optional[ScrapedJob]:
-        """Scrape Glassdoor job page with Selenium"""
-        try:
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-test='job-title']"))
-            )
-            
-            title_elem = self.driver.find_element(By.CSS_SELECTOR, "[data-test='job-title']")
-            company_elem = self.driver.find_element(By.CSS_SELECTOR, "[data-test='employer-name']")
-            location_elem = self.driver.find_element(By.CSS_SELECTOR, "[data-test='job-location']")
-            description_elem = self.driver.find_element(By.CSS_SELECTOR, "[data-test='jobDescriptionContent']")
-            
-            title = title_elem.text.strip() if title_elem else ""
-            company = company_elem.text.strip() if company_elem else ""
-            location = location_elem.text.strip() if location_elem else ""
-            description = description_elem.text.strip() if description_elem else ""
-            
-            if title and company:
-                return ScrapedJob(
-                    title=title,
-                    company=company,
-                    location=location,
-                    description=description,
-                    source="glassdoor",
-                    source_url=url,
-                    posted_date=datetime.now()
+            # Wait for job details to load
+            ready_selector = board_config.get('waits', {}).get('detail', {}).get('selector')
+            if ready_selector:
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ready_selector))
                 )
-                
-        except Exception as e:
-            logger.error(f"Error scraping Glassdoor job with Selenium: {e}")
-        
-        return None
-    
-    def _scrape_generic_job_selenium(self, url: str) -> Optional[ScrapedJob]:
-        """Scrape generic job page with Selenium"""
-        try:
-            # Try to find title
-            title_selectors = ["h1", ".job-title", ".title", "[class*='title']"]
-            title = ""
             
-            for selector in title_selectors:
-                try:
-                    elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if elem and len(elem.text.strip()) > 5:
-                        title = elem.text.strip()
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            # Try to find company
-            company_selectors = [".company", ".employer", "[class*='company']", "[class*='employer']"]
-            company = ""
-            
-            for selector in company_selectors:
+            # Try to expand description
+            expand_selector = board_config.get('expand_selector')
+            if expand_selector:
                 try:
-                    elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if elem and len(elem.text.strip()) > 2:
-                        company = elem.text.strip()
-                        break
+                    show_more_btn = self.driver.find_element(By.CSS_SELECTOR, expand_selector)
+                    if show_more_btn.is_displayed():
+                        show_more_btn.click()
+                        time.sleep(1)
                 except NoSuchElementException:
-                    continue
-            
-            # Get page text as description
-            body_elem = self.driver.find_element(By.TAG_NAME, "body")
-            description = body_elem.text[:1000] if body_elem else ""
+                    pass
             
-            if title and company:
-                return ScrapedJob(
-                    title=title,
-                    company=company,
-                    description=description,
-                    source="generic",
-                    source_url=url,
-                    posted_date=datetime.now()
-                )
+            fields = self.selector_engine.extract_selenium(self.driver, board_name)
+            return scraped_job_from_fields(fields, board_name, url)
                 
         except Exception as e:
-            logger.error(f"Error scraping generic job with Selenium: {e}")
+            logger.error(f"Error scraping {board_name or 'generic'} job with Selenium: {e}")
         
         return None
 
@@ -459,71 +280,24 @@ class ScrapyJobSpider(scrapy.Spider):
     
     name = 'job_spider'
     
-    def __init__(self, urls=None, *args, **kwargs):
+    def __init__(self, urls=None, selector_engine: Optional[SelectorEngine] = None, *args, **kwargs):
         super(ScrapyJobSpider, self).__init__(*args, **kwargs)
         self.start_urls = urls or []
         self.scraped_jobs = []
+        self.selector_engine = selector_engine or get_shared_selector_engine()
     
     def parse(self, response):
-        """Parse job page"""
-        domain = urlparse(response.url).netloc.lower()
+        """Parse job page with the board's compiled selectors"""
+        board_name = self.selector_engine.board_for_url(response.url)
+        fields = self.selector_engine.extract_scrapy(response, board_name)
         
-        if 'indeed' in domain:
-            yield from self.parse_indeed_job(response)
-        elif 'glassdoor' in domain:
-            yield from self.parse_glassdoor_job(response)
-        else:
-            yield from self.parse_generic_job(response)
-    
-    def parse_indeed_job(self, response):
-        """Parse Indeed job page"""
-        title = response.css("[data-testid='jobsearch-JobInfoHeader-title']::text").get()
-        company = response.css("[data-testid='inlineHeader-companyName']::text").get()
-        location = response.css("[data-testid='job-location']::text").get()
-        description = response.css("#jobDescriptionText::text").getall()
-        
-        if title and company:
+        if fields.get('title') and fields.get('company'):
             yield {
-                'title': title.strip(),
-                'company': company.strip(),
-                'location': location.strip() if location else "",
-                'description': ' '.join(description).strip(),
-                'source': 'indeed',
-                'source_url': response.url,
-                'posted_date': datetime.now().isoformat()
-            }
-    
-    def parse_glassdoor_job(self, response):
-        """Parse Glassdoor job page"""
-        title = response.css("[data-test='job-title']::text").get()
-        company = response.css("[data-test='employer-name']::text").get()
-        location = response.css("[data-test='job-location']::text").get()
-        description = response.css("[data-test='jobDescriptionContent']::text").getall()
-        
-        if title and company:
-            yield {
-                'title': title.strip(),
-                'company': company.strip(),
-                'location': location.strip() if location else "",
-                'description': ' '.join(description).strip(),
-                'source': 'glassdoor',
-                'source_url': response.url,
-                'posted_date': datetime.now().isoformat()
-            }
-    
-    def parse_generic_job(self, response):
-        """Parse generic job page"""
-        title = response.css("h1::text").get()
-        company = response.css(".company::text, .employer::text").get()
-        description = response.css("body::text").getall()
-        
-        if title and company:
-            yield {
-                'title': title.strip(),
-                'company': company.strip(),
-                'location': "",
-                'description': ' '.join(description)[:1000].strip(),
-                'source': 'generic',
+                'title': fields['title'],
+                'company': fields['company'],
+                'location': fields.get('location', ''),
+                'description': fields.get('description', ''),
+                'source': board_name or 'generic',
                 'source_url': response.url,
                 'posted_date': datetime.now().isoformat()
             }
@@ -561,15 +335,7 @@ class FallbackScraperManager:
                 if bs_jobs:
                     logger.info(f"BeautifulSoup scraped {len(bs_jobs)} jobs")
                     for job in bs_jobs:
-                        job_dict = {
-                            'title': job.title,
-                            'company': job.company,
-                            'location': job.location,
-                            'description': job.description,
-                            'source': job.source,
-                            'source_url': job.source_url,
-                            'posted_date': job.posted_date
-                        }
+                        job_dict = self._job_to_dict(job)
                         normalized = await self.job_normalizer.normalize_job_data(job_dict)
                         all_jobs.append(normalized)
                     
@@ -588,15 +354,7 @@ class FallbackScraperManager:
                 if selenium_jobs:
                     logger.info(f"Selenium scraped {len(selenium_jobs)} jobs")
                     for job in selenium_jobs:
-                        job_dict = {
-                            'title': job.title,
-                            'company': job.company,
-                            'location': job.location,
-                            'description': job.description,
-                            'source': job.source,
-                            'source_url': job.source_url,
-                            'posted_date': job.posted_date
-                        }
+                        job_dict = self._job_to_dict(job)
                         normalized = await self.job_normalizer.normalize_job_data(job_dict)
                         all_jobs.append(normalized)
                     
@@ -625,6 +383,27 @@ class FallbackScraperManager:
         logger.warning("All fallback scrapers failed")
         return all_jobs
     
+    def _job_to_dict(self, job: ScrapedJob) -> Dict[str, Any]:
+        """Convert a scraped job to a dict for normalization, dropping unset optional fields"""
+        job_dict = {
+            'title': job.title,
+            'company': job.company,
+            'location': job.location,
+            'description': job.description,
+            'source': job.source,
+            'source_url': job.source_url,
+            'posted_date': job.posted_date
+        }
+        
+        for field in ('expires_date', 'external_id', 'salary_min', 'salary_max', 'employment_type', 'remote_type'):
+            value = getattr(job, field)
+            if value is not None:
+                job_dict[field] = value
+        if job.salary_min is not None or job.salary_max is not None:
+            job_dict['salary_currency'] = job.salary_currency
+        
+        return job_dict
+    
     async def _run_scrapy_scraper(self, urls: List[str]) -> List[Dict[str, Any]]:
         """Run Scrapy spider"""
         # This is a simplified implementation
@@ -0,0 +1,157 @@
+"""
+Offline crawl benchmarks: record a crawl into a replay archive once, then
+measure pages/sec and extraction latency against that fixed corpus.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Dict, List, Optional, Any
+
+from loguru import logger
+
+from ..config.scraper_config import ScraperConfig, FallbackScraperConfig
+from ..utils.rate_limiter import DomainRateLimiter
+from ..utils.response_cache import ResponseCache
+from ..utils.replay import ReplayArchive, ReplayRouter, ReplayServer, ResponseRecorder
+from .crawlee_job_scraper import CrawleeJobScraper
+from .fallback_scrapers import BeautifulSoupScraper, SeleniumScraper
+
+
+async def record_crawlee(config: ScraperConfig, archive_path: str, search_params: Dict[str, Any],
+                         boards: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Run a live crawl and capture its traffic into an archive"""
+    archive = ReplayArchive(archive_path)
+    scraper = CrawleeJobScraper(config)
+    scraper.record_to(archive)
+    
+    try:
+        results = await scraper.scrape_all_boards(search_params, boards)
+    finally:
+        archive.save()
+        await scraper.close()
+    
+    return {
+        'jobs': {board_name: len(result['jobs']) for board_name, result in results.items()},
+        'archive': archive.get_stats(),
+    }
+
+
+async def benchmark_crawlee(config: ScraperConfig, archive_path: str, search_params: Dict[str, Any],
+                            boards: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Replay a recorded crawl through CrawleeJobScraper and measure throughput and handler latency"""
+    archive = ReplayArchive(archive_path)
+    scraper = CrawleeJobScraper(config)
+    scraper.replay_from(archive)
+    
+    start_time = time.perf_counter()
+    try:
+        results = await scraper.scrape_all_boards(search_params, boards)
+    finally:
+        await scraper.close()
+    elapsed = time.perf_counter() - start_time
+    
+    pages = sum(result['stats']['requests_handled'] for result in results.values())
+    return {
+        'pages': pages,
+        'jobs': sum(len(result['jobs']) for result in results.values()),
+        'elapsed_seconds': round(elapsed, 3),
+        'pages_per_second': round(pages / elapsed, 2) if elapsed else 0.0,
+        'handler_latency': scraper.get_handler_stats(),
+        'replay': archive.get_stats(),
+    }
+
+
+def _offline_dependencies(scraper_config: ScraperConfig):
+    """Rate limiter and cache that add neither waits nor hits to a replayed run"""
+    return (
+        DomainRateLimiter(delay=0.0, randomize=False),
+        ResponseCache(scraper_config.data_storage_path, scraper_config.job_boards, enabled=False),
+    )
+
+
+async def record_beautifulsoup(config: FallbackScraperConfig, scraper_config: ScraperConfig,
+                               archive_path: str, urls: List[str]) -> Dict[str, Any]:
+    """Fetch job pages live with BeautifulSoupScraper and capture them into an archive"""
+    archive = ReplayArchive(archive_path)
+    _, response_cache = _offline_dependencies(scraper_config)
+    scraper = BeautifulSoupScraper(config, response_cache=response_cache)
+    scraper.session.hooks['response'].append(ResponseRecorder(archive).record_requests_response)
+    
+    try:
+        jobs = await scraper.scrape_jobs(urls)
+    finally:
+        archive.save()
+    
+    return {'jobs': len(jobs), 'archive': archive.get_stats()}
+
+
+async def benchmark_beautifulsoup(config: FallbackScraperConfig, scraper_config: ScraperConfig,
+                                  archive_path: str, urls: List[str]) -> Dict[str, Any]:
+    """Replay job pages through BeautifulSoupScraper and measure throughput"""
+    archive = ReplayArchive(archive_path)
+    rate_limiter, response_cache = _offline_dependencies(scraper_config)
+    scraper = BeautifulSoupScraper(config, rate_limiter=rate_limiter, response_cache=response_cache)
+    ReplayRouter(archive).mount(scraper.session)
+    
+    start_time = time.perf_counter()
+    jobs = await scraper.scrape_jobs(urls)
+    elapsed = time.perf_counter() - start_time
+    
+    return {
+        'pages': len(urls),
+        'jobs': len(jobs),
+        'elapsed_seconds': round(elapsed, 3),
+        'pages_per_second': round(len(urls) / elapsed, 2) if elapsed else 0.0,
+        'avg_page_seconds': round(elapsed / len(urls), 4) if urls else 0.0,
+        'replay': archive.get_stats(),
+    }
+
+
+async def benchmark_selenium(config: FallbackScraperConfig, archive_path: str, urls: List[str]) -> Dict[str, Any]:
+    """Replay job pages through SeleniumScraper via the local replay server and measure throughput"""
+    archive = ReplayArchive(archive_path)
+    
+    with ReplayServer(archive) as server:
+        scraper = SeleniumScraper(
+            config, rate_limiter=DomainRateLimiter(delay=0.0, randomize=False), url_rewriter=server.url_for
+        )
+        
+        start_time = time.perf_counter()
+        jobs = await scraper.scrape_jobs(urls)
+        elapsed = time.perf_counter() - start_time
+    
+    return {
+        'pages': len(urls),
+        'jobs': len(jobs),
+        'elapsed_seconds': round(elapsed, 3),
+        'pages_per_second': round(len(urls) / elapsed, 2) if elapsed else 0.0,
+        'avg_page_seconds': round(elapsed / len(urls), 4) if urls else 0.0,
+        'replay': archive.get_stats(),
+    }
+
+
+async def main():
+    """Record a crawl once, then benchmark it offline as often as needed"""
+    parser = argparse.ArgumentParser(description="Record or replay a job board crawl")
+    parser.add_argument('mode', choices=['record', 'replay'])
+    parser.add_argument('archive', help="Replay archive directory")
+    parser.add_argument('--keywords', default='python developer')
+    parser.add_argument('--location', default='San Francisco')
+    parser.add_argument('--boards', nargs='*', default=None)
+    args = parser.parse_args()
+    
+    config = ScraperConfig(max_requests_per_crawl=100, max_jobs_per_page=10)
+    search_params = {'keywords': args.keywords, 'location': args.location}
+    
+    if args.mode == 'record':
+        result = await record_crawlee(config, args.archive, search_params, args.boards)
+    else:
+        result = await benchmark_crawlee(config, args.archive, search_params, args.boards)
+    
+    logger.info(f"{args.mode.title()} result: {result}")
+    print(result)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
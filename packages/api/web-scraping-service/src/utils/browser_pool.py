@@ -0,0 +1,137 @@
+"""
+Managed Playwright browser pool with warm browsers, recycling and utilization metrics
+"""
+
+import asyncio
+import time
+from datetime import timedelta
+from typing import Dict, Any
+
+from crawlee.browsers import BrowserPool, PlaywrightBrowserPlugin
+from crawlee.fingerprint_suite import DefaultFingerprintGenerator, HeaderGeneratorOptions
+from loguru import logger
+
+from ..config.scraper_config import ScraperConfig
+
+
+# Fingerprint browser family matching each Playwright browser type
+FINGERPRINT_BROWSERS = {
+    'chromium': 'chrome',
+    'firefox': 'firefox',
+    'webkit': 'safari',
+}
+
+
+class MonitoredBrowserPool(BrowserPool):
+    """
+    BrowserPool that launches a fixed set of warm browsers up front, recycles
+    browsers after repeated errors and records how long requests wait for a page.
+    
+    Pages of one browser share a single browser context (no incognito pages), so
+    cookies, cache and connections are reused across requests served by that browser.
+    Browsers are retired after ``retire_browser_after_page_count`` pages.
+    """
+    
+    def __init__(self, *args, warm_browsers: int = 1, recycle_after_errors: int = 5, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.warm_browsers = warm_browsers
+        self.recycle_after_errors = recycle_after_errors
+        self._consecutive_errors = 0
+        self.stats = {
+            'pages_opened': 0,
+            'page_open_failures': 0,
+            'page_wait_seconds_total': 0.0,
+            'page_wait_seconds_max': 0.0,
+            'browsers_recycled': 0,
+        }
+    
+    async def __aenter__(self) -> 'MonitoredBrowserPool':
+        await super().__aenter__()
+        
+        # Launch the warm browsers now so the first requests don't pay startup cost
+        for plugin in self.plugins:
+            launches = [self._launch_new_browser(plugin) for _ in range(self.warm_browsers)]
+            results = await asyncio.gather(*launches, return_exceptions=True)
+            failures = [result for result in results if isinstance(result, Exception)]
+            if failures:
+                logger.error(f"Failed to launch {len(failures)} warm browsers: {failures[0]}")
+        
+        logger.info(f"Browser pool started with {len(self.active_browsers)} warm browsers")
+        return self
+    
+    async def new_page(self, **kwargs):
+        """Open a page and record the time spent waiting for it"""
+        start_time = time.perf_counter()
+        try:
+            page = await super().new_page(**kwargs)
+        except Exception:
+            self.stats['page_open_failures'] += 1
+            raise
+        finally:
+            wait_seconds = time.perf_counter() - start_time
+            self.stats['page_wait_seconds_total'] += wait_seconds
+            self.stats['page_wait_seconds_max'] = max(self.stats['page_wait_seconds_max'], wait_seconds)
+        
+        self.stats['pages_opened'] += 1
+        return page
+    
+    def record_success(self):
+        """Reset the consecutive error counter after a handled request"""
+        self._consecutive_errors = 0
+    
+    def record_error(self):
+        """Count a failed request and recycle the browsers once errors pile up"""
+        self._consecutive_errors += 1
+        if self._consecutive_errors >= self.recycle_after_errors:
+            self.recycle_browsers()
+            self._consecutive_errors = 0
+    
+    def recycle_browsers(self):
+        """Retire all active browsers; they close once their open pages finish"""
+        browsers = list(self.active_browsers)
+        for browser in browsers:
+            self._retire_browser(browser)
+        self.stats['browsers_recycled'] += len(browsers)
+        logger.warning(f"Recycled {len(browsers)} browsers after {self.recycle_after_errors} consecutive errors")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool utilization and page wait metrics"""
+        open_pages = sum(browser.pages_count for browser in self.active_browsers)
+        capacity = sum(
+            plugin.max_open_pages_per_browser for plugin in self.plugins
+        ) * max(len(self.active_browsers), 1)
+        pages_opened = self.stats['pages_opened']
+        
+        return {
+            **self.stats,
+            'active_browsers': len(self.active_browsers),
+            'inactive_browsers': len(self.inactive_browsers),
+            'open_pages': open_pages,
+            'utilization': round(open_pages / capacity, 3) if capacity else 0.0,
+            'page_wait_seconds_avg': (
+                round(self.stats['page_wait_seconds_total'] / pages_opened, 4) if pages_opened else 0.0
+            ),
+        }
+
+
+def create_browser_pool(config: ScraperConfig) -> MonitoredBrowserPool:
+    """Build the browser pool for CrawleeJobScraper from configuration"""
+    plugin = PlaywrightBrowserPlugin(
+        browser_type=config.browser_type,
+        browser_launch_options={'headless': config.headless},
+        max_open_pages_per_browser=config.max_open_pages_per_browser,
+        use_incognito_pages=False,
+        fingerprint_generator=DefaultFingerprintGenerator(
+            header_options=HeaderGeneratorOptions(
+                browsers=[FINGERPRINT_BROWSERS.get(config.browser_type, 'chrome')]
+            )
+        ),
+    )
+    
+    return MonitoredBrowserPool(
+        plugins=[plugin],
+        warm_browsers=config.browser_pool_size,
+        recycle_after_errors=config.browser_recycle_after_errors,
+        retire_browser_after_page_count=config.retire_browser_after_pages,
+        browser_inactive_threshold=timedelta(seconds=config.browser_idle_timeout),
+    )
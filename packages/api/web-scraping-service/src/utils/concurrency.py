@@ -0,0 +1,162 @@
+"""
+Crawl concurrency settings derived from ScraperConfig, plus a monitor that
+records how the autoscaled pool reacts to CPU, memory and event-loop load
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any
+
+from crawlee import ConcurrencySettings, service_locator
+from crawlee.configuration import Configuration
+from crawlee.events import Event
+from loguru import logger
+
+from ..config.scraper_config import ScraperConfig
+from .metrics import ScraperMetrics
+
+
+def build_concurrency_settings(config: ScraperConfig) -> ConcurrencySettings:
+    """
+    Bound the crawler's autoscaled pool by the configured concurrency limits
+    
+    The desired (starting) concurrency defaults to the minimum, so the pool only
+    scales up while the system reports spare CPU, memory and event-loop capacity.
+    """
+    max_concurrency = max(config.max_concurrent_requests, 1)
+    min_concurrency = min(max(config.min_concurrent_requests, 1), max_concurrency)
+    desired_concurrency = config.desired_concurrent_requests or min_concurrency
+    desired_concurrency = min(max(desired_concurrency, min_concurrency), max_concurrency)
+    
+    return ConcurrencySettings(
+        min_concurrency=min_concurrency,
+        max_concurrency=max_concurrency,
+        desired_concurrency=desired_concurrency,
+        max_tasks_per_minute=config.max_requests_per_minute or float('inf'),
+    )
+
+
+def build_crawlee_configuration(config: ScraperConfig) -> Configuration:
+    """Translate the load thresholds into Crawlee's Snapshotter configuration"""
+    return Configuration(
+        max_used_cpu_ratio=config.max_cpu_ratio,
+        max_used_memory_ratio=config.max_memory_ratio,
+        memory_mbytes=config.memory_limit_mb,
+        available_memory_ratio=config.available_memory_ratio,
+        max_event_loop_delay=timedelta(milliseconds=config.max_event_loop_delay_ms),
+    )
+
+
+class ConcurrencyMonitor:
+    """
+    Samples system load and the crawler's autoscaled pool while a crawl runs,
+    logging every change of desired concurrency and exporting the pool's
+    state to the scraper metrics, when given.
+    """
+    
+    def __init__(self, crawler, sample_interval: float = 5.0, history_size: int = 500,
+                 metrics: Optional[ScraperMetrics] = None):
+        self.crawler = crawler
+        self.metrics = metrics
+        self.sample_interval = sample_interval
+        self.history_size = history_size
+        self.decisions: List[Dict[str, Any]] = []
+        self.latest: Dict[str, Any] = {
+            'cpu_ratio': None,
+            'memory_bytes': None,
+            'event_loop_lag_ms': 0.0,
+            'desired_concurrency': None,
+            'current_concurrency': None,
+        }
+        self.stats = {
+            'samples': 0,
+            'scale_ups': 0,
+            'scale_downs': 0,
+            'max_event_loop_lag_ms': 0.0,
+            'peak_concurrency': 0,
+        }
+        self._task: Optional[asyncio.Task] = None
+        self._listening = False
+    
+    def _on_system_info(self, event_data):
+        """Keep the most recent CPU and memory snapshot emitted by Crawlee"""
+        try:
+            self.latest['cpu_ratio'] = round(event_data.cpu_info.used_ratio, 3)
+            self.latest['memory_bytes'] = event_data.memory_info.current_size.bytes
+        except Exception as e:
+            logger.debug(f"Unexpected system info event: {e}")
+    
+    async def start(self):
+        """Start sampling in the background"""
+        if self._task and not self._task.done():
+            return
+        
+        if not self._listening:
+            service_locator.get_event_manager().on(event=Event.SYSTEM_INFO, listener=self._on_system_info)
+            self._listening = True
+        
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop sampling"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self):
+        """Measure event-loop lag and record concurrency changes each interval"""
+        while True:
+            expected = time.perf_counter() + self.sample_interval
+            await asyncio.sleep(self.sample_interval)
+            lag_ms = max(time.perf_counter() - expected, 0.0) * 1000
+            self._sample(lag_ms)
+    
+    def _sample(self, lag_ms: float):
+        """Take one sample of load and pool state"""
+        pool = getattr(self.crawler, '_autoscaled_pool', None)
+        if pool is None:
+            return
+        
+        previous_desired = self.latest['desired_concurrency']
+        desired = pool.desired_concurrency
+        current = pool.current_concurrency
+        
+        self.latest.update({
+            'event_loop_lag_ms': round(lag_ms, 1),
+            'desired_concurrency': desired,
+            'current_concurrency': current,
+        })
+        self.stats['samples'] += 1
+        self.stats['max_event_loop_lag_ms'] = max(self.stats['max_event_loop_lag_ms'], round(lag_ms, 1))
+        self.stats['peak_concurrency'] = max(self.stats['peak_concurrency'], current)
+        if self.metrics:
+            self.metrics.sample_concurrency(desired, current)
+        
+        if previous_desired is not None and desired != previous_desired:
+            direction = 'up' if desired > previous_desired else 'down'
+            self.stats['scale_ups' if direction == 'up' else 'scale_downs'] += 1
+            if self.metrics:
+                self.metrics.concurrency_scalings.labels(direction=direction).inc()
+            decision = {
+                'timestamp': datetime.now().isoformat(),
+                'direction': direction,
+                'from': previous_desired,
+                'to': desired,
+                **{key: self.latest[key] for key in ('cpu_ratio', 'memory_bytes', 'event_loop_lag_ms')},
+            }
+            self.decisions.append(decision)
+            del self.decisions[:-self.history_size]
+            logger.info(f"Concurrency scaled {direction}: {decision}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the latest load sample and scaling counters"""
+        return {
+            **self.stats,
+            **self.latest,
+            'decisions': len(self.decisions),
+        }
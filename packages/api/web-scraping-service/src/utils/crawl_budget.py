@@ -0,0 +1,195 @@
+"""
+Budgeted crawl scheduling: measures how many new jobs each search finds per
+second of browser time and spends the rest of the budget on the best ones
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple
+
+from crawlee import Request
+from loguru import logger
+
+from ..config.scraper_config import ScraperConfig
+
+
+@dataclass
+class SearchYield:
+    """Observed yield of one search of one board"""
+    board: str
+    search_key: str
+    pages: int = 0
+    new_jobs: int = 0
+    seconds: float = 0.0
+    
+    @property
+    def rate(self) -> float:
+        """New jobs per second of browser time"""
+        return self.new_jobs / self.seconds if self.seconds > 0 else 0.0
+
+
+class CrawlBudget:
+    """
+    Spends a crawl's wall-clock and/or page budget on the searches that find
+    the most new jobs per second.
+    
+    Every listing page reports how many of its jobs the search did not return
+    in the previous run and how long the page took; the detail pages it
+    enqueued are charged to it at its board's observed detail page cost.
+    A search's first ``explore_pages`` pages are always crawled so its yield
+    is known. After that, its later pages go to the front of the queue while
+    its rate is at least ``yield_share`` of the best search's rate. Pages of
+    slower searches are held back and released, best rate first, whenever the
+    crawl has idle capacity. Pages still held back when the budget runs out
+    are dropped.
+    """
+    
+    def __init__(self, max_seconds: Optional[float] = None, max_pages: Optional[int] = None,
+                 explore_pages: int = 1, yield_share: float = 0.5):
+        self.max_seconds = max_seconds
+        self.max_pages = max_pages
+        self.explore_pages = explore_pages
+        self.yield_share = yield_share
+        self.started_at = time.monotonic()
+        self.pages_used = 0
+        self.stop_requested = False
+        self.searches: Dict[Tuple[str, str], SearchYield] = {}
+        self.detail_cost: Dict[str, float] = {}
+        self.deferred: Dict[Tuple[str, str], List[Request]] = {}
+        self.stats = {
+            'pages_explored': 0,
+            'pages_prioritized': 0,
+            'pages_deferred': 0,
+            'pages_released': 0,
+            'pages_dropped': 0,
+        }
+    
+    @classmethod
+    def from_config(cls, config: ScraperConfig, max_seconds: Optional[float] = None,
+                    max_pages: Optional[int] = None) -> Optional['CrawlBudget']:
+        """Budget of a crawl, with the config's budgets as defaults; None when the crawl is unbudgeted"""
+        max_seconds = max_seconds if max_seconds is not None else config.crawl_time_budget
+        max_pages = max_pages if max_pages is not None else config.crawl_page_budget
+        if max_seconds is None and max_pages is None:
+            return None
+        return cls(max_seconds, max_pages, config.budget_explore_pages, config.budget_yield_share)
+    
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+    
+    @property
+    def exhausted(self) -> bool:
+        """Whether the crawl has used up its time or page budget"""
+        return (
+            (self.max_seconds is not None and self.elapsed >= self.max_seconds)
+            or (self.max_pages is not None and self.pages_used >= self.max_pages)
+        )
+    
+    def charge_page(self, board_name: Optional[str], label: Optional[str], seconds: float):
+        """Count a fetched page against the budget, learning the board's detail page cost"""
+        self.pages_used += 1
+        if board_name and (label or '').endswith('_job_detail'):
+            cost = self.detail_cost.get(board_name)
+            self.detail_cost[board_name] = seconds if cost is None else 0.8 * cost + 0.2 * seconds
+    
+    def record_listing(self, board_name: str, search_key: str, new_jobs: int, detail_pages: int, seconds: float):
+        """Add a listing page's new jobs and cost (its own time plus the detail pages it enqueued) to its search"""
+        search = self.searches.setdefault((board_name, search_key), SearchYield(board_name, search_key))
+        search.pages += 1
+        search.new_jobs += new_jobs
+        search.seconds += seconds + detail_pages * self.detail_cost.get(board_name, seconds)
+    
+    def best_rate(self) -> float:
+        """Best yield among searches past exploration"""
+        return max(
+            (search.rate for search in self.searches.values() if search.pages >= self.explore_pages), default=0.0
+        )
+    
+    def admit(self, board_name: str, search_key: str, requests: List[Request]) -> Tuple[List[Request], bool]:
+        """
+        Decide what to do with later listing pages of a search
+        
+        Returns:
+            The requests to enqueue now, and whether they belong at the front of the queue;
+            the others are held back for idle capacity, or dropped once the budget is spent
+        """
+        if self.exhausted:
+            self.stats['pages_dropped'] += len(requests)
+            return [], False
+        
+        search = self.searches.get((board_name, search_key))
+        if search is None or search.pages < self.explore_pages:
+            self.stats['pages_explored'] += len(requests)
+            return requests, False
+        
+        if search.rate > 0 and search.rate >= self.best_rate() * self.yield_share:
+            self.stats['pages_prioritized'] += len(requests)
+            return requests, True
+        
+        self.deferred.setdefault((board_name, search_key), []).extend(requests)
+        self.stats['pages_deferred'] += len(requests)
+        return [], False
+    
+    def release(self, limit: int) -> List[Request]:
+        """Take up to limit held-back pages, from the searches with the best current yield"""
+        if self.exhausted or limit <= 0:
+            return []
+        
+        released = []
+        ranked = sorted(self.deferred, key=lambda key: self.searches[key].rate, reverse=True)
+        for key in ranked:
+            pages = self.deferred[key]
+            taken, self.deferred[key] = pages[:limit - len(released)], pages[limit - len(released):]
+            released.extend(taken)
+            if not self.deferred[key]:
+                del self.deferred[key]
+            if len(released) >= limit:
+                break
+        
+        self.stats['pages_released'] += len(released)
+        return released
+    
+    @property
+    def has_deferred(self) -> bool:
+        """Whether held-back pages can still be released"""
+        return bool(self.deferred) and not self.exhausted
+    
+    def request_stop(self) -> bool:
+        """True the first time the crawl should be stopped for running out of budget"""
+        if self.stop_requested or not self.exhausted:
+            return False
+        
+        self.stop_requested = True
+        logger.info(f"Crawl budget exhausted after {self.elapsed:.1f}s and {self.pages_used} pages")
+        return True
+    
+    def get_stats(self, top: int = 10) -> Dict[str, Any]:
+        """Get budget use, scheduling counters and the yield of each board and of the best searches"""
+        boards: Dict[str, Dict[str, Any]] = {}
+        for search in self.searches.values():
+            board = boards.setdefault(search.board, {'pages': 0, 'new_jobs': 0, 'seconds': 0.0})
+            board['pages'] += search.pages
+            board['new_jobs'] += search.new_jobs
+            board['seconds'] += search.seconds
+        for board in boards.values():
+            board['jobs_per_second'] = round(board['new_jobs'] / board['seconds'], 3) if board['seconds'] else 0.0
+            board['seconds'] = round(board['seconds'], 1)
+        
+        ranked = sorted(self.searches.values(), key=lambda search: search.rate, reverse=True)
+        return {
+            'elapsed_seconds': round(self.elapsed, 1),
+            'max_seconds': self.max_seconds,
+            'pages_used': self.pages_used,
+            'max_pages': self.max_pages,
+            **self.stats,
+            'pages_still_deferred': sum(len(pages) for pages in self.deferred.values()),
+            'boards': boards,
+            'top_searches': [
+                {
+                    'board': search.board, 'search_key': search.search_key, 'pages': search.pages,
+                    'new_jobs': search.new_jobs, 'jobs_per_second': round(search.rate, 3),
+                }
+                for search in ranked[:top]
+            ],
+        }
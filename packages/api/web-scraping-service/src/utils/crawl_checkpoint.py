@@ -0,0 +1,157 @@
+"""
+Durable checkpoints of a named crawl, so it can resume after a crash or deploy
+"""
+
+import asyncio
+import json
+import os
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Any
+
+from crawlee import Request
+from loguru import logger
+
+
+class CrawlCheckpoint:
+    """
+    Ledger of every request of a named crawl, written to disk at a fixed interval.
+    
+    Each request is tracked as pending, in flight or handled. A checkpoint
+    also stores the scraper state returned by ``state_provider`` (run id,
+    datasets, per-board counters, pagination). Resuming re-queues pending
+    and in-flight requests and skips handled ones, so completed pages are
+    not fetched again.
+    """
+    
+    PENDING = "pending"
+    IN_FLIGHT = "in_flight"
+    HANDLED = "handled"
+    
+    def __init__(self, storage_path: str, crawl_name: str, interval: float = 30.0,
+                 state_provider: Optional[Callable[[], Dict[str, Any]]] = None):
+        self.crawl_name = crawl_name
+        self.file_path = os.path.join(storage_path, 'checkpoints', f"{crawl_name}.json")
+        self.interval = interval
+        self.state_provider = state_provider
+        self.requests: Dict[str, Dict[str, Any]] = {}
+        self.state: Dict[str, Any] = {}
+        self.status = 'running'
+        self.stats = {
+            'checkpoints_written': 0,
+            'requests_restored': 0,
+            'handled_skipped': 0,
+        }
+        self._task: Optional[asyncio.Task] = None
+    
+    @classmethod
+    def load(cls, storage_path: str, crawl_name: str, interval: float = 30.0) -> Optional['CrawlCheckpoint']:
+        """Load the last checkpoint of a named crawl, or None if there is none"""
+        checkpoint = cls(storage_path, crawl_name, interval)
+        try:
+            if not os.path.exists(checkpoint.file_path):
+                return None
+            with open(checkpoint.file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading checkpoint {checkpoint.file_path}: {e}")
+            return None
+        
+        checkpoint.requests = data.get('requests', {})
+        checkpoint.state = data.get('state', {})
+        checkpoint.status = data.get('status', 'running')
+        logger.info(f"Loaded checkpoint of crawl {crawl_name} from {data.get('saved_at')}: {checkpoint.get_stats()}")
+        return checkpoint
+    
+    def track(self, requests: List[Request]):
+        """Record newly enqueued requests as pending (requests already tracked keep their state)"""
+        for request in requests:
+            if request.unique_key in self.requests:
+                continue
+            self.requests[request.unique_key] = {
+                'url': request.url,
+                'user_data': {
+                    key: value for key, value in request.user_data.items() if not key.startswith('__')
+                },
+                'state': self.PENDING,
+            }
+    
+    def _set_state(self, request: Request, state: str):
+        if request.unique_key not in self.requests:
+            self.track([request])
+        self.requests[request.unique_key]['state'] = state
+    
+    def mark_in_flight(self, request: Request):
+        """Record that a request is being processed"""
+        self._set_state(request, self.IN_FLIGHT)
+    
+    def mark_handled(self, request: Request):
+        """Record that a request completed and must not be fetched again"""
+        self._set_state(request, self.HANDLED)
+    
+    def unfinished_requests(self) -> List[Request]:
+        """Rebuild the pending and in-flight requests, in the order they were enqueued"""
+        requests = []
+        for unique_key, entry in self.requests.items():
+            if entry['state'] == self.HANDLED:
+                self.stats['handled_skipped'] += 1
+                continue
+            entry['state'] = self.PENDING
+            requests.append(Request.from_url(entry['url'], unique_key=unique_key, user_data=dict(entry['user_data'])))
+        
+        self.stats['requests_restored'] = len(requests)
+        return requests
+    
+    def save(self):
+        """Write the ledger and the current scraper state to disk"""
+        try:
+            if self.state_provider:
+                self.state = self.state_provider()
+            
+            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+            tmp_path = f"{self.file_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'crawl_name': self.crawl_name,
+                    'status': self.status,
+                    'saved_at': datetime.now().isoformat(),
+                    'state': self.state,
+                    'requests': self.requests,
+                }, f, default=str)
+            os.replace(tmp_path, self.file_path)
+            self.stats['checkpoints_written'] += 1
+        except Exception as e:
+            logger.error(f"Error saving checkpoint {self.file_path}: {e}")
+    
+    async def start(self):
+        """Start checkpointing in the background"""
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop checkpointing and write a final checkpoint"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.save()
+    
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            self.save()
+    
+    def finish(self):
+        """Mark the crawl complete, so it is not resumed again"""
+        self.status = 'finished'
+        self.save()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request counts by state and checkpoint counters"""
+        by_state = {self.PENDING: 0, self.IN_FLIGHT: 0, self.HANDLED: 0}
+        for entry in self.requests.values():
+            by_state[entry['state']] = by_state.get(entry['state'], 0) + 1
+        return {**self.stats, **by_state, 'status': self.status}
@@ -0,0 +1,59 @@
+"""
+Keeps a scraper's crawlee crawler runnable across stops
+"""
+
+from typing import Any, Callable, Dict
+
+from crawlee.storages import RequestQueue
+from loguru import logger
+
+
+class RestartableCrawler:
+    """
+    Owns the crawler of a scraper and replaces it after a stop.
+    
+    crawlee cannot restart a stopped crawler: ``BasicCrawler.stop`` sets a flag
+    that only its constructor resets, so every later ``run`` returns at once.
+    ``stop`` therefore marks the crawler stopped, and ``prepare`` builds a new
+    one with ``build_crawler`` before the next run, dropping the stopped run's
+    leftover requests unless they are kept.
+    """
+    
+    def __init__(self, build_crawler: Callable[[], Any]):
+        self.build_crawler = build_crawler
+        self.crawler = build_crawler()
+        self.stopped = False
+        self.stats = {
+            'stops': 0,
+            'replacements': 0,
+        }
+    
+    def stop(self, reason: str):
+        """Stop the run in progress once its in-flight requests finish"""
+        self.crawler.stop(reason)
+        self.stopped = True
+        self.stats['stops'] += 1
+    
+    async def prepare(self, purge_request_queue: bool = True) -> bool:
+        """
+        Make the crawler runnable, replacing it if it was stopped
+        
+        Returns:
+            Whether a new crawler was built
+        """
+        if not self.stopped:
+            return False
+        
+        request_manager = await self.crawler.get_request_manager()
+        if purge_request_queue and isinstance(request_manager, RequestQueue):
+            await request_manager.drop()
+        
+        self.crawler = self.build_crawler()
+        self.stopped = False
+        self.stats['replacements'] += 1
+        logger.info("Replaced the stopped crawler with a new one")
+        return True
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get stop and replacement counters"""
+        return dict(self.stats)
@@ -0,0 +1,227 @@
+"""
+In-page DOM extraction helpers for Playwright pages.
+Each helper runs a single script in the browser and returns plain data,
+so a page costs one CDP round-trip instead of one per element.
+"""
+
+from typing import Dict, List, Any, Tuple
+
+from loguru import logger
+
+
+LISTING_CARDS_SCRIPT = """
+({jobList, container, idAttribute, link, fields, limit}) => {
+    const clean = (value) => (value || '').replace(/\\s+/g, ' ').trim();
+    const cards = [];
+    const nodes = Array.from(document.querySelectorAll(jobList)).slice(0, limit);
+    for (const node of nodes) {
+        const card = (container && node.closest(container)) || node;
+        const item = {};
+        for (const [field, selector] of Object.entries(fields)) {
+            const el = card.querySelector(selector) || (node.matches(selector) ? node : null);
+            item[field] = el ? clean(el.getAttribute('datetime') || el.textContent) : '';
+        }
+        let idNode = null;
+        if (idAttribute) {
+            idNode = node.hasAttribute(idAttribute) ? node
+                : card.hasAttribute(idAttribute) ? card
+                : card.querySelector(`[${idAttribute}]`);
+        }
+        item.external_id = idNode ? idNode.getAttribute(idAttribute) : '';
+        const linkNode = link ? (node.matches(link) ? node : card.querySelector(link)) : null;
+        item.url = linkNode ? linkNode.href : '';
+        cards.push(item);
+    }
+    return cards;
+}
+"""
+
+
+async def extract_listing_cards(page, job_list_selector: str, card_config: Dict[str, Any],
+                                limit: int) -> List[Dict[str, str]]:
+    """
+    Extract the visible fields of every job card on a listing page in one call
+    
+    Args:
+        page: Playwright page
+        job_list_selector: Selector matching one node per job card
+        card_config: The board's ``listing_cards`` config (container, link, id_attribute, fields)
+        limit: Maximum number of cards to extract
+    
+    Returns:
+        One dict per card with the configured fields plus ``external_id`` and ``url``
+    """
+    try:
+        return await page.evaluate(LISTING_CARDS_SCRIPT, {
+            'jobList': job_list_selector,
+            'container': card_config.get('container'),
+            'idAttribute': card_config.get('id_attribute'),
+            'link': card_config.get('link'),
+            'fields': card_config.get('fields', {}),
+            'limit': limit,
+        })
+    except Exception as e:
+        logger.error(f"Error extracting listing cards: {e}")
+        return []
+
+
+JSON_LD_SCRIPT = """
+() => Array.from(document.querySelectorAll('script[type="application/ld+json"]')).map((s) => s.textContent)
+"""
+
+
+async def extract_json_ld(page) -> List[str]:
+    """Return the text of every JSON-LD script on the page in one call"""
+    try:
+        return await page.evaluate(JSON_LD_SCRIPT)
+    except Exception as e:
+        logger.error(f"Error extracting JSON-LD: {e}")
+        return []
+
+
+# A generic page's title must contain one of these words to be taken for a job posting
+GENERIC_TITLE_KEYWORDS = ('developer', 'engineer', 'manager', 'analyst', 'specialist')
+
+
+GENERIC_JOB_SCRIPT = """
+({keywords, minTitleLength, maxDescriptionLength}) => {
+    const clean = (value) => (value || '').replace(/\\s+/g, ' ').trim();
+    const lines = (el) => (el.innerText || el.textContent || '').split('\\n').map(clean).filter(Boolean).join('\\n');
+    const meta = (name) => {
+        const el = document.querySelector(`meta[property="${name}"], meta[name="${name}"]`);
+        return el ? clean(el.getAttribute('content')) : '';
+    };
+    const isJobTitle = (text) => text.length > minTitleLength && text.length < 200
+        && keywords.some((keyword) => text.toLowerCase().includes(keyword));
+    const SKIP = 'nav, header, footer, aside, form, script, style, noscript, '
+        + '[role="navigation"], [role="banner"], [role="contentinfo"]';
+    
+    // Title: headings and title-like elements, then page metadata, then the first text of the page
+    const titles = [
+        ...Array.from(document.querySelectorAll('h1, h2, [class*="title" i], [id*="title" i]'), (el) => clean(el.textContent)),
+        meta('og:title'),
+        clean(document.title),
+    ];
+    let title = titles.find(isJobTitle) || '';
+    if (!title && document.body) {
+        const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+        for (let seen = 0; !title && seen < 200 && walker.nextNode(); seen++) {
+            const node = walker.currentNode;
+            if (node.parentElement && node.parentElement.closest('script, style, noscript')) continue;
+            const text = clean(node.textContent);
+            if (isJobTitle(text)) title = text;
+        }
+    }
+    
+    // Company: schema.org markup, then company-like elements, then the site name
+    let company = '';
+    for (const selector of [
+        '[itemprop="hiringOrganization"] [itemprop="name"]', '[itemprop="hiringOrganization"]',
+        '[class*="company" i]', '[class*="employer" i]',
+    ]) {
+        const el = document.querySelector(selector);
+        const text = el ? clean(el.textContent) : '';
+        if (text.length >= 2 && text.length <= 100) {
+            company = text;
+            break;
+        }
+    }
+    company = company || meta('og:site_name');
+    
+    // Main content, readability-style: text blocks score their parent (and half of it
+    // their grandparent) by length and commas; class names and link density adjust the scores
+    const POSITIVE = /article|body|content|entry|main|post|text|description|detail|job|posting|vacanc|position|role/i;
+    const NEGATIVE = /comment|footer|footnote|masthead|media|meta|nav|sidebar|sponsor|share|social|header|menu|related|cookie|banner|breadcrumb|widget|promo|subscribe|signup|modal/i;
+    const TAG_WEIGHTS = {ARTICLE: 10, MAIN: 10, DIV: 5, SECTION: 3, PRE: 3, TD: 3, BLOCKQUOTE: 3, UL: -3, OL: -3, LI: -3, TH: -5};
+    const classWeight = (el) => {
+        let weight = 0;
+        for (const value of [el.className, el.id]) {
+            if (typeof value !== 'string' || !value) continue;
+            if (NEGATIVE.test(value)) weight -= 25;
+            if (POSITIVE.test(value)) weight += 25;
+        }
+        return weight;
+    };
+    const scores = new Map();
+    const addScore = (el, score) => {
+        if (!el || el === document.body || el === document.documentElement) return;
+        if (!scores.has(el)) scores.set(el, (TAG_WEIGHTS[el.tagName] || 0) + classWeight(el));
+        scores.set(el, scores.get(el) + score);
+    };
+    for (const block of document.querySelectorAll('p, pre, td, li')) {
+        if (block.closest(SKIP)) continue;
+        const text = clean(block.textContent);
+        if (text.length < 25) continue;
+        const score = 1 + (text.match(/,/g) || []).length + Math.min(Math.floor(text.length / 100), 3);
+        addScore(block.parentElement, score);
+        addScore(block.parentElement && block.parentElement.parentElement, score / 2);
+    }
+    
+    const linkDensity = (el) => {
+        const length = clean(el.textContent).length || 1;
+        let linkLength = 0;
+        for (const link of el.querySelectorAll('a')) linkLength += clean(link.textContent).length;
+        return Math.min(linkLength / length, 1);
+    };
+    const finalScores = new Map();
+    let best = null;
+    for (const [el, score] of scores) {
+        const finalScore = score * (1 - linkDensity(el));
+        finalScores.set(el, finalScore);
+        if (!best || finalScore > finalScores.get(best)) best = el;
+    }
+    
+    // Sections of a posting are often siblings, so well-scored siblings of the best block join it
+    let description = '';
+    let contentScore = 0;
+    if (best && finalScores.get(best) > 0) {
+        contentScore = finalScores.get(best);
+        const threshold = Math.max(10, contentScore * 0.2);
+        const parts = [];
+        for (const sibling of best.parentElement ? best.parentElement.children : [best]) {
+            if (sibling === best || (finalScores.get(sibling) || 0) >= threshold) parts.push(lines(sibling));
+        }
+        description = parts.filter(Boolean).join('\\n\\n');
+    } else {
+        const main = document.querySelector('main, article, [role="main"]') || document.body;
+        description = main ? lines(main) : '';
+    }
+    
+    return {
+        title,
+        company,
+        description: description.slice(0, maxDescriptionLength),
+        content_score: Math.round(contentScore),
+    };
+}
+"""
+
+
+async def extract_generic_job(page, max_description_length: int,
+                              keywords: Tuple[str, ...] = GENERIC_TITLE_KEYWORDS,
+                              min_title_length: int = 10) -> Dict[str, Any]:
+    """
+    Pick the title, company and main content of a job page of an unknown board in one call
+    
+    The heuristics run in the page, so only the small result crosses CDP
+    instead of the whole body text.
+    
+    Args:
+        page: Playwright page
+        max_description_length: Characters of main content to return
+        keywords: Words a title must contain
+        min_title_length: Titles must be longer than this
+    
+    Returns:
+        ``title``, ``company`` and ``description`` (empty when not found) and the
+        readability score of the main content block (0 when no block stood out)
+    """
+    try:
+        return await page.evaluate(GENERIC_JOB_SCRIPT, {
+            'keywords': list(keywords),
+            'minTitleLength': min_title_length,
+            'maxDescriptionLength': max_description_length,
+        })
+    except Exception as e:
+        logger.error(f"Error extracting generic job fields: {e}")
+        return {}
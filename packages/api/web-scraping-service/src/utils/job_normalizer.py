@@ -73,6 +73,11 @@ class JobNormalizer:
             'internship': re.compile(r'\b(?:intern|internship|co-op|coop)\b', re.IGNORECASE),
         }
         
+        # Relative posting age pattern ("3 days ago", "30+ days ago", "5h", "2w")
+        self.relative_date_pattern = re.compile(
+            r'(\d+)\+?\s*(minutes?|mins?|m|hours?|hrs?|h|days?|d|weeks?|wks?|w|months?|mo|years?|yrs?|y)\b'
+        )
+        
         # Skills extraction pattern
         self.skills_pattern = re.compile(
             r'\b(?:' + '|'.join(re.escape(skill) for skill in self.config.skill_keywords) + r')\b',
@@ -100,18 +105,19 @@ class JobNormalizer:
             # Normalize company
             normalized['company'] = self._normalize_company(raw_data.get('company', ''))
             
-            # Normalize location and determine remote type
+            # Normalize location and determine remote type, unless the source already provided it
             location, remote_type = self._normalize_location(raw_data.get('location', ''))
             normalized['location'] = location
-            normalized['remote_type'] = remote_type
+            normalized['remote_type'] = raw_data.get('remote_type') or remote_type
             
-            # Extract and normalize salary
-            salary_info = self._extract_salary_info(raw_data.get('description', ''))
-            if salary_info.min_salary:
-                normalized['salary_min'] = salary_info.min_salary
-            if salary_info.max_salary:
-                normalized['salary_max'] = salary_info.max_salary
-            normalized['salary_currency'] = salary_info.currency
+            # Extract and normalize salary, unless the source already provided exact numbers
+            if not raw_data.get('salary_min') and not raw_data.get('salary_max'):
+                salary_info = self._extract_salary_info(raw_data.get('description', ''))
+                if salary_info.min_salary:
+                    normalized['salary_min'] = salary_info.min_salary
+                if salary_info.max_salary:
+                    normalized['salary_max'] = salary_info.max_salary
+                normalized['salary_currency'] = salary_info.currency
             
             # Determine experience level
             normalized['experience_level'] = self._determine_experience_level(
@@ -119,8 +125,8 @@ class JobNormalizer:
                 raw_data.get('description', '')
             )
             
-            # Determine employment type
-            normalized['employment_type'] = self._determine_employment_type(
+            # Determine employment type, unless the source already provided it
+            normalized['employment_type'] = raw_data.get('employment_type') or self._determine_employment_type(
                 raw_data.get('title', ''), 
                 raw_data.get('description', '')
             )
@@ -136,7 +142,10 @@ class JobNormalizer:
             
             # Normalize dates
             normalized['posted_date'] = self._normalize_date(raw_data.get('posted_date'))
-            normalized['expires_date'] = self._calculate_expiry_date(normalized['posted_date'])
+            normalized['expires_date'] = (
+                self._normalize_date(raw_data['expires_date']) if raw_data.get('expires_date')
+                else self._calculate_expiry_date(normalized['posted_date'])
+            )
             
             # Calculate quality score
             normalized['quality_score'] = self._calculate_quality_score(normalized)
@@ -335,25 +344,64 @@ class JobNormalizer:
             return date_input
         
         if isinstance(date_input, str):
-            # Try to parse common date formats
-            date_formats = [
-                "%Y-%m-%d",
-                "%Y-%m-%d %H:%M:%S",
-                "%m/%d/%Y",
-                "%d/%m/%Y",
-                "%Y-%m-%dT%H:%M:%S",
-                "%Y-%m-%dT%H:%M:%SZ"
-            ]
-            
-            for fmt in date_formats:
-                try:
-                    return datetime.strptime(date_input, fmt)
-                except ValueError:
-                    continue
+            parsed_date = self.parse_posted_date(date_input)
+            if parsed_date:
+                return parsed_date
         
         # Default to current time
         return datetime.now()
     
+    def parse_posted_date(self, text: str) -> Optional[datetime]:
+        """
+        Parse a posted date string, either absolute or a relative age
+        as shown on listing cards, e.g. "3 days ago", "2w", "Just posted"
+        
+        Returns:
+            Parsed datetime, or None if the text is not a recognizable date
+        """
+        if not text:
+            return None
+        
+        text = text.strip()
+        
+        # Try to parse common date formats
+        date_formats = [
+            "%Y-%m-%d",
+            "%Y-%m-%d %H:%M:%S",
+            "%m/%d/%Y",
+            "%d/%m/%Y",
+            "%Y-%m-%dT%H:%M:%S",
+            "%Y-%m-%dT%H:%M:%SZ"
+        ]
+        
+        for fmt in date_formats:
+            try:
+                return datetime.strptime(text, fmt)
+            except ValueError:
+                continue
+        
+        text = text.lower()
+        
+        if any(term in text for term in ['just posted', 'today', 'just now', 'active today']):
+            return datetime.now()
+        if 'yesterday' in text:
+            return datetime.now() - timedelta(days=1)
+        
+        match = self.relative_date_pattern.search(text)
+        if not match:
+            return None
+        
+        amount = int(match.group(1))
+        unit = match.group(2)
+        unit_days = {'m': 1 / 1440, 'h': 1 / 24, 'd': 1, 'w': 7, 'mo': 30, 'y': 365}
+        
+        for prefix in ('mo', 'mi', 'h', 'd', 'w', 'y', 'm'):
+            if unit.startswith(prefix):
+                days = unit_days['m' if prefix == 'mi' else prefix]
+                return datetime.now() - timedelta(days=amount * days)
+        
+        return None
+    
     def _calculate_expiry_date(self, posted_date: Optional[datetime]) -> Optional[datetime]:
         """Calculate job expiry date (default 30 days from posted date)"""
         if not posted_date:
@@ -0,0 +1,114 @@
+"""
+Persistent index of jobs seen in previous crawls
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Any
+
+from loguru import logger
+
+from ..config.scraper_config import ScraperConfig
+
+
+class KnownJobsStore:
+    """
+    Remembers a fingerprint of every job seen per board so later crawls can
+    tell new and changed postings apart from ones already stored.
+    
+    Jobs not seen for ``retention_days`` are dropped when the index is saved,
+    so it tracks the postings still listed rather than every one ever seen.
+    """
+    
+    NEW = "new"
+    CHANGED = "changed"
+    UNCHANGED = "unchanged"
+    
+    def __init__(self, storage_path: str, filename: str = "known_jobs.json", retention_days: Optional[int] = None):
+        self.file_path = os.path.join(storage_path, filename)
+        self.retention_days = retention_days
+        self.jobs: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._dirty = False
+        self.load()
+    
+    @classmethod
+    def from_config(cls, config: ScraperConfig, storage_path: Optional[str] = None) -> 'KnownJobsStore':
+        """Create a store under the config's data path (or storage_path) with its retention"""
+        return cls(storage_path or config.data_storage_path, retention_days=config.known_jobs_retention_days)
+    
+    def load(self):
+        """Load the index from disk"""
+        try:
+            if os.path.exists(self.file_path):
+                with open(self.file_path, 'r', encoding='utf-8') as f:
+                    self.jobs = json.load(f)
+                logger.info(f"Loaded {sum(len(jobs) for jobs in self.jobs.values())} known jobs from {self.file_path}")
+        except Exception as e:
+            logger.error(f"Error loading known jobs from {self.file_path}: {e}")
+            self.jobs = {}
+    
+    def save(self):
+        """Write the index to disk if it changed"""
+        if not self._dirty:
+            return
+        
+        self.prune()
+        try:
+            os.makedirs(os.path.dirname(self.file_path) or '.', exist_ok=True)
+            tmp_path = f"{self.file_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.jobs, f)
+            os.replace(tmp_path, self.file_path)
+            self._dirty = False
+        except Exception as e:
+            logger.error(f"Error saving known jobs to {self.file_path}: {e}")
+    
+    def prune(self) -> int:
+        """
+        Drop jobs last seen longer than retention_days ago
+        
+        Returns:
+            Number of jobs dropped
+        """
+        if not self.retention_days:
+            return 0
+        
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).isoformat()
+        pruned = 0
+        for board_name in list(self.jobs):
+            board_jobs = self.jobs[board_name]
+            expired = [external_id for external_id, known in board_jobs.items() if known.get('last_seen', '') < cutoff]
+            for external_id in expired:
+                del board_jobs[external_id]
+            pruned += len(expired)
+            if not board_jobs:
+                del self.jobs[board_name]
+        
+        if pruned:
+            logger.info(f"Dropped {pruned} known jobs not seen for {self.retention_days} days")
+        return pruned
+    
+    @staticmethod
+    def fingerprint(job: Dict[str, Any]) -> str:
+        """Hash the fields that identify a visible change to a posting (relative ages are left out)"""
+        key = '|'.join(str(job.get(field) or '') for field in ('title', 'company', 'location'))
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+    
+    def classify(self, board_name: str, external_id: str, fingerprint: str) -> str:
+        """Return NEW, CHANGED or UNCHANGED for a job"""
+        known = self.jobs.get(board_name, {}).get(external_id)
+        if not known:
+            return self.NEW
+        if known.get('fingerprint') != fingerprint:
+            return self.CHANGED
+        return self.UNCHANGED
+    
+    def record(self, board_name: str, external_id: str, fingerprint: str):
+        """Remember a job and its current fingerprint"""
+        self.jobs.setdefault(board_name, {})[external_id] = {
+            'fingerprint': fingerprint,
+            'last_seen': datetime.now().isoformat(),
+        }
+        self._dirty = True
@@ -0,0 +1,119 @@
+"""
+Prometheus metrics of scraper throughput and latency, served over HTTP
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from loguru import logger
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, start_http_server
+
+from ..config.scraper_config import ScraperConfig, scraper_config
+
+
+# Buckets in seconds, from cached pages and fast selectors up to slow navigations
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class ScraperMetrics:
+    """
+    Counters, histograms and gauges of the scraping pipeline, kept in their own
+    registry and exposed at ``http://<metrics_host>:<metrics_port>/metrics``
+    """
+    
+    def __init__(self, registry: Optional[CollectorRegistry] = None, namespace: str = 'sparkapply_scraper'):
+        self.registry = registry or CollectorRegistry()
+        self.server_port: Optional[int] = None
+        
+        def counter(name, documentation, labels):
+            return Counter(name, documentation, labels, namespace=namespace, registry=self.registry)
+        
+        def histogram(name, documentation, labels):
+            return Histogram(
+                name, documentation, labels, namespace=namespace, registry=self.registry, buckets=LATENCY_BUCKETS
+            )
+        
+        def gauge(name, documentation, labels=()):
+            return Gauge(name, documentation, labels, namespace=namespace, registry=self.registry)
+        
+        self.pages_fetched = counter('pages_fetched', 'Pages handled, by board, page label and fetch tier',
+                                     ['board', 'label', 'tier'])
+        self.jobs_extracted = counter('jobs_extracted', 'Jobs extracted, by board and extraction method',
+                                      ['board', 'method'])
+        self.jobs_normalized = counter('jobs_normalized', 'Jobs normalized and pushed, by board', ['board'])
+        self.errors = counter('handler_errors', 'Failed requests and handler errors, by handler label', ['handler'])
+        
+        self.navigation_seconds = histogram('navigation_seconds', 'Time from navigation start to a loaded page',
+                                            ['board'])
+        self.page_wait_seconds = histogram('page_wait_seconds', 'Time spent waiting for a page to be ready, by outcome',
+                                           ['board', 'page_type', 'outcome'])
+        self.extraction_seconds = histogram('extraction_seconds', 'Time spent extracting fields from a page',
+                                            ['board', 'method'])
+        self.normalization_seconds = histogram('normalization_seconds', 'Time spent normalizing a batch of jobs',
+                                               ['board'])
+        
+        self.queue_depth = gauge('queue_depth', 'Requests enqueued but not yet handled')
+        self.http_tasks_in_flight = gauge('http_tasks_in_flight', 'Detail pages being fetched over HTTP')
+        self.browsers = gauge('browser_pool_browsers', 'Browsers in the pool, by state', ['state'])
+        self.open_pages = gauge('browser_pool_open_pages', 'Pages open across all browsers')
+        self.desired_concurrency = gauge('desired_concurrency', 'Concurrency the autoscaled pool is aiming for')
+        self.current_concurrency = gauge('current_concurrency', 'Requests the autoscaled pool is running')
+        self.concurrency_scalings = counter('concurrency_scalings', 'Changes of desired concurrency, by direction',
+                                            ['direction'])
+    
+    @contextmanager
+    def time(self, histogram: Histogram, **labels) -> Iterator[None]:
+        """Observe the duration of the block in a histogram"""
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            histogram.labels(**labels).observe(time.perf_counter() - start_time)
+    
+    def record_error(self, handler: str):
+        """Count a failed request or handler error"""
+        self.errors.labels(handler=handler).inc()
+    
+    def sample_browser_pool(self, browser_pool):
+        """Update the browser pool gauges"""
+        self.browsers.labels(state='active').set(len(browser_pool.active_browsers))
+        self.browsers.labels(state='inactive').set(len(browser_pool.inactive_browsers))
+        self.open_pages.set(sum(browser.pages_count for browser in browser_pool.active_browsers))
+    
+    def sample_concurrency(self, desired: int, current: int):
+        """Update the autoscaled pool gauges"""
+        self.desired_concurrency.set(desired)
+        self.current_concurrency.set(current)
+    
+    async def sample_queue(self, request_manager):
+        """Update the queue depth gauge from a crawlee request manager"""
+        total = await request_manager.get_total_count()
+        handled = await request_manager.get_handled_count()
+        self.queue_depth.set(max(total - handled, 0))
+    
+    def serve(self, port: int, host: str = '0.0.0.0'):
+        """Serve the registry at /metrics in a background thread (once per process)"""
+        if self.server_port is not None:
+            return
+        
+        try:
+            start_http_server(port, addr=host, registry=self.registry)
+            self.server_port = port
+            logger.info(f"Serving scraper metrics at http://{host}:{port}/metrics")
+        except OSError as e:
+            logger.error(f"Could not serve scraper metrics on {host}:{port}: {e}")
+
+
+_shared_metrics: Optional[ScraperMetrics] = None
+
+
+def get_shared_metrics(config: Optional[ScraperConfig] = None) -> ScraperMetrics:
+    """Get the process-wide metrics, serving them when monitoring is enabled"""
+    global _shared_metrics
+    config = config or scraper_config
+    if _shared_metrics is None:
+        _shared_metrics = ScraperMetrics()
+    if config.enable_monitoring:
+        _shared_metrics.serve(config.metrics_port, config.metrics_host)
+    return _shared_metrics
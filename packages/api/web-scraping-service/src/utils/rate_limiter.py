@@ -0,0 +1,181 @@
+"""
+Per-domain async rate limiting shared by all scraping engines
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Any, Tuple
+from urllib.parse import urlparse
+
+from loguru import logger
+
+from ..config.scraper_config import ScraperConfig, scraper_config
+
+
+# Status codes that mean the site wants us to slow down
+THROTTLE_STATUS_CODES = {429, 503}
+
+
+class RateLimitDeferred(Exception):
+    """Raised by DomainRateLimiter.acquire when the domain's next free slot is further away than allowed"""
+    
+    def __init__(self, url: str, wait: float):
+        super().__init__(f"Next request slot for {url} is {wait:.1f}s away")
+        self.url = url
+        self.wait = wait
+
+
+@dataclass
+class DomainBucket:
+    """
+    Token bucket state for a single domain
+    
+    Tokens are valued at ``last_refill``, which lies in the future while the
+    domain is blocked after a 429; reserved slots drive them below zero.
+    """
+    interval: float
+    tokens: float
+    last_refill: float
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class DomainRateLimiter:
+    """
+    Token bucket per domain with optional jitter.
+    
+    Requests to the same domain are spaced ``delay`` seconds apart (allowing
+    ``burst`` back-to-back requests), while different domains never wait on each
+    other. A 429/503 response doubles that domain's interval (up to ``max_delay``)
+    and honors Retry-After; successful responses gradually restore the base delay.
+    
+    Callers reserve their slot under the domain's lock and sleep outside it, so
+    each waits only for its own slot and can refuse one that is too far away.
+    """
+    
+    def __init__(self, delay: float, randomize: bool = True, burst: int = 1,
+                 max_delay: float = 60.0, jitter_ratio: float = 0.5, recovery_factor: float = 0.9):
+        self.base_delay = max(delay, 0.0)
+        self.randomize = randomize
+        self.burst = max(burst, 1)
+        self.max_delay = max(max_delay, self.base_delay)
+        self.jitter_ratio = jitter_ratio
+        self.recovery_factor = recovery_factor
+        self.buckets: Dict[str, DomainBucket] = {}
+        self.stats = {
+            'requests': 0,
+            'deferred': 0,
+            'throttled_responses': 0,
+            'total_wait_seconds': 0.0,
+        }
+    
+    @classmethod
+    def from_config(cls, config: ScraperConfig) -> 'DomainRateLimiter':
+        """Create a limiter from the scraper's rate limiting settings"""
+        return cls(
+            delay=config.delay_between_requests,
+            randomize=config.randomize_delay,
+            burst=config.rate_limit_burst,
+            max_delay=config.rate_limit_max_delay,
+        )
+    
+    @staticmethod
+    def _domain(url: str) -> str:
+        """Bucket key for a URL"""
+        host = (urlparse(url).hostname or '').lower()
+        return host[4:] if host.startswith('www.') else host
+    
+    def _bucket(self, domain: str) -> DomainBucket:
+        """Get or create a domain's bucket, starting full"""
+        bucket = self.buckets.get(domain)
+        if bucket is None:
+            bucket = DomainBucket(interval=self.base_delay, tokens=float(self.burst), last_refill=time.monotonic())
+            self.buckets[domain] = bucket
+        return bucket
+    
+    def _refill(self, bucket: DomainBucket, now: float):
+        """Add the tokens accrued since the last refill (none while the domain is blocked)"""
+        if now <= bucket.last_refill:
+            return
+        if bucket.interval <= 0:
+            bucket.tokens = float(self.burst)
+        else:
+            bucket.tokens = min(float(self.burst), bucket.tokens + (now - bucket.last_refill) / bucket.interval)
+        bucket.last_refill = now
+    
+    async def acquire(self, url: str, max_wait: Optional[float] = None) -> float:
+        """
+        Reserve the next request slot of the URL's domain and wait for it
+        
+        Args:
+            max_wait: Longest acceptable wait; a slot further away is not reserved
+        
+        Returns:
+            Seconds spent waiting
+        
+        Raises:
+            RateLimitDeferred: if the slot is more than max_wait seconds away
+        """
+        bucket = self._bucket(self._domain(url))
+        
+        async with bucket.lock:
+            now = time.monotonic()
+            self._refill(bucket, now)
+            
+            wait = max(bucket.last_refill - now, 0.0) + max(1 - bucket.tokens, 0.0) * bucket.interval
+            if self.randomize and bucket.interval > 0:
+                wait += random.uniform(0, bucket.interval * self.jitter_ratio)
+            if max_wait is not None and wait > max_wait:
+                self.stats['deferred'] += 1
+                raise RateLimitDeferred(url, wait)
+            
+            bucket.tokens -= 1
+            
+        if wait > 0:
+            await asyncio.sleep(wait)
+        
+        self.stats['requests'] += 1
+        self.stats['total_wait_seconds'] += wait
+        return wait
+    
+    def record_response(self, url: str, status: int, retry_after: Optional[str] = None):
+        """Adapt a domain's pace to the response it returned"""
+        domain = self._domain(url)
+        bucket = self._bucket(domain)
+        
+        if status in THROTTLE_STATUS_CODES:
+            self.stats['throttled_responses'] += 1
+            bucket.interval = min(max(bucket.interval * 2, 1.0), self.max_delay)
+            
+            # The first slot after the pause goes to the earliest caller, the rest follow at the new interval
+            pause = bucket.interval
+            if retry_after and retry_after.strip().isdigit():
+                pause = max(pause, float(retry_after.strip()))
+            bucket.tokens = 1.0
+            bucket.last_refill = max(bucket.last_refill, time.monotonic() + pause)
+            
+            logger.warning(f"Throttled by {domain} (HTTP {status}), slowing to one request per {bucket.interval:.1f}s")
+        
+        elif 200 <= status < 400 and bucket.interval > self.base_delay:
+            bucket.interval = max(self.base_delay, bucket.interval * self.recovery_factor)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get wait and throttling counters plus the current interval per domain"""
+        return {
+            **self.stats,
+            'domain_intervals': {domain: round(bucket.interval, 2) for domain, bucket in self.buckets.items()},
+        }
+
+
+# Shared limiters keyed by the rate limiting settings they were created with
+_shared_rate_limiters: Dict[Tuple[float, bool, int, float], DomainRateLimiter] = {}
+
+
+def get_shared_rate_limiter(config: Optional[ScraperConfig] = None) -> DomainRateLimiter:
+    """Get the process-wide limiter of a config's settings, so every engine paces the same domains together"""
+    config = config or scraper_config
+    key = (config.delay_between_requests, config.randomize_delay, config.rate_limit_burst, config.rate_limit_max_delay)
+    if key not in _shared_rate_limiters:
+        _shared_rate_limiters[key] = DomainRateLimiter.from_config(config)
+    return _shared_rate_limiters[key]
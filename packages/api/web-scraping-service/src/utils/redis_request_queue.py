@@ -0,0 +1,264 @@
+"""
+Redis-backed request queue shared by several scraper processes
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Sequence, Union
+
+from crawlee import Request
+from crawlee.request_loaders import RequestManager
+from crawlee.storage_clients.models import ProcessedRequest
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+
+from ..config.scraper_config import ScraperConfig
+
+
+class RedisRequestQueue(RequestManager):
+    """
+    One crawl frontier in Redis that any number of CrawleeJobScraper workers pull from.
+    
+    Keys under ``<prefix>:<name>``:
+        pending   list of unique keys waiting to be fetched
+        requests  hash of unique key to the serialized request
+        seen      set of every unique key ever enqueued, so workers never duplicate work
+        leases    sorted set of unique keys being processed, scored by lease expiry
+        handled   set of completed unique keys
+    
+    A fetched request is leased for ``lease_timeout`` seconds, in the same
+    transaction that takes it off the pending list. If its worker dies before
+    marking it handled, the lease expires and the next fetch by any worker
+    puts it back at the front of the queue. Only plain list, set,
+    hash and sorted-set commands plus WATCH/MULTI transactions are used, so
+    any redis.asyncio compatible client works, including an in-process fake
+    such as fakeredis.aioredis.FakeRedis.
+    """
+    
+    def __init__(self, client: Redis, name: str = 'frontier', lease_timeout: float = 300.0,
+                 prefix: str = 'sparkapply:crawl'):
+        self.client = client
+        self.name = name
+        self.lease_timeout = lease_timeout
+        self.keys = {
+            key: f"{prefix}:{name}:{key}" for key in ('pending', 'requests', 'seen', 'leases', 'handled')
+        }
+        self.stats = {
+            'added': 0,
+            'duplicates': 0,
+            'fetched': 0,
+            'handled': 0,
+            'reclaimed': 0,
+            'leases_expired': 0,
+        }
+    
+    @classmethod
+    def from_config(cls, config: ScraperConfig, client: Optional[Redis] = None) -> 'RedisRequestQueue':
+        """Create the queue on redis_url (or the given client) with the distributed queue settings"""
+        return cls(
+            client=client or Redis.from_url(config.redis_url),
+            name=config.distributed_queue_name,
+            lease_timeout=config.distributed_lease_timeout,
+        )
+    
+    @staticmethod
+    def _key(value: Union[str, bytes]) -> str:
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+    
+    async def add_request(self, request: Union[str, Request], *, forefront: bool = False) -> ProcessedRequest:
+        """Enqueue a request unless some worker already enqueued it"""
+        return (await self._add_batch([self._transform_request(request)], forefront))[0]
+    
+    async def add_requests(self, requests: Sequence[Union[str, Request]], *, forefront: bool = False,
+                           **kwargs) -> None:
+        """Enqueue requests in one round trip for deduplication and one for storage"""
+        await self._add_batch(self._transform_requests(requests), forefront)
+    
+    async def _add_batch(self, requests: List[Request], forefront: bool) -> List[ProcessedRequest]:
+        if not requests:
+            return []
+        
+        # SADD tells exactly one worker that a key is new
+        pipe = self.client.pipeline(transaction=False)
+        for request in requests:
+            pipe.sadd(self.keys['seen'], request.unique_key)
+            pipe.sismember(self.keys['handled'], request.unique_key)
+        replies = await pipe.execute()
+        
+        processed = []
+        pipe = self.client.pipeline(transaction=True)
+        for index, request in enumerate(requests):
+            added, handled = replies[2 * index], replies[2 * index + 1]
+            processed.append(ProcessedRequest(
+                unique_key=request.unique_key,
+                was_already_present=not added,
+                was_already_handled=bool(handled),
+            ))
+            if not added:
+                self.stats['duplicates'] += 1
+                continue
+            
+            pipe.hset(self.keys['requests'], request.unique_key, request.model_dump_json())
+            if forefront:
+                pipe.lpush(self.keys['pending'], request.unique_key)
+            else:
+                pipe.rpush(self.keys['pending'], request.unique_key)
+            self.stats['added'] += 1
+        await pipe.execute()
+        
+        return processed
+    
+    async def _requeue_expired_leases(self) -> int:
+        """Put requests whose worker died before finishing them back at the front of the queue"""
+        expired = await self.client.zrangebyscore(self.keys['leases'], '-inf', time.time())
+        requeued = 0
+        for unique_key in expired:
+            # WATCH lets exactly one worker move each expired request, in one transaction
+            async with self.client.pipeline(transaction=True) as pipe:
+                try:
+                    await pipe.watch(self.keys['leases'])
+                    if await pipe.zscore(self.keys['leases'], unique_key) is None:
+                        continue
+                    
+                    pipe.multi()
+                    pipe.zrem(self.keys['leases'], unique_key)
+                    pipe.lpush(self.keys['pending'], unique_key)
+                    await pipe.execute()
+                    requeued += 1
+                except WatchError:
+                    continue
+        
+        if requeued:
+            self.stats['leases_expired'] += requeued
+            logger.warning(f"Requeued {requeued} requests whose lease expired on {self.name}")
+        return requeued
+    
+    async def _lease_next(self) -> Optional[str]:
+        """
+        Move the next pending key to the leases in one transaction, so a worker
+        dying between the two steps cannot lose the request
+        
+        WATCH retries the move when another worker changes the pending list first.
+        """
+        async with self.client.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(self.keys['pending'])
+                    unique_key = await pipe.lindex(self.keys['pending'], 0)
+                    if unique_key is None:
+                        return None
+                    unique_key = self._key(unique_key)
+                    
+                    pipe.multi()
+                    pipe.lpop(self.keys['pending'])
+                    pipe.zadd(self.keys['leases'], {unique_key: time.time() + self.lease_timeout})
+                    await pipe.execute()
+                    return unique_key
+                except WatchError:
+                    continue
+    
+    async def fetch_next_request(self) -> Optional[Request]:
+        """Lease the next pending request, or return None when nothing is pending"""
+        await self._requeue_expired_leases()
+        
+        while True:
+            unique_key = await self._lease_next()
+            if unique_key is None:
+                return None
+            
+            data = await self.client.hget(self.keys['requests'], unique_key)
+            if data is None:
+                # Handled by another worker after its lease had expired
+                await self.client.zrem(self.keys['leases'], unique_key)
+                continue
+            
+            self.stats['fetched'] += 1
+            return Request.model_validate_json(data)
+    
+    async def mark_request_as_handled(self, request: Request) -> Optional[ProcessedRequest]:
+        """Release the request's lease and record it as handled"""
+        if request.handled_at is None:
+            request.handled_at = datetime.now(timezone.utc)
+        
+        pipe = self.client.pipeline(transaction=True)
+        pipe.zrem(self.keys['leases'], request.unique_key)
+        pipe.sadd(self.keys['handled'], request.unique_key)
+        pipe.hdel(self.keys['requests'], request.unique_key)
+        await pipe.execute()
+        
+        self.stats['handled'] += 1
+        return ProcessedRequest(unique_key=request.unique_key, was_already_present=True, was_already_handled=True)
+    
+    async def reclaim_request(self, request: Request, *, forefront: bool = False) -> Optional[ProcessedRequest]:
+        """Return a failed request to the queue with its updated retry state"""
+        pipe = self.client.pipeline(transaction=True)
+        pipe.hset(self.keys['requests'], request.unique_key, request.model_dump_json())
+        pipe.zrem(self.keys['leases'], request.unique_key)
+        if forefront:
+            pipe.lpush(self.keys['pending'], request.unique_key)
+        else:
+            pipe.rpush(self.keys['pending'], request.unique_key)
+        await pipe.execute()
+        
+        self.stats['reclaimed'] += 1
+        return ProcessedRequest(unique_key=request.unique_key, was_already_present=True, was_already_handled=False)
+    
+    async def is_empty(self) -> bool:
+        """True when no request is pending and no lease has expired"""
+        pending = await self.client.llen(self.keys['pending'])
+        expired = await self.client.zcount(self.keys['leases'], '-inf', time.time())
+        return pending == 0 and expired == 0
+    
+    async def is_finished(self) -> bool:
+        """True when no request is pending or leased by any worker"""
+        pending = await self.client.llen(self.keys['pending'])
+        leased = await self.client.zcard(self.keys['leases'])
+        return pending == 0 and leased == 0
+    
+    async def get_handled_count(self) -> int:
+        return await self.client.scard(self.keys['handled'])
+    
+    async def get_total_count(self) -> int:
+        return await self.client.scard(self.keys['seen'])
+    
+    async def drop(self) -> None:
+        """Delete the frontier and its deduplication state"""
+        await self.client.delete(*self.keys.values())
+    
+    async def reset_if_finished(self) -> bool:
+        """
+        Drop the frontier if a previous sweep completed, so its seen set does not
+        swallow the seeds of the next one
+        
+        WATCH makes this a no-op when another worker enqueues or leases concurrently.
+        """
+        async with self.client.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(self.keys['pending'], self.keys['leases'], self.keys['seen'])
+                pending = await pipe.llen(self.keys['pending'])
+                leased = await pipe.zcard(self.keys['leases'])
+                seen = await pipe.scard(self.keys['seen'])
+                if pending or leased or not seen:
+                    return False
+                
+                pipe.multi()
+                pipe.delete(*self.keys.values())
+                await pipe.execute()
+            except WatchError:
+                return False
+        
+        logger.info(f"Previous sweep of {self.name} finished ({seen} requests), starting a new one")
+        return True
+    
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get this worker's counters and the shared frontier's size"""
+        pending = await self.client.llen(self.keys['pending'])
+        leased = await self.client.zcard(self.keys['leases'])
+        return {
+            **self.stats,
+            'pending': pending,
+            'leased': leased,
+            'handled_total': await self.get_handled_count(),
+            'seen_total': await self.get_total_count(),
+        }
@@ -0,0 +1,295 @@
+"""
+Record-and-replay of crawl traffic, so scrapers can be benchmarked and
+regression-tested against a fixed corpus without touching the network
+"""
+
+import hashlib
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Any, Mapping
+from urllib.parse import parse_qs, quote, urlencode, urljoin, urlsplit, urlunsplit
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from loguru import logger
+
+
+# Bodies are archived decoded, so transfer headers of the original response no longer apply
+DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+# Playwright resource types worth archiving (pages, API responses and redirects between them)
+RECORDED_RESOURCE_TYPES = {'document', 'xhr', 'fetch'}
+
+
+class ReplayArchive:
+    """
+    Directory of recorded responses: ``index.json`` maps method and URL to the
+    status, headers and SHA-256 of the body, and bodies live under ``bodies/``.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.index_path = os.path.join(path, 'index.json')
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.stats = {
+            'recorded': 0,
+            'served': 0,
+            'missed': 0,
+        }
+        self.load()
+    
+    @staticmethod
+    def key(method: str, url: str) -> str:
+        """Lookup key of a request: method plus URL with sorted query and no fragment"""
+        parts = urlsplit(url)
+        query = urlencode(sorted(parse_qs(parts.query, keep_blank_values=True).items()), doseq=True)
+        return f"{method.upper()} {urlunsplit((parts.scheme, parts.netloc.lower(), parts.path or '/', query, ''))}"
+    
+    def load(self):
+        """Load the index from disk"""
+        try:
+            if os.path.exists(self.index_path):
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self.records = json.load(f)
+                logger.info(f"Loaded {len(self.records)} recorded responses from {self.path}")
+        except Exception as e:
+            logger.error(f"Error loading replay archive {self.path}: {e}")
+            self.records = {}
+    
+    def save(self):
+        """Write the index to disk"""
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.records, f)
+            os.replace(tmp_path, self.index_path)
+        except Exception as e:
+            logger.error(f"Error saving replay archive {self.path}: {e}")
+    
+    def add(self, method: str, url: str, status: int, headers: Mapping[str, str], body: bytes):
+        """Archive one response"""
+        body_hash = hashlib.sha256(body).hexdigest()
+        body_path = os.path.join(self.path, 'bodies', body_hash)
+        if not os.path.exists(body_path):
+            os.makedirs(os.path.dirname(body_path), exist_ok=True)
+            with open(body_path, 'wb') as f:
+                f.write(body)
+        
+        self.records[self.key(method, url)] = {
+            'url': url,
+            'status': status,
+            'headers': {
+                key.lower(): value for key, value in headers.items() if key.lower() not in DROPPED_HEADERS
+            },
+            'body_hash': body_hash,
+        }
+        self.stats['recorded'] += 1
+    
+    def get(self, method: str, url: str) -> Optional[Dict[str, Any]]:
+        """Get a recorded response with its body, or None if the request was never recorded"""
+        record = self.records.get(self.key(method, url))
+        if record is None:
+            self.stats['missed'] += 1
+            logger.debug(f"No recorded response for {method} {url}")
+            return None
+        
+        with open(os.path.join(self.path, 'bodies', record['body_hash']), 'rb') as f:
+            body = f.read()
+        
+        self.stats['served'] += 1
+        return {**record, 'body': body}
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get record and replay counters"""
+        return {**self.stats, 'records': len(self.records)}
+
+
+class ResponseRecorder:
+    """Captures responses from Playwright pages, requests sessions and httpx clients into an archive"""
+    
+    def __init__(self, archive: ReplayArchive):
+        self.archive = archive
+    
+    def attach(self, page):
+        """Record the page's documents, API responses and redirects"""
+        if getattr(page, '_sparkapply_recorder_attached', False):
+            return
+        
+        async def on_response(response):
+            try:
+                if response.request.resource_type not in RECORDED_RESOURCE_TYPES:
+                    return
+                try:
+                    body = await response.body()
+                except Exception:
+                    # Redirects and aborted responses have no body
+                    body = b''
+                self.archive.add(
+                    response.request.method, response.url, response.status, await response.all_headers(), body
+                )
+            except Exception as e:
+                logger.debug(f"Error recording {response.url}: {e}")
+        
+        page.on('response', on_response)
+        page._sparkapply_recorder_attached = True
+    
+    def record_requests_response(self, response: requests.Response, *args, **kwargs):
+        """requests response hook: record the response and any redirects that led to it"""
+        for hop in [*response.history, response]:
+            self.archive.add(hop.request.method, hop.url, hop.status_code, hop.headers, hop.content)
+    
+    async def record_httpx_response(self, response: httpx.Response):
+        """httpx response event hook (called for every redirect hop as well)"""
+        await response.aread()
+        self.archive.add(response.request.method, str(response.url), response.status_code, response.headers, response.content)
+
+
+class ReplayAdapter(BaseAdapter):
+    """requests transport adapter that answers from the archive (404 for unrecorded requests)"""
+    
+    def __init__(self, archive: ReplayArchive):
+        super().__init__()
+        self.archive = archive
+    
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        record = self.archive.get(request.method, request.url)
+        
+        response = requests.Response()
+        response.status_code = record['status'] if record else 404
+        response.headers = CaseInsensitiveDict(record['headers'] if record else {})
+        response._content = record['body'] if record else b''
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.reason = 'Replayed' if record else 'Not Recorded'
+        return response
+    
+    def close(self):
+        pass
+
+
+class ReplayRouter:
+    """Routes Playwright, requests and httpx traffic to a replay archive instead of the network"""
+    
+    def __init__(self, archive: ReplayArchive):
+        self.archive = archive
+    
+    async def apply(self, page):
+        """Fulfill every page request from the archive and abort the ones never recorded"""
+        if getattr(page, '_sparkapply_replay_installed', False):
+            return
+        
+        async def handle_route(route):
+            request = route.request
+            try:
+                record = self.archive.get(request.method, request.url)
+                if record is None:
+                    await route.abort()
+                    return
+                await route.fulfill(status=record['status'], headers=record['headers'], body=record['body'])
+            except Exception as e:
+                logger.debug(f"Replay routing failed for {request.url}: {e}")
+                # Never let an unanswered request reach the network
+                await route.abort()
+        
+        await page.route('**/*', handle_route)
+        page._sparkapply_replay_installed = True
+    
+    def mount(self, session: requests.Session):
+        """Serve a requests session from the archive"""
+        adapter = ReplayAdapter(self.archive)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+    
+    def httpx_transport(self) -> httpx.MockTransport:
+        """httpx transport that answers from the archive"""
+        def handler(request: httpx.Request) -> httpx.Response:
+            record = self.archive.get(request.method, str(request.url))
+            if record is None:
+                return httpx.Response(404)
+            return httpx.Response(record['status'], headers=record['headers'], content=record['body'])
+        
+        return httpx.MockTransport(handler)
+
+
+class ReplayServer:
+    """
+    Local HTTP server that serves archived pages at ``/replay?url=<original url>``
+    
+    Used for clients without request interception (Selenium): navigate to
+    ``url_for(url)`` instead of the original URL. Redirects are rewritten to
+    stay on the server.
+    """
+    
+    def __init__(self, archive: ReplayArchive, host: str = '127.0.0.1', port: int = 0):
+        self.archive = archive
+        self.host = host
+        self.port = port
+        self.httpd: Optional[ThreadingHTTPServer] = None
+        self.thread: Optional[threading.Thread] = None
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+    
+    def url_for(self, url: str) -> str:
+        """Replay server URL of an original URL"""
+        return f"{self.base_url}/replay?url={quote(url, safe='')}"
+    
+    def _handler_class(self):
+        server = self
+        
+        class ReplayRequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                url = parse_qs(parts.query).get('url', [None])[0]
+                record = server.archive.get('GET', url) if parts.path == '/replay' and url else None
+                
+                if record is None:
+                    self.send_error(404, 'Not recorded')
+                    return
+                
+                self.send_response(record['status'])
+                for key, value in record['headers'].items():
+                    if key == 'location':
+                        value = server.url_for(urljoin(url, value))
+                    self.send_header(key, value)
+                self.send_header('Content-Length', str(len(record['body'])))
+                self.end_headers()
+                self.wfile.write(record['body'])
+            
+            def log_message(self, format, *args):
+                pass
+        
+        return ReplayRequestHandler
+    
+    def start(self) -> 'ReplayServer':
+        """Start serving in a background thread"""
+        self.httpd = ThreadingHTTPServer((self.host, self.port), self._handler_class())
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        logger.info(f"Replay server serving {len(self.archive)} responses at {self.base_url}")
+        return self
+    
+    def stop(self):
+        """Stop the server"""
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+    
+    def __enter__(self) -> 'ReplayServer':
+        return self.start()
+    
+    def __exit__(self, *exc_info):
+        self.stop()
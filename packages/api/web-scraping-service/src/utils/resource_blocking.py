@@ -0,0 +1,96 @@
+"""
+Request interception profiles that keep Playwright pages from downloading
+resources the scrapers never read (images, fonts, media, trackers)
+"""
+
+from typing import Dict, Optional, Any
+from urllib.parse import urlparse
+
+from loguru import logger
+
+
+class ResourceBlocker:
+    """
+    Aborts unwanted browser requests by resource type and domain denylist.
+    
+    The global profile comes from ``ScraperConfig.resource_blocking``; a board can
+    override ``resource_types`` and extend ``blocked_domains`` through the
+    ``resource_blocking`` key of its ``job_boards`` entry.
+    """
+    
+    def __init__(self, base_profile: Dict[str, Any], job_boards: Dict[str, Dict[str, Any]]):
+        self.enabled = base_profile.get('enabled', True)
+        self.estimated_bytes: Dict[str, int] = base_profile.get('estimated_bytes', {})
+        self.profiles = {
+            board_name: self._build_profile(base_profile, board_config.get('resource_blocking', {}))
+            for board_name, board_config in job_boards.items()
+        }
+        self.default_profile = self._build_profile(base_profile, {})
+        
+        self.stats = {
+            'requests_allowed': 0,
+            'requests_blocked': 0,
+            'estimated_bytes_saved': 0,
+        }
+        self.blocked_by_type: Dict[str, int] = {}
+        self.blocked_by_board: Dict[str, int] = {}
+    
+    def _build_profile(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge a board override over the base profile"""
+        domains = set(base.get('blocked_domains', [])) | set(override.get('blocked_domains', []))
+        domains -= set(override.get('allowed_domains', []))
+        return {
+            'enabled': override.get('enabled', base.get('enabled', True)),
+            'resource_types': set(override.get('resource_types', base.get('resource_types', []))),
+            'blocked_domains': tuple(sorted(domains)),
+        }
+    
+    def _is_blocked_domain(self, url: str, blocked_domains: tuple) -> bool:
+        """Check the request host against the denylist, including subdomains"""
+        host = urlparse(url).hostname or ''
+        return any(host == domain or host.endswith('.' + domain) for domain in blocked_domains)
+    
+    def should_block(self, board_name: Optional[str], resource_type: str, url: str) -> bool:
+        """Decide whether a request should be aborted"""
+        profile = self.profiles.get(board_name, self.default_profile)
+        if not self.enabled or not profile['enabled']:
+            return False
+        return resource_type in profile['resource_types'] or self._is_blocked_domain(url, profile['blocked_domains'])
+    
+    async def apply(self, page, board_name: Optional[str]):
+        """Install the board's blocking profile on a page (once per page)"""
+        if not self.enabled or getattr(page, '_sparkapply_blocking_installed', False):
+            return
+        
+        async def handle_route(route):
+            request = route.request
+            try:
+                if self.should_block(board_name, request.resource_type, request.url):
+                    self._record_blocked(board_name, request.resource_type)
+                    await route.abort()
+                else:
+                    self.stats['requests_allowed'] += 1
+                    await route.fallback()
+            except Exception as e:
+                logger.debug(f"Error routing {request.url}: {e}")
+        
+        await page.route('**/*', handle_route)
+        page._sparkapply_blocking_installed = True
+    
+    def _record_blocked(self, board_name: Optional[str], resource_type: str):
+        """Update the blocked request counters"""
+        self.stats['requests_blocked'] += 1
+        self.stats['estimated_bytes_saved'] += self.estimated_bytes.get(
+            resource_type, self.estimated_bytes.get('other', 0)
+        )
+        self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+        board_key = board_name or 'unknown'
+        self.blocked_by_board[board_key] = self.blocked_by_board.get(board_key, 0) + 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get blocked request and bandwidth counters"""
+        return {
+            **self.stats,
+            'blocked_by_type': dict(self.blocked_by_type),
+            'blocked_by_board': dict(self.blocked_by_board),
+        }
@@ -0,0 +1,370 @@
+"""
+Content-addressed on-disk cache of fetched pages with ETag/Last-Modified revalidation
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Any, Mapping
+
+from loguru import logger
+
+from ..config.scraper_config import ScraperConfig, scraper_config
+from .replay import DROPPED_HEADERS
+
+
+# Response headers not kept with a cached body: cookies belong to the session that fetched it
+UNCACHED_HEADERS = DROPPED_HEADERS | {'set-cookie'}
+
+
+class HttpStatusError(Exception):
+    """Raised by CachedResponse.raise_for_status for 4xx/5xx responses"""
+
+
+@dataclass
+class CachedResponse:
+    """A response served from, or stored in, the cache"""
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    stored_at: float = 0.0
+    from_cache: bool = False
+    body_hash: Optional[str] = field(default=None, repr=False)
+    
+    @property
+    def text(self) -> str:
+        """Body decoded with the charset from Content-Type (UTF-8 by default)"""
+        content_type = self.headers.get('content-type', '')
+        charset = 'utf-8'
+        if 'charset=' in content_type:
+            charset = content_type.split('charset=', 1)[1].split(';', 1)[0].strip() or charset
+        return self.content.decode(charset, errors='replace')
+    
+    def raise_for_status(self):
+        """Raise HttpStatusError for error responses"""
+        if self.status_code >= 400:
+            raise HttpStatusError(f"HTTP {self.status_code} for {self.url}")
+
+
+class ResponseCache:
+    """
+    Caches page bodies on disk, addressed by their SHA-256, with one small
+    metadata entry per URL.
+    
+    A cached page younger than its board's TTL (``job_boards[board]["cache_ttl"]``,
+    falling back to ``response_cache_ttl``) is served without a request. Older
+    pages are revalidated with If-None-Match/If-Modified-Since, so unchanged
+    pages come back as a bodiless 304. Identical bodies under different URLs are
+    stored once. Redirected responses are never stored, as they belong to
+    another URL.
+    
+    Once the stored bodies exceed ``max_bytes``, the least recently stored (or
+    revalidated) pages are evicted down to 80% of it; the size is rechecked
+    after every tenth of ``max_bytes`` written.
+    """
+    
+    def __init__(self, storage_path: str, job_boards: Dict[str, Dict[str, Any]],
+                 default_ttl: int = 3600, enabled: bool = True, max_bytes: Optional[int] = None):
+        self.root = os.path.join(storage_path, 'http_cache')
+        self.job_boards = job_boards
+        self.default_ttl = default_ttl
+        self.enabled = enabled
+        self.max_bytes = max_bytes
+        # Starts at the check threshold, so the first store checks what earlier runs left
+        self._bytes_since_check = (max_bytes or 0) // 10
+        self.stats = {
+            'hits': 0,
+            'revalidated': 0,
+            'misses': 0,
+            'stores': 0,
+            'bypassed': 0,
+            'evicted': 0,
+            'bytes_saved': 0,
+        }
+    
+    @classmethod
+    def from_config(cls, config: ScraperConfig) -> 'ResponseCache':
+        """Create the cache from the scraper's storage and cache settings"""
+        return cls(
+            storage_path=config.data_storage_path,
+            job_boards=config.job_boards,
+            default_ttl=config.response_cache_ttl,
+            enabled=config.response_cache_enabled,
+            max_bytes=config.response_cache_max_bytes,
+        )
+    
+    def ttl_for(self, board_name: Optional[str]) -> int:
+        """Freshness lifetime in seconds of a board's pages"""
+        return self.job_boards.get(board_name, {}).get('cache_ttl', self.default_ttl)
+    
+    def _entry_path(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.root, 'entries', digest[:2], f"{digest}.json")
+    
+    def _body_path(self, body_hash: str) -> str:
+        return os.path.join(self.root, 'bodies', body_hash[:2], body_hash)
+    
+    @staticmethod
+    def _write_atomic(path: str, data: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    
+    def _load_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        """Read a URL's metadata entry"""
+        if not self.enabled:
+            return None
+        try:
+            with open(self._entry_path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Unreadable cache entry for {url}: {e}")
+            return None
+    
+    def _load_response(self, entry: Dict[str, Any]) -> Optional[CachedResponse]:
+        """Load the body of an entry"""
+        try:
+            with open(self._body_path(entry['body_hash']), 'rb') as f:
+                content = f.read()
+        except OSError:
+            return None
+        
+        return CachedResponse(
+            url=entry['url'],
+            status_code=entry['status_code'],
+            headers=entry['headers'],
+            content=content,
+            stored_at=entry['stored_at'],
+            from_cache=True,
+            body_hash=entry['body_hash'],
+        )
+    
+    def is_fresh(self, board_name: Optional[str], url: str) -> bool:
+        """Check whether a URL can be served without any request"""
+        entry = self._load_entry(url)
+        return bool(entry) and time.time() - entry['stored_at'] < self.ttl_for(board_name)
+    
+    def get_fresh(self, board_name: Optional[str], url: str) -> Optional[CachedResponse]:
+        """Get a cached response that is still within its TTL"""
+        if not self.is_fresh(board_name, url):
+            return None
+        
+        response = self._load_response(self._load_entry(url))
+        if response is not None:
+            self.stats['hits'] += 1
+            self.stats['bytes_saved'] += len(response.content)
+        return response
+    
+    def revalidation_headers(self, url: str) -> Dict[str, str]:
+        """Conditional request headers for a stale cached URL"""
+        entry = self._load_entry(url)
+        if not entry:
+            return {}
+        
+        headers = {}
+        if entry['headers'].get('etag'):
+            headers['If-None-Match'] = entry['headers']['etag']
+        if entry['headers'].get('last-modified'):
+            headers['If-Modified-Since'] = entry['headers']['last-modified']
+        return headers
+    
+    def update(self, url: str, status_code: int, headers: Mapping[str, str], content: bytes,
+               store: bool = True) -> CachedResponse:
+        """
+        Record a network response and return what the caller should use
+        
+        A 304 refreshes the stored entry and returns the cached body; a 200 is
+        stored (unless Cache-Control forbids it, or store is False, e.g. for
+        redirected responses); anything else passes through.
+        """
+        headers = {key.lower(): value for key, value in headers.items()}
+        
+        if status_code == 304:
+            entry = self._load_entry(url)
+            response = self._load_response(entry) if entry else None
+            if response is not None:
+                entry['stored_at'] = time.time()
+                self._save_entry(url, entry)
+                self.stats['revalidated'] += 1
+                self.stats['bytes_saved'] += len(response.content)
+                return response
+        
+        self.stats['misses'] += 1
+        response = CachedResponse(url=url, status_code=status_code, headers=headers, content=content)
+        
+        if self.enabled and store and status_code == 200 and 'no-store' not in headers.get('cache-control', ''):
+            self._store(response)
+        return response
+    
+    def evict(self, url: str):
+        """Drop a URL's entry, e.g. after its page failed to be handled, so the next attempt refetches it"""
+        if not self.enabled:
+            return
+        try:
+            os.remove(self._entry_path(url))
+            self.stats['evicted'] += 1
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error evicting cache entry for {url}: {e}")
+    
+    def _store(self, response: CachedResponse):
+        """Write the body (once per distinct content) and the URL's entry"""
+        try:
+            body_hash = hashlib.sha256(response.content).hexdigest()
+            body_path = self._body_path(body_hash)
+            if not os.path.exists(body_path):
+                self._write_atomic(body_path, response.content)
+                self._bytes_since_check += len(response.content)
+            
+            response.body_hash = body_hash
+            response.stored_at = time.time()
+            self._save_entry(response.url, {
+                'url': response.url,
+                'status_code': response.status_code,
+                'headers': {key: value for key, value in response.headers.items() if key not in UNCACHED_HEADERS},
+                'body_hash': body_hash,
+                'stored_at': response.stored_at,
+            })
+            self.stats['stores'] += 1
+        except Exception as e:
+            logger.error(f"Error caching response for {response.url}: {e}")
+    
+        if self.max_bytes and self._bytes_since_check >= self.max_bytes // 10:
+            self.enforce_size_limit()
+    
+    def enforce_size_limit(self):
+        """Evict the least recently stored pages, and unreferenced bodies, once the bodies exceed max_bytes"""
+        self._bytes_since_check = 0
+        if not self.max_bytes:
+            return
+        
+        body_sizes = {}
+        for dirpath, _, filenames in os.walk(os.path.join(self.root, 'bodies')):
+            for filename in filenames:
+                if not filename.endswith('.tmp'):
+                    body_sizes[filename] = os.path.getsize(os.path.join(dirpath, filename))
+        total = sum(body_sizes.values())
+        if total <= self.max_bytes:
+            return
+        
+        entries = []
+        for dirpath, _, filenames in os.walk(os.path.join(self.root, 'entries')):
+            for filename in filenames:
+                if not filename.endswith('.json'):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        entry = json.load(f)
+                    entries.append((entry['stored_at'], path, entry['body_hash']))
+                except Exception as e:
+                    logger.debug(f"Unreadable cache entry {path}: {e}")
+        
+        references = Counter(body_hash for _, _, body_hash in entries)
+        evictable = [body_hash for body_hash in body_sizes if not references[body_hash]]
+        kept_bytes = total - sum(body_sizes[body_hash] for body_hash in evictable)
+        evicted = 0
+        for _, path, body_hash in sorted(entries):
+            if kept_bytes <= self.max_bytes * 0.8:
+                break
+            os.remove(path)
+            evicted += 1
+            references[body_hash] -= 1
+            if not references[body_hash] and body_hash in body_sizes:
+                evictable.append(body_hash)
+                kept_bytes -= body_sizes[body_hash]
+        
+        for body_hash in evictable:
+            try:
+                os.remove(self._body_path(body_hash))
+                total -= body_sizes[body_hash]
+            except OSError as e:
+                logger.debug(f"Error removing cached body {body_hash}: {e}")
+        
+        self.stats['evicted'] += evicted
+        logger.info(f"Response cache over {self.max_bytes} bytes: evicted {evicted} pages, {total} bytes left")
+    
+    def _save_entry(self, url: str, entry: Dict[str, Any]):
+        try:
+            self._write_atomic(self._entry_path(url), json.dumps(entry).encode('utf-8'))
+        except Exception as e:
+            logger.error(f"Error saving cache entry for {url}: {e}")
+    
+    async def apply(self, page, board_name: Optional[str], refresh: bool = False):
+        """
+        Serve the page's main-frame navigations from the cache
+        
+        Fresh pages are fulfilled from disk; stale ones are revalidated through
+        route.fetch with conditional headers. With refresh (e.g. when a request
+        is retried), the page is fetched in full and its entry replaced. Other
+        requests fall through to the next route handler.
+        """
+        if not self.enabled:
+            return
+        page._sparkapply_cache_refresh = refresh
+        if getattr(page, '_sparkapply_cache_installed', False):
+            return
+        
+        async def handle_route(route):
+            request = route.request
+            try:
+                if request.method != 'GET' or not request.is_navigation_request() or request.frame != page.main_frame:
+                    await route.fallback()
+                    return
+                
+                refresh = page._sparkapply_cache_refresh
+                response = None if refresh else self.get_fresh(board_name, request.url)
+                if response is None:
+                    if refresh:
+                        self.stats['bypassed'] += 1
+                    fetched = await route.fetch(
+                        headers={**request.headers, **({} if refresh else self.revalidation_headers(request.url))}
+                    )
+                    response = self.update(
+                        request.url, fetched.status, fetched.headers, await fetched.body(),
+                        store=fetched.url == request.url
+                    )
+                
+                # The body is already decoded, so its transfer headers no longer apply
+                headers = {key: value for key, value in response.headers.items() if key not in DROPPED_HEADERS}
+                headers.setdefault('content-type', 'text/html')
+                await route.fulfill(status=response.status_code, headers=headers, body=response.content)
+            except Exception as e:
+                logger.debug(f"Cache routing failed for {request.url}: {e}")
+                await route.fallback()
+        
+        await page.route('**/*', handle_route)
+        page._sparkapply_cache_installed = True
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit, revalidation and bandwidth counters"""
+        lookups = self.stats['hits'] + self.stats['revalidated'] + self.stats['misses']
+        return {
+            **self.stats,
+            'hit_ratio': round((self.stats['hits'] + self.stats['revalidated']) / lookups, 3) if lookups else 0.0,
+        }
+
+
+# Shared caches keyed by the storage and cache settings they were created with
+_shared_response_caches: Dict[str, ResponseCache] = {}
+
+
+def get_shared_response_cache(config: Optional[ScraperConfig] = None) -> ResponseCache:
+    """Get the process-wide cache of a config's settings, so every engine reuses the same stored pages"""
+    config = config or scraper_config
+    key = json.dumps([
+        config.data_storage_path, config.response_cache_enabled, config.response_cache_ttl,
+        config.response_cache_max_bytes, {name: board.get('cache_ttl') for name, board in config.job_boards.items()},
+    ], sort_keys=True)
+    if key not in _shared_response_caches:
+        _shared_response_caches[key] = ResponseCache.from_config(config)
+    return _shared_response_caches[key]
@@ -0,0 +1,243 @@
+"""
+Handles of searches submitted to a long-lived crawl, and the tracker that
+tells when each search's share of the shared frontier is done
+"""
+
+import asyncio
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Set
+
+from crawlee import Request
+from loguru import logger
+
+
+class SearchHandle:
+    """
+    One search submitted to a running crawl: its status, counters and the
+    normalized jobs its requests produced
+    """
+    
+    RUNNING = "running"
+    FINISHED = "finished"
+    FAILED = "failed"
+    
+    def __init__(self, search_id: str, board_params: Dict[str, Dict[str, Any]]):
+        self.search_id = search_id
+        self.board_params = board_params
+        self.status = self.RUNNING
+        self.submitted_at = datetime.now()
+        self.finished_at: Optional[datetime] = None
+        self.error: Optional[str] = None
+        self.jobs: List[Dict[str, Any]] = []
+        self.stats = {
+            'requests_enqueued': 0,
+            'requests_handled': 0,
+            'requests_failed': 0,
+        }
+        self.outstanding: Set[str] = set()
+        self.settled: Set[str] = set()
+        self._done = asyncio.Event()
+    
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+    
+    async def wait(self, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Wait until every request of the search has been handled or has failed
+        
+        Raises:
+            asyncio.TimeoutError: if the search is still running after timeout seconds
+        """
+        await asyncio.wait_for(self._done.wait(), timeout)
+        return self.jobs
+    
+    def finish(self, error: Optional[str] = None):
+        """Mark the search done; with an error it failed and its jobs are the ones found so far"""
+        self.status = self.FAILED if error else self.FINISHED
+        self.error = error
+        self.finished_at = datetime.now()
+        self._done.set()
+    
+    def to_dict(self, include_jobs: bool = False) -> Dict[str, Any]:
+        """Summary of the search for APIs and logs"""
+        summary = {
+            'search_id': self.search_id,
+            'boards': list(self.board_params),
+            'search_params': self.board_params,
+            'status': self.status,
+            'submitted_at': self.submitted_at.isoformat(),
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'error': self.error,
+            'pending_requests': len(self.outstanding),
+            'jobs_count': len(self.jobs),
+            **self.stats,
+        }
+        if include_jobs:
+            summary['jobs'] = self.jobs
+        return summary
+
+
+class SearchTracker:
+    """
+    Attributes every request of a long-lived crawl to the search that caused it.
+    
+    Requests carry their search in ``user_data['search_id']``. A search is
+    finished once none of its requests is pending, which makes completion
+    independent of the other searches sharing the frontier.
+    
+    Requests whose unique key the crawl has already seen are deduplicated by
+    the request queue, so they are referenced instead: a search referencing a
+    pending request waits for it alongside the search that enqueued it, and
+    one referencing a handled request gets the jobs it produced, kept for the
+    last ``max_scraped`` handled requests (keyed by unique key, i.e. the
+    canonical URL of detail pages).
+    
+    Bounds: finished handles are kept up to ``max_finished``, seen keys up to
+    ``max_seen_keys``, and at most ``max_pending`` requests are waited on; the
+    oldest are evicted first, an evicted pending request counting as abandoned.
+    """
+    
+    def __init__(self, max_finished: int = 1000, max_seen_keys: int = 100000, max_pending: int = 50000,
+                 max_scraped: int = 10000):
+        self.max_finished = max_finished
+        self.max_seen_keys = max_seen_keys
+        self.max_pending = max_pending
+        self.max_scraped = max_scraped
+        self.handles: 'OrderedDict[str, SearchHandle]' = OrderedDict()
+        self.owners: 'OrderedDict[str, Set[str]]' = OrderedDict()
+        self.seen_keys: 'OrderedDict[str, None]' = OrderedDict()
+        self.scraped: 'OrderedDict[str, List[Dict[str, Any]]]' = OrderedDict()
+        self.stats = {
+            'searches_submitted': 0,
+            'searches_finished': 0,
+            'searches_failed': 0,
+            'requests_deduplicated': 0,
+            'requests_referenced': 0,
+            'requests_abandoned': 0,
+            'jobs_reused': 0,
+        }
+    
+    def open(self, board_params: Dict[str, Dict[str, Any]]) -> SearchHandle:
+        """Create the handle of a new search"""
+        handle = SearchHandle(uuid.uuid4().hex[:12], board_params)
+        self.handles[handle.search_id] = handle
+        self.stats['searches_submitted'] += 1
+        return handle
+    
+    def get(self, search_id: str) -> Optional[SearchHandle]:
+        return self.handles.get(search_id)
+    
+    def track(self, requests: List[Request]):
+        """Count newly enqueued requests against their search, referencing the ones the crawl has already seen"""
+        for request in requests:
+            handle = self.handles.get(request.user_data.get('search_id'))
+            if handle is None or handle.done:
+                continue
+            if request.unique_key in self.seen_keys:
+                self._reference(handle, request.unique_key)
+                continue
+            
+            self.seen_keys[request.unique_key] = None
+            if len(self.seen_keys) > self.max_seen_keys:
+                self.seen_keys.popitem(last=False)
+            self.owners[request.unique_key] = {handle.search_id}
+            handle.outstanding.add(request.unique_key)
+            handle.stats['requests_enqueued'] += 1
+    
+        while len(self.owners) > self.max_pending:
+            unique_key, search_ids = self.owners.popitem(last=False)
+            self.stats['requests_abandoned'] += 1
+            logger.warning(f"Stopped waiting for request {unique_key}: more than {self.max_pending} pending")
+            self._release(unique_key, search_ids, failed=True)
+    
+    def reference(self, search_id: str, requests: List[Request]):
+        """Attach requests the crawl already enqueued (and will not fetch again) to a search"""
+        handle = self.handles.get(search_id)
+        if handle is None or handle.done:
+            return
+        for request in requests:
+            self._reference(handle, request.unique_key)
+    
+    def _reference(self, handle: SearchHandle, unique_key: str):
+        """Wait for a pending request, or reuse the jobs of a handled one"""
+        if unique_key in self.owners:
+            if handle.search_id not in self.owners[unique_key]:
+                self.owners[unique_key].add(handle.search_id)
+                handle.outstanding.add(unique_key)
+                self.stats['requests_referenced'] += 1
+        elif unique_key in handle.settled:
+            return
+        elif unique_key in self.scraped:
+            handle.settled.add(unique_key)
+            handle.jobs.extend(self.scraped[unique_key])
+            self.stats['requests_referenced'] += 1
+            self.stats['jobs_reused'] += len(self.scraped[unique_key])
+        else:
+            self.stats['requests_deduplicated'] += 1
+    
+    def settle(self, request: Request, failed: bool = False):
+        """Record that a request was handled (or gave up), finishing the searches it was the last one of"""
+        self._release(request.unique_key, self.owners.pop(request.unique_key, set()), failed)
+        
+    def _release(self, unique_key: str, search_ids: Set[str], failed: bool):
+        for search_id in search_ids:
+            handle = self.handles.get(search_id)
+            if handle is None or unique_key not in handle.outstanding:
+                continue
+            
+            handle.outstanding.discard(unique_key)
+            handle.settled.add(unique_key)
+            handle.stats['requests_failed' if failed else 'requests_handled'] += 1
+            if not handle.outstanding:
+                self._finish(handle)
+    
+    def add_jobs(self, request: Request, items: List[Dict[str, Any]]):
+        """Attach the normalized jobs a request produced to every search waiting for it, and keep them for later ones"""
+        search_ids = self.owners.get(request.unique_key) or {request.user_data.get('search_id')}
+        for search_id in search_ids:
+            handle = self.handles.get(search_id)
+            if handle is not None:
+                handle.jobs.extend(items)
+        
+        self.scraped.setdefault(request.unique_key, []).extend(items)
+        self.scraped.move_to_end(request.unique_key)
+        if len(self.scraped) > self.max_scraped:
+            self.scraped.popitem(last=False)
+    
+    def finish_empty(self, handle: SearchHandle):
+        """Finish a search that enqueued nothing new, e.g. one whose pages were all crawled before"""
+        if not handle.outstanding and not handle.done:
+            self._finish(handle)
+    
+    def fail_outstanding(self, error: str):
+        """Fail every running search, e.g. once the crawl serving them has stopped, so nobody waits on it forever"""
+        for handle in [handle for handle in self.handles.values() if not handle.done]:
+            handle.stats['requests_failed'] += len(handle.outstanding)
+            handle.outstanding.clear()
+            self._finish(handle, error)
+        self.owners.clear()
+    
+    def _finish(self, handle: SearchHandle, error: Optional[str] = None):
+        handle.finish(error)
+        if error:
+            self.stats['searches_failed'] += 1
+            logger.warning(f"Search {handle.search_id} failed ({error}): {handle.to_dict()}")
+        else:
+            self.stats['searches_finished'] += 1
+            logger.info(f"Search {handle.search_id} finished: {handle.to_dict()}")
+        
+        finished = [search_id for search_id, other in self.handles.items() if other.done]
+        for search_id in finished[:max(len(finished) - self.max_finished, 0)]:
+            del self.handles[search_id]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get search counters and the number of searches still running"""
+        return {
+            **self.stats,
+            'searches_running': sum(1 for handle in self.handles.values() if not handle.done),
+            'requests_pending': len(self.owners),
+            'requests_scraped': len(self.scraped),
+        }
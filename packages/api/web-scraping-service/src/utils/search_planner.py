@@ -0,0 +1,187 @@
+"""
+Search fan-out planning: expand search parameters into prioritized,
+deduplicated search URLs for every board
+"""
+
+import itertools
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from loguru import logger
+
+
+# Search dimensions and the search_params keys they are read from (single value or list)
+SEARCH_DIMENSIONS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ('keywords', ('keywords', 'keyword')),
+    ('location', ('location', 'locations')),
+    ('experience_level', ('experience_level', 'experience_levels')),
+    ('job_type', ('job_type', 'job_types')),
+)
+
+
+@dataclass
+class SearchSeed:
+    """One search listing URL to crawl"""
+    board: str
+    url: str
+    params: Dict[str, str]
+    priority: int = 0
+    equivalent_searches: int = 1
+    max_pages: Optional[int] = None
+
+
+class SearchPlanner:
+    """
+    Expands search parameters into the cartesian product of their values and
+    maps each combination to a board's search URL.
+    
+    Each board describes its search URL in ``job_boards[board]["search"]``:
+    ``params`` maps a search dimension to the board's query parameter,
+    ``values`` optionally maps dimension values to the board's codes, and
+    ``location_params`` adds fixed parameters whenever a location is given, and
+    ``sort_params`` sorts results newest first, which incremental pagination
+    needs to stop at jobs seen by the previous run.
+    Dimensions a board does not support are dropped, so combinations that only
+    differ in them collapse into one search.
+    
+    Priority follows the order of the values in each list: the first keyword in
+    the first location is crawled first.
+    
+    Boards whose listing pages are addressable by URL describe them in
+    ``job_boards[board]["pagination"]``: ``{"strategy": "offset", "param": "start",
+    "step": 10}`` puts ``step * (page - 1)`` in ``param``, ``{"strategy": "page",
+    "param": "p"}`` puts the page number itself. Other boards are paged by clicking.
+    """
+    
+    def __init__(self, job_boards: Dict[str, Dict[str, Any]]):
+        self.job_boards = job_boards
+        self.stats = {
+            'combinations': 0,
+            'searches_planned': 0,
+            'searches_collapsed': 0,
+        }
+    
+    @staticmethod
+    def _normalize_value(value: Any) -> str:
+        """Collapse whitespace and case so equivalent values compare equal"""
+        return ' '.join(str(value).split()).lower()
+    
+    def expand(self, search_params: Dict[str, Any]) -> List[Tuple[int, Dict[str, str]]]:
+        """
+        Expand search parameters into (priority, combination) pairs
+        
+        Each dimension may be given as a single value or a list of values.
+        """
+        dimensions = []
+        for dimension, keys in SEARCH_DIMENSIONS:
+            value = next((search_params[key] for key in keys if search_params.get(key)), None)
+            if value is None:
+                continue
+            values = value if isinstance(value, (list, tuple)) else [value]
+            values = [self._normalize_value(v) for v in values if str(v).strip()]
+            if values:
+                dimensions.append((dimension, values))
+        
+        combinations = []
+        indexed_values = [list(enumerate(values)) for _, values in dimensions]
+        for choice in itertools.product(*indexed_values):
+            priority = sum(index for index, _ in choice)
+            combination = {dimension: value for (dimension, _), (_, value) in zip(dimensions, choice)}
+            combinations.append((priority, combination))
+        
+        return combinations
+    
+    def build_url(self, board_name: str, params: Dict[str, str]) -> Optional[str]:
+        """Build a board's search URL, encoding only the dimensions the board supports"""
+        board_config = self.job_boards.get(board_name, {})
+        search_config = board_config.get('search')
+        base_url = board_config.get('base_url')
+        if not search_config or not base_url:
+            return None
+        
+        query = []
+        for dimension, query_param in search_config.get('params', {}).items():
+            value = params.get(dimension)
+            if not value:
+                continue
+            
+            value_map = search_config.get('values', {}).get(dimension)
+            if value_map is not None:
+                value = value_map.get(value)
+                if value is None:
+                    continue
+            
+            query.append((query_param, value))
+            if dimension == 'location':
+                query.extend(search_config.get('location_params', {}).items())
+        
+        if query:
+            query.extend(search_config.get('sort_params', {}).items())
+        return f"{base_url}?{urlencode(query)}" if query else base_url
+    
+    def date_sorted(self, board_name: str) -> bool:
+        """Whether a board's search URLs ask for the newest postings first"""
+        return bool(self.job_boards.get(board_name, {}).get('search', {}).get('sort_params'))
+    
+    def page_url(self, board_name: str, url: str, page: int) -> Optional[str]:
+        """
+        URL of listing page ``page`` (1-based) of a search URL, or None when the
+        board's pages can only be reached by clicking "Next"
+        """
+        pagination = self.job_boards.get(board_name, {}).get('pagination', {})
+        strategy = pagination.get('strategy')
+        param = pagination.get('param')
+        if strategy not in ('offset', 'page') or not param:
+            return None
+        
+        parts = urlsplit(url)
+        query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != param]
+        if page > 1:
+            value = pagination.get('step', 10) * (page - 1) if strategy == 'offset' else page
+            query.append((param, str(value)))
+        
+        return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+    
+    def plan_board(self, board_name: str, search_params: Dict[str, Any]) -> List[SearchSeed]:
+        """Plan the deduplicated, priority-ordered searches of one board"""
+        seeds: Dict[str, SearchSeed] = {}
+        combinations = self.expand(search_params)
+        self.stats['combinations'] += len(combinations)
+        
+        for priority, params in sorted(combinations, key=lambda item: item[0]):
+            url = self.build_url(board_name, params)
+            if url is None:
+                break
+            
+            # Keep the highest priority search of each group of equivalent ones
+            if url in seeds:
+                seeds[url].equivalent_searches += 1
+                self.stats['searches_collapsed'] += 1
+                continue
+            
+            seeds[url] = SearchSeed(
+                board=board_name,
+                url=url,
+                params=params,
+                priority=priority,
+            )
+        
+        self.stats['searches_planned'] += len(seeds)
+        if seeds and len(seeds) < len(combinations):
+            logger.debug(f"Collapsed {len(combinations)} {board_name} searches into {len(seeds)}")
+        
+        return list(seeds.values())
+    
+    def plan(self, board_params: Dict[str, Dict[str, Any]]) -> List[SearchSeed]:
+        """Plan the searches of several boards, interleaved by priority"""
+        seeds = []
+        for board_name, search_params in board_params.items():
+            seeds.extend(self.plan_board(board_name, search_params))
+        
+        board_order = {board_name: index for index, board_name in enumerate(board_params)}
+        return sorted(seeds, key=lambda seed: (seed.priority, board_order[seed.board]))
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get expansion and collapse counters"""
+        return dict(self.stats)
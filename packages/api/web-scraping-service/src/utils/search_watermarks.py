@@ -0,0 +1,154 @@
+"""
+Per-search high-water marks used to stop paginating once a crawl reaches jobs seen last run
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple
+
+from loguru import logger
+
+
+class SearchWatermarkStore:
+    """
+    Remembers, for every search of every board, the newest job it returned
+    (external id and posted date) plus the ids of its most recent jobs.
+    
+    A listing page is caught up when every id on it is already known. On
+    boards whose searches are sorted newest first it is also caught up when
+    it holds the previous run's newest job or when every posting on it is
+    older than the newest posted date; relevance-sorted listings put old and
+    promoted jobs first, so those rules would stop them too early.
+    
+    Marks gathered during a crawl are only committed once it finishes, so
+    later pages of the same run are still compared against the previous run.
+    """
+    
+    def __init__(self, storage_path: str, filename: str = "search_watermarks.json", max_known_ids: int = 500):
+        self.file_path = os.path.join(storage_path, filename)
+        self.max_known_ids = max_known_ids
+        self.marks: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.pending: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.stats = {
+            'pages_checked': 0,
+            'pages_caught_up': 0,
+            'searches_advanced': 0,
+        }
+        self.load()
+    
+    def load(self):
+        """Load the marks from disk"""
+        try:
+            if os.path.exists(self.file_path):
+                with open(self.file_path, 'r', encoding='utf-8') as f:
+                    self.marks = json.load(f)
+                logger.info(f"Loaded watermarks of {sum(len(marks) for marks in self.marks.values())} searches from {self.file_path}")
+        except Exception as e:
+            logger.error(f"Error loading search watermarks from {self.file_path}: {e}")
+            self.marks = {}
+    
+    def save(self):
+        """Write the marks to disk"""
+        try:
+            os.makedirs(os.path.dirname(self.file_path) or '.', exist_ok=True)
+            tmp_path = f"{self.file_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.marks, f)
+            os.replace(tmp_path, self.file_path)
+        except Exception as e:
+            logger.error(f"Error saving search watermarks to {self.file_path}: {e}")
+    
+    def get(self, board_name: str, search_key: str) -> Optional[Dict[str, Any]]:
+        """Get the committed mark of a search"""
+        return self.marks.get(board_name, {}).get(search_key)
+    
+    def count_new(self, board_name: str, search_key: str, jobs: List[Tuple[str, Optional[datetime]]]) -> int:
+        """Count a listing page's jobs that the search did not return in the previous run"""
+        mark = self.get(board_name, search_key)
+        known_ids = set(mark.get('known_ids', [])) if mark else set()
+        return sum(1 for external_id, _ in jobs if external_id not in known_ids)
+    
+    def observe_page(self, board_name: str, search_key: str, page: int,
+                     jobs: List[Tuple[str, Optional[datetime]]], date_sorted: bool = False) -> bool:
+        """
+        Stage a listing page's (external_id, posted_date) pairs, in page order,
+        and tell whether the search has caught up with the previous run
+        
+        Args:
+            date_sorted: Whether the search lists the newest postings first
+        
+        Returns:
+            True if nothing newer than the previous run can be on later pages
+        """
+        self.stats['pages_checked'] += 1
+        
+        pending = self.pending.setdefault((board_name, search_key), {'ids': [], 'newest_id': None, 'newest_posted': None})
+        for external_id, posted_date in jobs:
+            if external_id not in pending['ids']:
+                pending['ids'].append(external_id)
+            if posted_date and (pending['newest_posted'] is None or posted_date.isoformat() > pending['newest_posted']):
+                pending['newest_posted'] = posted_date.isoformat()
+        if page == 1 and jobs:
+            pending['newest_id'] = jobs[0][0]
+        
+        mark = self.get(board_name, search_key)
+        if not mark or not jobs:
+            return False
+        
+        ids = [external_id for external_id, _ in jobs]
+        known_ids = set(mark.get('known_ids', []))
+        dates = [posted_date for _, posted_date in jobs if posted_date]
+        
+        caught_up = all(external_id in known_ids for external_id in ids) or (
+            date_sorted and (
+                mark.get('newest_id') in ids
+                or (
+                    bool(mark.get('newest_posted')) and len(dates) == len(jobs)
+                    and all(posted_date.isoformat() < mark['newest_posted'] for posted_date in dates)
+                )
+            )
+        )
+        if caught_up:
+            self.stats['pages_caught_up'] += 1
+        return caught_up
+    
+    def export_pending(self) -> List[Dict[str, Any]]:
+        """Marks staged by the crawl in progress, in JSON form for checkpoints"""
+        return [
+            {'board': board_name, 'search_key': search_key, **pending}
+            for (board_name, search_key), pending in self.pending.items()
+        ]
+    
+    def restore_pending(self, items: List[Dict[str, Any]]):
+        """Restage marks exported by export_pending, e.g. when a crawl resumes"""
+        for item in items:
+            item = dict(item)
+            self.pending[(item.pop('board'), item.pop('search_key'))] = item
+    
+    def commit(self):
+        """Advance the marks of every search observed in this crawl and save them"""
+        if not self.pending:
+            return
+        
+        for (board_name, search_key), pending in self.pending.items():
+            mark = self.marks.setdefault(board_name, {}).get(search_key, {})
+            known_ids = pending['ids'] + [
+                external_id for external_id in mark.get('known_ids', []) if external_id not in pending['ids']
+            ]
+            newest_posted = max(filter(None, [pending['newest_posted'], mark.get('newest_posted')]), default=None)
+            
+            self.marks[board_name][search_key] = {
+                'newest_id': pending['newest_id'] or mark.get('newest_id'),
+                'newest_posted': newest_posted,
+                'known_ids': known_ids[:self.max_known_ids],
+                'updated_at': datetime.now().isoformat(),
+            }
+            self.stats['searches_advanced'] += 1
+        
+        self.pending = {}
+        self.save()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get page and search counters"""
+        return {**self.stats, 'searches_tracked': sum(len(marks) for marks in self.marks.values())}
@@ -0,0 +1,289 @@
+"""
+Cross-run yield statistics of every search, used to skip, merge or demote
+searches that keep returning few new or only duplicate jobs
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Set, Tuple
+
+from loguru import logger
+
+from ..config.scraper_config import ScraperConfig
+from .search_planner import SearchSeed
+
+
+class SearchYieldStore:
+    """
+    Keeps, for every search of every board, the listing pages it fetched, the
+    new jobs it found and its overlap with the other searches of the board in
+    each of its last ``history`` runs.
+    
+    Before a scheduled crawl, searches with at least ``min_runs`` runs of history
+    are reviewed:
+        
+        merged   every recent run, at least ``merge_overlap`` of its jobs were also
+                 returned by the same other search, which still runs
+        skipped  fewer than ``skip_yield`` new jobs per listing page
+        demoted  fewer than ``demote_yield`` new jobs per listing page; the search
+                 only gets its first page, after every other search
+    
+    Merged and skipped searches still run every ``probe_interval`` runs (demoted)
+    so their statistics stay current. Stats gathered during a crawl are only
+    committed once it finishes, together with a report of the pages saved.
+    """
+    
+    KEEP = 'keep'
+    DEMOTE = 'demote'
+    SKIP = 'skip'
+    MERGE = 'merge'
+    
+    def __init__(self, storage_path: str, filename: str = "search_yields.json", history: int = 10,
+                 min_runs: int = 3, skip_yield: float = 0.5, demote_yield: float = 2.0,
+                 merge_overlap: float = 0.9, probe_interval: int = 5, max_reports: int = 30):
+        self.file_path = os.path.join(storage_path, filename)
+        self.history = history
+        self.min_runs = min_runs
+        self.skip_yield = skip_yield
+        self.demote_yield = demote_yield
+        self.merge_overlap = merge_overlap
+        self.probe_interval = probe_interval
+        self.max_reports = max_reports
+        self.searches: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.reports: List[Dict[str, Any]] = []
+        self.pending: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.report: Optional[Dict[str, Any]] = None
+        self.pruned: Set[Tuple[str, str]] = set()
+        self.stats = {
+            'searches_reviewed': 0,
+            'searches_demoted': 0,
+            'searches_skipped': 0,
+            'searches_merged': 0,
+            'pages_saved': 0,
+        }
+        self.load()
+    
+    @classmethod
+    def from_config(cls, config: ScraperConfig, storage_path: Optional[str] = None) -> 'SearchYieldStore':
+        """Create a store under the config's data path (or storage_path) with its pruning thresholds"""
+        return cls(
+            storage_path or config.data_storage_path,
+            min_runs=config.search_pruning_min_runs,
+            skip_yield=config.search_skip_yield,
+            demote_yield=config.search_demote_yield,
+            merge_overlap=config.search_merge_overlap,
+            probe_interval=config.search_probe_interval,
+        )
+    
+    def load(self):
+        """Load the statistics and reports from disk"""
+        try:
+            if os.path.exists(self.file_path):
+                with open(self.file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.searches = data.get('searches', {})
+                self.reports = data.get('reports', [])
+                logger.info(f"Loaded yields of {sum(len(searches) for searches in self.searches.values())} searches from {self.file_path}")
+        except Exception as e:
+            logger.error(f"Error loading search yields from {self.file_path}: {e}")
+            self.searches = {}
+            self.reports = []
+    
+    def save(self):
+        """Write the statistics and reports to disk"""
+        try:
+            os.makedirs(os.path.dirname(self.file_path) or '.', exist_ok=True)
+            tmp_path = f"{self.file_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'searches': self.searches, 'reports': self.reports}, f)
+            os.replace(tmp_path, self.file_path)
+        except Exception as e:
+            logger.error(f"Error saving search yields to {self.file_path}: {e}")
+    
+    def get(self, board_name: str, search_key: str) -> Optional[Dict[str, Any]]:
+        """Get the committed statistics of a search"""
+        return self.searches.get(board_name, {}).get(search_key)
+    
+    def _recent_runs(self, board_name: str, search_key: str) -> List[Dict[str, Any]]:
+        """The search's last min_runs runs, or none while it has fewer"""
+        runs = (self.get(board_name, search_key) or {}).get('runs', [])
+        return runs[-self.min_runs:] if self.min_runs and len(runs) >= self.min_runs else []
+    
+    def _assess(self, board_name: str, search_key: str) -> Tuple[str, Optional[str], float]:
+        """Action for a search from its recent runs, the search it is covered by, and its average pages per run"""
+        runs = self._recent_runs(board_name, search_key)
+        if not runs:
+            return self.KEEP, None, 0.0
+        
+        pages = sum(run['pages'] for run in runs)
+        avg_pages = pages / len(runs)
+        covered_by = {run.get('covered_by') for run in runs}
+        if len(covered_by) == 1 and None not in covered_by:
+            return self.MERGE, covered_by.pop(), avg_pages
+        
+        new_per_page = sum(run['new_jobs'] for run in runs) / pages if pages else 0.0
+        if new_per_page < self.skip_yield:
+            return self.SKIP, None, avg_pages
+        if new_per_page < self.demote_yield:
+            return self.DEMOTE, None, avg_pages
+        return self.KEEP, None, avg_pages
+    
+    def review(self, seeds: List[SearchSeed]) -> List[SearchSeed]:
+        """
+        Drop merged and skipped searches from a plan and demote low-yield ones
+        
+        Returns:
+            The searches to crawl, demoted ones last and limited to their first page
+        """
+        assessed = {(seed.board, seed.url): self._assess(seed.board, seed.url) for seed in seeds}
+        self.stats['searches_reviewed'] += len(seeds)
+        
+        kept = []
+        details = []
+        pages_saved = 0.0
+        for seed in seeds:
+            action, covered_by, avg_pages = assessed[(seed.board, seed.url)]
+            
+            # A search only merges into a search that still runs in full
+            if action == self.MERGE and assessed.get((seed.board, covered_by), (self.SKIP,))[0] != self.KEEP:
+                action = self.DEMOTE
+            
+            entry = self.searches.get(seed.board, {}).get(seed.url, {})
+            if action in (self.SKIP, self.MERGE) and entry.get('runs_pruned', 0) + 1 >= self.probe_interval:
+                action = self.DEMOTE
+            
+            if action in (self.SKIP, self.MERGE):
+                pages_saved += avg_pages
+                self.stats['searches_merged' if action == self.MERGE else 'searches_skipped'] += 1
+            elif action == self.DEMOTE:
+                pages_saved += max(avg_pages - 1, 0.0)
+                self.stats['searches_demoted'] += 1
+                seed.priority += len(seeds)
+                seed.max_pages = 1
+                kept.append(seed)
+            else:
+                kept.append(seed)
+            
+            if action != self.KEEP:
+                details.append({
+                    'board': seed.board, 'search': seed.params, 'search_key': seed.url,
+                    'action': action, 'covered_by': covered_by if action == self.MERGE else None,
+                })
+        
+        self.report = {
+            'searches_planned': len(seeds),
+            'searches_crawled': len(kept),
+            'searches_demoted': sum(1 for detail in details if detail['action'] == self.DEMOTE),
+            'searches_skipped': sum(1 for detail in details if detail['action'] == self.SKIP),
+            'searches_merged': sum(1 for detail in details if detail['action'] == self.MERGE),
+            'pages_saved': round(pages_saved),
+            'details': details,
+        }
+        self.stats['pages_saved'] += round(pages_saved)
+        self.pruned = {(detail['board'], detail['search_key']) for detail in details if detail['action'] != self.DEMOTE}
+        
+        if details:
+            logger.info(
+                f"Search pruning: crawling {len(kept)} of {len(seeds)} searches, "
+                f"{self.report['searches_demoted']} demoted, {self.report['searches_skipped']} skipped, "
+                f"{self.report['searches_merged']} merged, ~{self.report['pages_saved']} listing pages saved"
+            )
+        return sorted(kept, key=lambda seed: seed.priority)
+    
+    def observe_page(self, board_name: str, search_key: str, job_ids: List[str], new_jobs: int):
+        """Stage a listing page of a search: its job ids and how many of them it did not return last run"""
+        pending = self.pending.setdefault((board_name, search_key), {'pages': 0, 'new_jobs': 0, 'ids': []})
+        pending['pages'] += 1
+        pending['new_jobs'] += new_jobs
+        pending['ids'].extend(job_id for job_id in job_ids if job_id not in pending['ids'])
+    
+    def export_pending(self) -> List[Dict[str, Any]]:
+        """Stats staged by the crawl in progress, in JSON form for checkpoints"""
+        return [
+            {'board': board_name, 'search_key': search_key, **pending}
+            for (board_name, search_key), pending in self.pending.items()
+        ]
+    
+    def restore_pending(self, items: List[Dict[str, Any]]):
+        """Restage stats exported by export_pending, e.g. when a crawl resumes"""
+        for item in items:
+            item = dict(item)
+            self.pending[(item.pop('board'), item.pop('search_key'))] = item
+    
+    def _overlaps(self) -> Dict[Tuple[str, str], Tuple[float, Optional[str]]]:
+        """
+        Share of each staged search's jobs also returned by other searches of its
+        board, and the one other search that returned at least merge_overlap of them
+        
+        Of two searches covering each other, only the one with fewer jobs (or the
+        later key) is covered, so redundant searches never merge into each other.
+        """
+        ids: Dict[Tuple[str, str], Set[str]] = {key: set(pending['ids']) for key, pending in self.pending.items()}
+        overlaps = {}
+        for (board_name, search_key), own in ids.items():
+            others = [
+                (other_key, other) for (other_board, other_key), other in ids.items()
+                if other_board == board_name and other_key != search_key
+            ]
+            if not own:
+                overlaps[(board_name, search_key)] = (0.0, None)
+                continue
+            
+            shared = own & set().union(*(other for _, other in others))
+            covered_by = None
+            best = self.merge_overlap
+            for other_key, other in others:
+                contained = len(own & other) / len(own)
+                if contained >= best and (len(other), search_key) > (len(own), other_key):
+                    covered_by, best = other_key, contained
+            overlaps[(board_name, search_key)] = (len(shared) / len(own), covered_by)
+        return overlaps
+    
+    def commit(self, run_id: Optional[str] = None):
+        """Append this crawl's run to the history of every search it crawled, record the report and save"""
+        if not self.pending and self.report is None:
+            return
+        
+        run_id = run_id or datetime.now().strftime('%Y%m%d%H%M%S')
+        for (board_name, search_key), (overlap, covered_by) in self._overlaps().items():
+            pending = self.pending[(board_name, search_key)]
+            entry = self.searches.setdefault(board_name, {}).setdefault(search_key, {'runs': []})
+            entry['runs'] = (entry['runs'] + [{
+                'run_id': run_id,
+                'pages': pending['pages'],
+                'new_jobs': pending['new_jobs'],
+                'jobs': len(pending['ids']),
+                'overlap': round(overlap, 3),
+                'covered_by': covered_by,
+            }])[-self.history:]
+            entry['runs_pruned'] = 0
+        
+        for board_name, search_key in self.pruned:
+            entry = self.searches.get(board_name, {}).get(search_key)
+            if entry is not None:
+                entry['runs_pruned'] = entry.get('runs_pruned', 0) + 1
+        
+        if self.report is not None:
+            self.report.update({
+                'run_id': run_id,
+                'listing_pages': sum(pending['pages'] for pending in self.pending.values()),
+                'new_jobs': sum(pending['new_jobs'] for pending in self.pending.values()),
+            })
+            self.reports = (self.reports + [self.report])[-self.max_reports:]
+            summary = {key: value for key, value in self.report.items() if key != 'details'}
+            logger.info(f"Search pruning report: {summary}")
+        
+        self.pending = {}
+        self.report = None
+        self.pruned = set()
+        self.save()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get review counters, the number of searches with history and the last run's report"""
+        last_report = self.reports[-1] if self.reports else None
+        return {
+            **self.stats,
+            'searches_tracked': sum(len(searches) for searches in self.searches.values()),
+            'last_report': {key: value for key, value in last_report.items() if key != 'details'} if last_report else None,
+        }
@@ -0,0 +1,251 @@
+"""
+Declarative selector extraction shared by every scraping backend: a board's
+field selectors are compiled once and applied to Playwright pages, lxml
+trees, BeautifulSoup documents, Selenium drivers and Scrapy responses
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple, Union
+from urllib.parse import urlparse
+
+import soupsieve
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from loguru import logger
+
+from ..config.scraper_config import ScraperConfig, scraper_config
+
+
+# Detail page fields read from job_boards[board]["selectors"]
+DETAIL_FIELDS = ('title', 'company', 'location', 'description')
+
+
+FIELDS_SCRIPT = """
+(fields) => {
+    const clean = (value) => (value || '').replace(/\\s+/g, ' ').trim();
+    const read = (el, attr) => el ? clean(attr ? el.getAttribute(attr) : el.textContent) : '';
+    const result = {};
+    for (const field of fields) {
+        let value = '';
+        for (const selector of field.css) {
+            value = read(document.querySelector(selector), field.attr);
+            if (value.length >= field.min_length) break;
+            value = '';
+        }
+        if (!value && field.xpath) {
+            const el = document.evaluate(
+                field.xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            ).singleNodeValue;
+            value = read(el, field.attr);
+            if (value.length < field.min_length) value = '';
+        }
+        result[field.name] = field.max_length ? value.slice(0, field.max_length) : value;
+    }
+    return result;
+}
+"""
+
+
+@dataclass
+class FieldSpec:
+    """
+    How to read one field. CSS selectors are tried in order and the first
+    element whose text (or ``attr``) reaches ``min_length`` wins; ``xpath``
+    is tried last.
+    """
+    name: str
+    css: Tuple[str, ...] = ()
+    xpath: Optional[str] = None
+    attr: Optional[str] = None
+    min_length: int = 1
+    max_length: Optional[int] = None
+    
+    @classmethod
+    def parse(cls, name: str, spec: Union[str, List[str], Dict[str, Any]]) -> 'FieldSpec':
+        """Read a field from config: a CSS selector, a list of alternatives, or a dict of FieldSpec keys"""
+        if isinstance(spec, str):
+            return cls(name=name, css=(spec,))
+        if isinstance(spec, (list, tuple)):
+            return cls(name=name, css=tuple(spec))
+        css = spec.get('css', ())
+        return cls(
+            name=name,
+            css=(css,) if isinstance(css, str) else tuple(css),
+            xpath=spec.get('xpath'),
+            attr=spec.get('attr'),
+            min_length=spec.get('min_length', 1),
+            max_length=spec.get('max_length'),
+        )
+
+
+class CompiledSpec:
+    """A board's field specs with their selectors compiled for every backend"""
+    
+    def __init__(self, board_name: str, fields: List[FieldSpec]):
+        self.board_name = board_name
+        self.fields = fields
+        self.selectors_compiled = 0
+        self.lxml: Dict[str, List[etree.XPath]] = {}
+        self.soup: Dict[str, List[soupsieve.SoupSieve]] = {}
+        
+        for field in fields:
+            self.lxml[field.name] = []
+            self.soup[field.name] = []
+            for css in field.css:
+                try:
+                    self.lxml[field.name].append(CSSSelector(css, translator='html'))
+                    self.soup[field.name].append(soupsieve.compile(css))
+                    self.selectors_compiled += 1
+                except Exception as e:
+                    logger.error(f"Invalid {board_name} selector for {field.name} {css!r}: {e}")
+            if field.xpath:
+                try:
+                    self.lxml[field.name].append(etree.XPath(field.xpath))
+                    self.selectors_compiled += 1
+                except etree.XPathSyntaxError as e:
+                    logger.error(f"Invalid {board_name} XPath for {field.name} {field.xpath!r}: {e}")
+        
+        # Browser backends get the spec as one argument of a single script call
+        self.script_args = [
+            {
+                'name': field.name, 'css': list(field.css), 'xpath': field.xpath, 'attr': field.attr,
+                'min_length': field.min_length, 'max_length': field.max_length,
+            }
+            for field in fields
+        ]
+        self.selenium_script = f"return ({FIELDS_SCRIPT})(arguments[0]);"
+    
+    @staticmethod
+    def _clean(value: Optional[str]) -> str:
+        return ' '.join((value or '').split())
+    
+    def _pick(self, field: FieldSpec, values) -> str:
+        """First candidate value long enough for the field, truncated to its maximum length"""
+        for value in values:
+            value = self._clean(value)
+            if len(value) >= field.min_length:
+                return value[:field.max_length] if field.max_length else value
+        return ''
+    
+    def extract_lxml(self, root) -> Dict[str, str]:
+        """Apply the spec to an lxml element (an lxml.html document or a parsel root)"""
+        def candidates(field: FieldSpec):
+            for selector in self.lxml[field.name]:
+                nodes = selector(root)
+                if not nodes:
+                    continue
+                node = nodes[0]
+                if isinstance(node, str):
+                    yield node
+                elif field.attr:
+                    yield node.get(field.attr)
+                else:
+                    yield etree.tostring(node, method='text', encoding='unicode', with_tail=False)
+        
+        return {field.name: self._pick(field, candidates(field)) for field in self.fields}
+    
+    def extract_soup(self, soup) -> Dict[str, str]:
+        """Apply the spec to a BeautifulSoup document (CSS selectors only)"""
+        def candidates(field: FieldSpec):
+            for selector in self.soup[field.name]:
+                node = selector.select_one(soup)
+                if node is not None:
+                    yield node.get(field.attr) if field.attr else node.get_text(' ')
+        
+        return {field.name: self._pick(field, candidates(field)) for field in self.fields}
+
+
+class SelectorEngine:
+    """
+    Compiles the detail field selectors of every board once and extracts them
+    from any backend.
+    
+    ``job_boards[board]["selectors"]`` maps each field to a CSS selector, a
+    list of alternative selectors, or a dict with ``css``, ``xpath``, ``attr``,
+    ``min_length`` and ``max_length``. Pages of unknown boards use
+    ``ScraperConfig.generic_selectors``. Adding a board therefore only takes
+    config.
+    """
+    
+    def __init__(self, job_boards: Dict[str, Dict[str, Any]], generic_selectors: Dict[str, Any]):
+        self.specs: Dict[str, CompiledSpec] = {
+            board_name: self._compile(board_name, board_config.get('selectors', {}))
+            for board_name, board_config in job_boards.items()
+        }
+        self.generic_spec = self._compile('generic', generic_selectors)
+        self.stats = {
+            'specs_compiled': len(self.specs) + 1,
+            'selectors_compiled': sum(spec.selectors_compiled for spec in [*self.specs.values(), self.generic_spec]),
+        }
+        self.extractions: Dict[str, int] = {}
+    
+    @classmethod
+    def from_config(cls, config: ScraperConfig) -> 'SelectorEngine':
+        """Create an engine from the board selectors and generic selectors of a config"""
+        return cls(config.job_boards, config.generic_selectors)
+    
+    def _compile(self, board_name: str, selectors: Dict[str, Any]) -> CompiledSpec:
+        fields = [FieldSpec.parse(field, selectors[field]) for field in DETAIL_FIELDS if field in selectors]
+        return CompiledSpec(board_name, fields)
+    
+    def board_for_url(self, url: str) -> Optional[str]:
+        """Resolve the board of a URL from its domain"""
+        domain = urlparse(url).netloc.lower()
+        return next((board_name for board_name in self.specs if board_name in domain), None)
+    
+    def spec(self, board_name: Optional[str]) -> CompiledSpec:
+        """Get a board's compiled spec, or the generic one for unknown boards and boards without selectors"""
+        spec = self.specs.get(board_name)
+        return spec if spec is not None and spec.fields else self.generic_spec
+    
+    def _count(self, backend: str):
+        self.extractions[backend] = self.extractions.get(backend, 0) + 1
+    
+    async def extract_playwright(self, page, board_name: Optional[str]) -> Dict[str, str]:
+        """Extract the fields from a Playwright page in one script call"""
+        spec = self.spec(board_name)
+        self._count('playwright')
+        try:
+            return await page.evaluate(FIELDS_SCRIPT, spec.script_args)
+        except Exception as e:
+            logger.error(f"Error extracting {spec.board_name} fields: {e}")
+            return {field.name: '' for field in spec.fields}
+    
+    def extract_selenium(self, driver, board_name: Optional[str]) -> Dict[str, str]:
+        """Extract the fields from a Selenium driver's current page in one script call"""
+        spec = self.spec(board_name)
+        self._count('selenium')
+        return driver.execute_script(spec.selenium_script, spec.script_args)
+    
+    def extract_lxml(self, root, board_name: Optional[str]) -> Dict[str, str]:
+        """Extract the fields from an lxml.html document"""
+        self._count('lxml')
+        return self.spec(board_name).extract_lxml(root)
+    
+    def extract_soup(self, soup, board_name: Optional[str]) -> Dict[str, str]:
+        """Extract the fields from a BeautifulSoup document"""
+        self._count('soup')
+        return self.spec(board_name).extract_soup(soup)
+    
+    def extract_scrapy(self, response, board_name: Optional[str]) -> Dict[str, str]:
+        """Extract the fields from a Scrapy response through its already parsed lxml tree"""
+        self._count('scrapy')
+        return self.spec(board_name).extract_lxml(response.selector.root)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get compilation counters and extractions per backend"""
+        return {**self.stats, 'extractions': dict(self.extractions)}
+
+
+# Shared engines keyed by the selector settings they were compiled from
+_shared_engines: Dict[str, SelectorEngine] = {}
+
+
+def get_shared_selector_engine(config: Optional[ScraperConfig] = None) -> SelectorEngine:
+    """Get the process-wide engine of a config's selectors, so they are compiled once for every scraper"""
+    config = config or scraper_config
+    key = json.dumps([config.job_boards, config.generic_selectors], sort_keys=True, default=str)
+    if key not in _shared_engines:
+        _shared_engines[key] = SelectorEngine.from_config(config)
+    return _shared_engines[key]
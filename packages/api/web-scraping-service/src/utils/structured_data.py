@@ -0,0 +1,223 @@
+"""
+Structured data (schema.org JobPosting JSON-LD) extraction
+"""
+
+import html
+import json
+import re
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any
+
+from dateutil import parser as date_parser
+from loguru import logger
+
+
+# Multipliers to turn a salary quoted per unit into a yearly figure
+SALARY_UNIT_MULTIPLIERS = {
+    'HOUR': 40 * 52,
+    'DAY': 5 * 52,
+    'WEEK': 52,
+    'MONTH': 12,
+    'YEAR': 1,
+}
+
+EMPLOYMENT_TYPE_MAP = {
+    'FULL_TIME': 'full_time',
+    'PART_TIME': 'part_time',
+    'CONTRACTOR': 'contract',
+    'CONTRACT': 'contract',
+    'TEMPORARY': 'contract',
+    'PER_DIEM': 'contract',
+    'INTERN': 'internship',
+    'INTERNSHIP': 'internship',
+}
+
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def find_job_posting(json_ld_blocks: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    Find the first JobPosting object in a page's JSON-LD script contents
+    
+    Args:
+        json_ld_blocks: Text content of every <script type="application/ld+json"> on the page
+    
+    Returns:
+        The JobPosting object, or None if the page has none
+    """
+    for block in json_ld_blocks:
+        if not block:
+            continue
+        try:
+            data = json.loads(block.strip())
+        except ValueError:
+            # Some boards emit raw control characters inside strings
+            try:
+                data = json.loads(block.strip(), strict=False)
+            except ValueError:
+                continue
+        
+        posting = _search_job_posting(data)
+        if posting:
+            return posting
+    
+    return None
+
+
+def _search_job_posting(data: Any) -> Optional[Dict[str, Any]]:
+    """Walk lists and @graph containers looking for a JobPosting"""
+    if isinstance(data, list):
+        for item in data:
+            posting = _search_job_posting(item)
+            if posting:
+                return posting
+        return None
+    
+    if not isinstance(data, dict):
+        return None
+    
+    schema_type = data.get('@type')
+    types = schema_type if isinstance(schema_type, list) else [schema_type]
+    if 'JobPosting' in types:
+        return data
+    
+    if '@graph' in data:
+        return _search_job_posting(data['@graph'])
+    
+    return None
+
+
+def job_posting_to_job_data(posting: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map a schema.org JobPosting onto JobData fields
+    
+    Only fields present in the posting are returned, so the result can be
+    merged over defaults or selector-extracted values.
+    """
+    job_data: Dict[str, Any] = {}
+    
+    title = _clean_text(posting.get('title'))
+    if title:
+        job_data['title'] = title
+    
+    organization = posting.get('hiringOrganization')
+    company = organization.get('name') if isinstance(organization, dict) else organization
+    company = _clean_text(company)
+    if company:
+        job_data['company'] = company
+    
+    location = _format_location(posting.get('jobLocation'))
+    location_type = posting.get('jobLocationType')
+    if isinstance(location_type, str) and location_type.upper() == 'TELECOMMUTE':
+        job_data['remote_type'] = 'remote'
+        location = location or 'Remote'
+    if location:
+        job_data['location'] = location
+    
+    description = _clean_text(posting.get('description'))
+    if description:
+        job_data['description'] = description
+    
+    employment_type = posting.get('employmentType')
+    if isinstance(employment_type, list):
+        employment_type = employment_type[0] if employment_type else None
+    if isinstance(employment_type, str):
+        mapped = EMPLOYMENT_TYPE_MAP.get(employment_type.upper().replace('-', '_').replace(' ', '_'))
+        if mapped:
+            job_data['employment_type'] = mapped
+    
+    job_data.update(_parse_salary(posting.get('baseSalary') or posting.get('estimatedSalary')))
+    
+    posted_date = _parse_date(posting.get('datePosted'))
+    if posted_date:
+        job_data['posted_date'] = posted_date
+    
+    expires_date = _parse_date(posting.get('validThrough'))
+    if expires_date:
+        job_data['expires_date'] = expires_date
+    
+    identifier = posting.get('identifier')
+    if isinstance(identifier, dict):
+        identifier = identifier.get('value')
+    if identifier:
+        job_data['external_id'] = str(identifier)
+    
+    return job_data
+
+
+def _clean_text(value: Any) -> str:
+    """Strip HTML markup and collapse whitespace"""
+    if not value or not isinstance(value, str):
+        return ""
+    text = _TAG_PATTERN.sub(' ', html.unescape(value))
+    return _WHITESPACE_PATTERN.sub(' ', text).strip()
+
+
+def _format_location(job_location: Any) -> str:
+    """Format the first jobLocation as 'City, Region, Country'"""
+    if isinstance(job_location, list):
+        job_location = job_location[0] if job_location else None
+    if not isinstance(job_location, dict):
+        return ""
+    
+    address = job_location.get('address', job_location)
+    if isinstance(address, str):
+        return _clean_text(address)
+    if not isinstance(address, dict):
+        return ""
+    
+    parts = []
+    for key in ('addressLocality', 'addressRegion', 'addressCountry'):
+        value = address.get(key)
+        if isinstance(value, dict):
+            value = value.get('name')
+        value = _clean_text(value)
+        if value and value not in parts:
+            parts.append(value)
+    
+    return ', '.join(parts)
+
+
+def _parse_salary(base_salary: Any) -> Dict[str, Any]:
+    """Read min/max salary from a MonetaryAmount, converted to yearly amounts"""
+    if not isinstance(base_salary, dict):
+        return {}
+    
+    value = base_salary.get('value')
+    unit = base_salary.get('unitText')
+    if isinstance(value, dict):
+        unit = value.get('unitText', unit)
+        min_value = value.get('minValue', value.get('value'))
+        max_value = value.get('maxValue', value.get('value'))
+    else:
+        min_value = max_value = value
+    
+    multiplier = SALARY_UNIT_MULTIPLIERS.get(str(unit or 'YEAR').upper(), 1)
+    salary: Dict[str, Any] = {}
+    
+    for field, amount in (('salary_min', min_value), ('salary_max', max_value)):
+        try:
+            if amount is not None and amount != '':
+                salary[field] = int(float(str(amount).replace(',', '')) * multiplier)
+        except ValueError:
+            continue
+    
+    if salary and base_salary.get('currency'):
+        salary['salary_currency'] = str(base_salary['currency']).upper()
+    
+    return salary
+
+
+def _parse_date(value: Any) -> Optional[datetime]:
+    """Parse an ISO 8601 date into a naive UTC datetime"""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        parsed = date_parser.isoparse(value.strip())
+    except (ValueError, OverflowError):
+        logger.debug(f"Unparseable JSON-LD date: {value}")
+        return None
+    if parsed.tzinfo:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
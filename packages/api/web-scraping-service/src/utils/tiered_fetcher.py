@@ -0,0 +1,171 @@
+"""
+HTTP tier of the crawl: fetch detail pages with a plain async HTTP client and
+parse them with lxml, so only pages that need JavaScript go to Playwright
+"""
+
+import asyncio
+import random
+from typing import Callable, Dict, List, Optional, Any, Tuple
+
+import httpx
+import lxml.html
+from loguru import logger
+
+from ..config.scraper_config import ScraperConfig
+from .rate_limiter import DomainRateLimiter
+from .response_cache import ResponseCache
+from .selector_engine import SelectorEngine, get_shared_selector_engine
+from .structured_data import find_job_posting, job_posting_to_job_data
+
+
+class TieredFetcher:
+    """
+    Fetches job detail pages over HTTP and validates the extracted fields.
+    
+    A page that fails to fetch, parse or validate is escalated to the browser.
+    Escalation rates are tracked per board; once a board's rate reaches
+    ``http_escalation_threshold`` its detail pages go straight to the browser,
+    with an occasional probe in case the board starts rendering server-side.
+    A board can also pin its tier with ``job_boards[board]["fetch_tier"]``
+    (``"auto"``, ``"http"`` or ``"browser"``).
+    """
+    
+    def __init__(self, config: ScraperConfig, rate_limiter: DomainRateLimiter, response_cache: ResponseCache,
+                 transport: Optional[httpx.AsyncBaseTransport] = None,
+                 selector_engine: Optional[SelectorEngine] = None):
+        self.config = config
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+        self.selector_engine = selector_engine or get_shared_selector_engine(config)
+        self.transport = transport
+        self.response_hooks: List[Callable] = []
+        self.semaphore = asyncio.Semaphore(max(config.http_first_concurrency, 1))
+        self.client: Optional[httpx.AsyncClient] = None
+        self.board_stats: Dict[str, Dict[str, int]] = {}
+    
+    def _stats(self, board_name: str) -> Dict[str, int]:
+        """Get or create a board's counters"""
+        if board_name not in self.board_stats:
+            self.board_stats[board_name] = {
+                'attempts': 0,
+                'http_successes': 0,
+                'escalations': 0,
+                'batches_skipped': 0,
+                'bytes_downloaded': 0,
+            }
+        return self.board_stats[board_name]
+    
+    def escalation_rate(self, board_name: str) -> float:
+        """Share of a board's HTTP attempts that had to be escalated to the browser"""
+        stats = self._stats(board_name)
+        return stats['escalations'] / stats['attempts'] if stats['attempts'] else 0.0
+    
+    def use_http(self, board_name: str) -> bool:
+        """Decide whether a board's next batch of detail pages should try the HTTP tier"""
+        if not self.config.http_first_enabled:
+            return False
+        
+        fetch_tier = self.config.job_boards.get(board_name, {}).get('fetch_tier', 'auto')
+        if fetch_tier != 'auto':
+            return fetch_tier == 'http'
+        
+        stats = self._stats(board_name)
+        if stats['attempts'] < self.config.http_escalation_min_samples:
+            return True
+        if self.escalation_rate(board_name) < self.config.http_escalation_threshold:
+            return True
+        
+        # The board needs JS; still probe now and then in case that changes
+        stats['batches_skipped'] += 1
+        return stats['batches_skipped'] % max(self.config.http_probe_interval, 1) == 0
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Create the shared HTTP client on first use"""
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                headers={'User-Agent': random.choice(self.config.user_agents)},
+                timeout=self.config.request_timeout,
+                follow_redirects=True,
+                transport=self.transport,
+                event_hooks={'response': self.response_hooks},
+            )
+        return self.client
+    
+    async def fetch_job(self, board_name: str, url: str) -> Optional[Tuple[Dict[str, Any], str]]:
+        """
+        Fetch and parse a job detail page over HTTP
+        
+        Args:
+            board_name: Job board the page belongs to, whose selectors are used when the page has no JobPosting
+            url: Detail page URL
+        
+        Returns:
+            (job fields, extraction method) or None if the page must be escalated to the browser
+        """
+        stats = self._stats(board_name)
+        stats['attempts'] += 1
+        result = None
+        
+        try:
+            response = self.response_cache.get_fresh(board_name, url)
+            if response is None:
+                async with self.semaphore:
+                    await self.rate_limiter.acquire(url)
+                    raw = await self._get_client().get(url, headers=self.response_cache.revalidation_headers(url))
+            
+                self.rate_limiter.record_response(url, raw.status_code, raw.headers.get('retry-after'))
+                stats['bytes_downloaded'] += len(raw.content)
+                response = self.response_cache.update(
+                    url, raw.status_code, raw.headers, raw.content, store=not raw.history
+                )
+            
+            if response.status_code == 200:
+                result = self._parse(response.text, board_name)
+        
+        except Exception as e:
+            logger.debug(f"HTTP fetch failed for {url}: {e}")
+        
+        if result and self.validate(result[0], url):
+            stats['http_successes'] += 1
+            return result
+        
+        stats['escalations'] += 1
+        return None
+    
+    def _parse(self, html: str, board_name: str) -> Optional[Tuple[Dict[str, Any], str]]:
+        """Extract job fields from JSON-LD, falling back to the board's selectors"""
+        tree = lxml.html.fromstring(html)
+        
+        posting = find_job_posting(tree.xpath('//script[@type="application/ld+json"]/text()'))
+        if posting:
+            fields = job_posting_to_job_data(posting)
+            if fields.get('title') and fields.get('company'):
+                return fields, 'structured_data'
+        
+        fields = {
+            field: value for field, value in self.selector_engine.extract_lxml(tree, board_name).items() if value
+        }
+        
+        return (fields, 'selectors') if fields else None
+    
+    def validate(self, fields: Dict[str, Any], url: str) -> bool:
+        """Check extracted fields against the configured data quality rules"""
+        values = {'source_url': url, **fields}
+        if any(not values.get(field) for field in self.config.required_fields):
+            return False
+        if len(values.get('title') or '') < self.config.min_title_length:
+            return False
+        return len(values.get('description') or '') >= self.config.min_description_length
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-board HTTP tier counters and escalation rates"""
+        return {
+            board_name: {**stats, 'escalation_rate': round(self.escalation_rate(board_name), 3)}
+            for board_name, stats in self.board_stats.items()
+        }
+    
+    async def close(self):
+        """Close the HTTP client"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
@@ -0,0 +1,133 @@
+"""
+Board-specific URL canonicalization for request deduplication
+"""
+
+import re
+from typing import Dict, List, Optional, Any, Pattern, Set
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+from loguru import logger
+
+
+class UrlCanonicalizer:
+    """
+    Rewrites job URLs into a stable canonical form per job board.
+    
+    Rules come from the ``canonicalization`` section of each entry in
+    ``ScraperConfig.job_boards``:
+    
+    - ``id_pattern``: regex with one group capturing the job id; when it matches,
+      the URL is rebuilt from ``canonical_path`` (e.g. ``/jobs/view/{id}``)
+    - ``keep_params``: if set, only these query parameters survive
+    - ``strip_params``: query parameters removed in addition to the global tracking params
+    """
+    
+    def __init__(self, job_boards: Dict[str, Dict[str, Any]], tracking_params: Optional[List[str]] = None):
+        self.tracking_params = set(tracking_params or [])
+        self.rules: Dict[str, Dict[str, Any]] = {}
+        for board_name, board_config in job_boards.items():
+            self.rules[board_name] = self._compile_rules(board_config.get('canonicalization', {}))
+        
+        self._seen: Dict[str, Set[str]] = {}
+        self.stats = {
+            'urls_seen': 0,
+            'urls_rewritten': 0,
+            'duplicates_avoided': 0,
+        }
+        self.duplicates_by_board: Dict[str, int] = {}
+    
+    def _compile_rules(self, rules: Dict[str, Any]) -> Dict[str, Any]:
+        """Precompile regexes of a board's canonicalization rules"""
+        id_pattern: Optional[Pattern] = None
+        if rules.get('id_pattern'):
+            id_pattern = re.compile(rules['id_pattern'])
+        
+        return {
+            'id_pattern': id_pattern,
+            'canonical_path': rules.get('canonical_path'),
+            'keep_params': set(rules['keep_params']) if rules.get('keep_params') else None,
+            'strip_params': set(rules.get('strip_params', [])),
+        }
+    
+    def canonicalize(self, board_name: str, url: str) -> str:
+        """
+        Return the canonical form of a job URL
+        
+        Args:
+            board_name: Job board the URL belongs to
+            url: Absolute URL as found on the page
+        
+        Returns:
+            Canonical URL (unchanged if it cannot be parsed)
+        """
+        try:
+            parsed = urlparse(url)
+            scheme = parsed.scheme.lower() or 'https'
+            netloc = parsed.netloc.lower()
+            rules = self.rules.get(board_name)
+            
+            if rules and rules['id_pattern'] and rules['canonical_path']:
+                match = rules['id_pattern'].search(url)
+                if match:
+                    canonical_path = rules['canonical_path'].format(id=match.group(1))
+                    path, _, query = canonical_path.partition('?')
+                    canonical = urlunparse((scheme, netloc, path, '', query, ''))
+                    self._count_rewrite(url, canonical)
+                    return canonical
+            
+            query_params = []
+            for key, value in parse_qsl(parsed.query, keep_blank_values=True):
+                if key in self.tracking_params or key.startswith('utm_'):
+                    continue
+                if rules:
+                    if rules['keep_params'] is not None and key not in rules['keep_params']:
+                        continue
+                    if key in rules['strip_params']:
+                        continue
+                query_params.append((key, value))
+            
+            path = parsed.path.rstrip('/') or '/'
+            canonical = urlunparse((scheme, netloc, path, '', urlencode(sorted(query_params)), ''))
+            self._count_rewrite(url, canonical)
+            return canonical
+        
+        except Exception as e:
+            logger.error(f"Error canonicalizing URL {url}: {e}")
+            return url
+    
+    def _count_rewrite(self, original: str, canonical: str):
+        """Track how many URLs actually changed"""
+        if original != canonical:
+            self.stats['urls_rewritten'] += 1
+    
+    def register(self, board_name: str, canonical_url: str) -> bool:
+        """
+        Record a canonical URL as enqueued
+        
+        Returns:
+            True if the URL is new, False if it was already enqueued in this crawl
+        """
+        self.stats['urls_seen'] += 1
+        seen = self._seen.setdefault(board_name, set())
+        
+        if canonical_url in seen:
+            self.stats['duplicates_avoided'] += 1
+            self.duplicates_by_board[board_name] = self.duplicates_by_board.get(board_name, 0) + 1
+            return False
+        
+        seen.add(canonical_url)
+        return True
+    
+    def reset_seen(self, board_name: Optional[str] = None):
+        """Forget enqueued URLs, e.g. when a new crawl starts"""
+        if board_name:
+            self._seen.pop(board_name, None)
+        else:
+            self._seen.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get canonicalization and deduplication counters"""
+        return {
+            **self.stats,
+            'duplicates_by_board': dict(self.duplicates_by_board),
+        }
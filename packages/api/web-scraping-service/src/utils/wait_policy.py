@@ -0,0 +1,137 @@
+"""
+Declarative per-board wait policies that decide when a Playwright page is
+ready to extract, instead of fixed selector timeouts and networkidle
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Any, Tuple
+
+from loguru import logger
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+
+@dataclass
+class WaitPolicy:
+    """How to wait for one page type of one board"""
+    selector: Optional[str] = None
+    no_results: Optional[str] = None
+    state: str = 'attached'
+    load_state: Optional[str] = None
+    url_changes: bool = False
+    timeout: int = 10000
+    on_timeout: str = 'continue'
+
+
+class WaitPolicyEngine:
+    """
+    Waits for pages according to per-board, per-page-type policies.
+    
+    The defaults of each page type ("listing", "detail", "pagination") come
+    from ``ScraperConfig.wait_policies``; a board overrides any of their keys
+    through the ``waits`` key of its ``job_boards`` entry:
+        
+        selector     CSS selector that marks the page as ready
+        no_results   CSS selector of the board's "no results" marker; seeing it ends the wait early
+        state        element state the selectors must reach ("attached" or "visible")
+        load_state   load state to reach as well ("commit", "domcontentloaded", "load", "networkidle")
+        url_changes  wait for the URL to change first (after clicking a link)
+        timeout      budget in milliseconds shared by every condition of the wait
+        on_timeout   "continue" to extract whatever rendered, "fail" to raise
+    
+    Observed wait durations are kept per board, page type and outcome so each
+    board's policy can be tuned to its real readiness signal.
+    """
+    
+    READY = 'ready'
+    NO_RESULTS = 'no_results'
+    TIMEOUT = 'timeout'
+    
+    def __init__(self, base_policies: Dict[str, Dict[str, Any]], job_boards: Dict[str, Dict[str, Any]],
+                 samples: int = 200):
+        self.base_policies = base_policies
+        self.policies: Dict[Tuple[str, str], WaitPolicy] = {}
+        for board_name, board_config in job_boards.items():
+            for page_type in set(base_policies) | set(board_config.get('waits', {})):
+                self.policies[(board_name, page_type)] = self._build_policy(
+                    page_type, board_config.get('waits', {}).get(page_type, {})
+                )
+        
+        self.samples = samples
+        self.durations: Dict[Tuple[str, str], Deque[float]] = {}
+        self.outcomes: Dict[Tuple[str, str], Dict[str, int]] = {}
+    
+    def _build_policy(self, page_type: str, override: Dict[str, Any]) -> WaitPolicy:
+        """Merge a board override over the page type's defaults"""
+        return WaitPolicy(**{**self.base_policies.get(page_type, {}), **override})
+    
+    def policy(self, board_name: Optional[str], page_type: str) -> WaitPolicy:
+        """Get the policy of a board's page type, falling back to the page type's defaults"""
+        policy = self.policies.get((board_name, page_type))
+        if policy is None:
+            policy = self.policies[(board_name, page_type)] = self._build_policy(page_type, {})
+        return policy
+    
+    async def wait(self, page, board_name: Optional[str], page_type: str,
+                   previous_url: Optional[str] = None) -> Tuple[str, float]:
+        """
+        Wait until a page is ready, shows its "no results" marker or runs out of budget
+        
+        Returns:
+            The outcome (READY, NO_RESULTS or TIMEOUT) and the seconds waited
+        
+        Raises:
+            PlaywrightTimeoutError: if the budget runs out and the policy's on_timeout is "fail"
+        """
+        policy = self.policy(board_name, page_type)
+        start_time = time.perf_counter()
+        
+        def remaining() -> float:
+            return max(policy.timeout - (time.perf_counter() - start_time) * 1000, 1)
+        
+        outcome = self.READY
+        try:
+            if policy.url_changes and previous_url:
+                await page.wait_for_url(
+                    lambda url: url != previous_url, wait_until=policy.load_state or 'commit', timeout=remaining()
+                )
+            elif policy.load_state:
+                await page.wait_for_load_state(policy.load_state, timeout=remaining())
+            
+            targets = ', '.join(filter(None, [policy.no_results, policy.selector]))
+            if targets:
+                await page.wait_for_selector(targets, state=policy.state, timeout=remaining())
+                if policy.no_results and await page.locator(policy.no_results).count() > 0:
+                    outcome = self.NO_RESULTS
+        except PlaywrightTimeoutError:
+            outcome = self.TIMEOUT
+        
+        elapsed = time.perf_counter() - start_time
+        self._record((board_name or 'generic', page_type), outcome, elapsed)
+        
+        if outcome == self.TIMEOUT:
+            logger.warning(f"{board_name or 'generic'} {page_type} page not ready after {policy.timeout}ms: {page.url}")
+            if policy.on_timeout == 'fail':
+                raise PlaywrightTimeoutError(f"Wait for {board_name} {page_type} page exceeded {policy.timeout}ms")
+        return outcome, elapsed
+    
+    def _record(self, key: Tuple[str, str], outcome: str, elapsed: float):
+        """Keep the outcome and a bounded window of observed durations"""
+        outcomes = self.outcomes.setdefault(key, {self.READY: 0, self.NO_RESULTS: 0, self.TIMEOUT: 0})
+        outcomes[outcome] += 1
+        self.durations.setdefault(key, deque(maxlen=self.samples)).append(elapsed)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get outcome counts and wait duration percentiles (ms) per board and page type"""
+        stats = {}
+        for key, durations in self.durations.items():
+            ordered = sorted(durations)
+            stats[':'.join(key)] = {
+                **self.outcomes[key],
+                'timeout_ms': self.policy(*key).timeout,
+                'p50_ms': round(ordered[len(ordered) // 2] * 1000),
+                'p95_ms': round(ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)] * 1000),
+                'max_ms': round(ordered[-1] * 1000),
+            }
+        return stats
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Tests import the service as the ``src`` package, like its entry points
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,30 @@
+"""
+Autoscaled pool samples exported as Prometheus metrics
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("crawlee")
+
+from src.utils.concurrency import ConcurrencyMonitor
+from src.utils.metrics import ScraperMetrics
+
+
+def test_samples_update_the_concurrency_gauges_and_count_scalings():
+    metrics = ScraperMetrics()
+    pool = SimpleNamespace(desired_concurrency=2, current_concurrency=1)
+    monitor = ConcurrencyMonitor(SimpleNamespace(_autoscaled_pool=pool), metrics=metrics)
+    
+    monitor._sample(0.0)
+    pool.desired_concurrency, pool.current_concurrency = 4, 3
+    monitor._sample(0.0)
+    pool.desired_concurrency = 3
+    monitor._sample(0.0)
+    
+    value = metrics.registry.get_sample_value
+    assert value('sparkapply_scraper_desired_concurrency') == 3
+    assert value('sparkapply_scraper_current_concurrency') == 3
+    assert value('sparkapply_scraper_concurrency_scalings_total', {'direction': 'up'}) == 1
+    assert value('sparkapply_scraper_concurrency_scalings_total', {'direction': 'down'}) == 1
@@ -0,0 +1,84 @@
+"""
+Budgeted crawl scheduling: which listing pages run now, later or never
+"""
+
+import pytest
+
+pytest.importorskip("crawlee")
+
+from crawlee import Request
+
+from src.utils.crawl_budget import CrawlBudget
+
+
+def pages(search: str, count: int):
+    return [Request.from_url(f"https://jobs.example.com/{search}?page={page}") for page in range(2, count + 2)]
+
+
+def test_unexplored_searches_are_admitted_in_queue_order():
+    budget = CrawlBudget(max_pages=100, explore_pages=1)
+    
+    admitted, forefront = budget.admit('linkedin', 'python', pages('python', 2))
+    
+    assert len(admitted) == 2
+    assert forefront is False
+    assert budget.stats['pages_explored'] == 2
+
+
+def test_fast_searches_go_first_and_slow_ones_are_held_back():
+    budget = CrawlBudget(max_pages=100, explore_pages=1, yield_share=0.5)
+    budget.record_listing('linkedin', 'fast', new_jobs=20, detail_pages=0, seconds=1.0)
+    budget.record_listing('linkedin', 'slow', new_jobs=1, detail_pages=0, seconds=1.0)
+    
+    fast, fast_forefront = budget.admit('linkedin', 'fast', pages('fast', 2))
+    slow, slow_forefront = budget.admit('linkedin', 'slow', pages('slow', 3))
+    
+    assert len(fast) == 2 and fast_forefront is True
+    assert slow == [] and slow_forefront is False
+    assert budget.has_deferred
+    assert budget.stats['pages_deferred'] == 3
+
+
+def test_release_hands_out_held_back_pages_best_rate_first():
+    budget = CrawlBudget(max_pages=100, explore_pages=1, yield_share=0.9)
+    budget.record_listing('linkedin', 'best', new_jobs=50, detail_pages=0, seconds=1.0)
+    budget.record_listing('linkedin', 'better', new_jobs=10, detail_pages=0, seconds=1.0)
+    budget.record_listing('linkedin', 'worse', new_jobs=2, detail_pages=0, seconds=1.0)
+    budget.admit('linkedin', 'worse', pages('worse', 2))
+    budget.admit('linkedin', 'better', pages('better', 2))
+    
+    released = budget.release(3)
+    
+    assert [request.url for request in released] == [
+        'https://jobs.example.com/better?page=2',
+        'https://jobs.example.com/better?page=3',
+        'https://jobs.example.com/worse?page=2',
+    ]
+    assert budget.release(5)[0].url == 'https://jobs.example.com/worse?page=3'
+    assert not budget.has_deferred
+
+
+def test_page_budget_exhaustion_drops_pages_and_requests_one_stop():
+    budget = CrawlBudget(max_pages=2)
+    budget.charge_page('linkedin', 'linkedin_jobs', 1.0)
+    assert not budget.exhausted
+    assert budget.request_stop() is False
+    
+    budget.charge_page('linkedin', 'linkedin_job_detail', 0.5)
+    
+    assert budget.exhausted
+    assert budget.admit('linkedin', 'python', pages('python', 2)) == ([], False)
+    assert budget.stats['pages_dropped'] == 2
+    assert budget.release(10) == []
+    assert budget.request_stop() is True
+    assert budget.request_stop() is False
+
+
+def test_time_budget_exhaustion():
+    budget = CrawlBudget(max_seconds=10.0)
+    assert not budget.exhausted
+    
+    budget.started_at -= 11.0
+    
+    assert budget.exhausted
+    assert budget.request_stop() is True
@@ -0,0 +1,73 @@
+"""
+A crawl stopped early (e.g. by its budget) must not stop the next crawl of the same scraper
+"""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+try:
+    from crawlee import Request
+    from src.scrapers import crawlee_job_scraper as scraper_module
+except ImportError as e:
+    pytest.skip(f"Crawler dependencies are not installed: {e}", allow_module_level=True)
+
+from src.config.scraper_config import ScraperConfig
+from src.utils.crawl_budget import CrawlBudget
+
+JOB_PAGE = b"""<html><head><title>Job</title></head><body>
+<h1>Senior Python Developer</h1>
+<div class="job-description"><p>Build crawlers, pipelines and services, with Python, Playwright and Postgres.</p></div>
+</body></html>"""
+
+
+class JobPageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.end_headers()
+        self.wfile.write(JOB_PAGE)
+    
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def job_site():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), JobPageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_budgeted_crawl_does_not_stop_the_next_crawl(tmp_path, job_site):
+    config = ScraperConfig(
+        data_storage_path=str(tmp_path),
+        response_cache_enabled=False,
+        http_first_enabled=False,
+        delay_between_requests=0.0,
+        randomize_delay=False,
+        max_concurrent_requests=1,
+    )
+    scraper = scraper_module.CrawleeJobScraper(config)
+    
+    def handled() -> int:
+        return scraper.handler_stats.get('default', {}).get('count', 0)
+    
+    async def crawl_twice():
+        # One page of budget stops the first crawl before its queue drains
+        scraper.crawl_budget = CrawlBudget(max_pages=1)
+        await scraper._run_crawl([Request.from_url(f"{job_site}/first/{i}") for i in range(5)])
+        first = handled()
+        
+        scraper.crawl_budget = None
+        await scraper._run_crawl([Request.from_url(f"{job_site}/second/{i}") for i in range(3)])
+        await scraper.close()
+        return first, handled() - first
+    
+    first, second = asyncio.run(crawl_twice())
+    assert 1 <= first < 5
+    assert second == 3
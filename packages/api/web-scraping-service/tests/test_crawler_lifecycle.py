@@ -0,0 +1,70 @@
+"""
+A stopped crawler is replaced before the next crawl, as crawlee never restarts one
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+pytest.importorskip("crawlee")
+
+from crawlee.storages import RequestQueue
+
+from src.utils.crawler_lifecycle import RestartableCrawler
+
+
+class StubCrawler:
+    def __init__(self, request_manager=None):
+        self.request_manager = request_manager or AsyncMock(spec=RequestQueue)
+        self.stop_reasons = []
+    
+    def stop(self, reason: str):
+        self.stop_reasons.append(reason)
+    
+    async def get_request_manager(self):
+        return self.request_manager
+
+
+def test_a_running_crawler_is_kept():
+    lifecycle = RestartableCrawler(StubCrawler)
+    crawler = lifecycle.crawler
+    
+    assert asyncio.run(lifecycle.prepare()) is False
+    assert lifecycle.crawler is crawler
+
+
+def test_a_stopped_crawler_is_replaced_and_its_queue_dropped():
+    lifecycle = RestartableCrawler(StubCrawler)
+    stopped = lifecycle.crawler
+    
+    lifecycle.stop('Crawl budget exhausted')
+    assert lifecycle.stopped
+    assert stopped.stop_reasons == ['Crawl budget exhausted']
+    
+    assert asyncio.run(lifecycle.prepare(purge_request_queue=True)) is True
+    assert lifecycle.crawler is not stopped
+    assert not lifecycle.stopped
+    stopped.request_manager.drop.assert_awaited_once()
+    assert lifecycle.get_stats() == {'stops': 1, 'replacements': 1}
+
+
+def test_a_kept_queue_is_not_dropped():
+    lifecycle = RestartableCrawler(StubCrawler)
+    stopped = lifecycle.crawler
+    
+    lifecycle.stop('Crawler service stopped')
+    asyncio.run(lifecycle.prepare(purge_request_queue=False))
+    
+    assert lifecycle.crawler is not stopped
+    stopped.request_manager.drop.assert_not_awaited()
+
+
+def test_other_request_managers_are_never_dropped():
+    shared_frontier = AsyncMock()
+    lifecycle = RestartableCrawler(lambda: StubCrawler(shared_frontier))
+    
+    lifecycle.stop('Crawl budget exhausted')
+    asyncio.run(lifecycle.prepare(purge_request_queue=True))
+    
+    shared_frontier.drop.assert_not_awaited()
@@ -0,0 +1,31 @@
+"""
+Known jobs index retention
+"""
+
+import json
+from datetime import datetime, timedelta
+
+from src.utils.known_jobs import KnownJobsStore
+
+
+def test_save_drops_jobs_not_seen_within_the_retention(tmp_path):
+    store = KnownJobsStore(str(tmp_path), retention_days=30)
+    store.record('linkedin', 'fresh', 'a')
+    store.record('indeed', 'stale', 'b')
+    store.jobs['indeed']['stale']['last_seen'] = (datetime.now() - timedelta(days=31)).isoformat()
+    
+    store.save()
+    
+    with open(tmp_path / 'known_jobs.json', encoding='utf-8') as f:
+        assert json.load(f) == {'linkedin': {'fresh': store.jobs['linkedin']['fresh']}}
+    assert store.classify('indeed', 'stale', 'b') == KnownJobsStore.NEW
+
+
+def test_jobs_are_kept_forever_without_a_retention(tmp_path):
+    store = KnownJobsStore(str(tmp_path))
+    store.record('linkedin', 'old', 'a')
+    store.jobs['linkedin']['old']['last_seen'] = datetime(2000, 1, 1).isoformat()
+    
+    store.save()
+    
+    assert store.classify('linkedin', 'old', 'a') == KnownJobsStore.UNCHANGED
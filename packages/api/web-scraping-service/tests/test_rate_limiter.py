@@ -0,0 +1,62 @@
+"""
+Per-domain pacing: reserved slots, deferral and 429 backoff
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.utils.rate_limiter import DomainRateLimiter, RateLimitDeferred
+
+
+URL = "https://jobs.example.com/python"
+
+
+def test_concurrent_callers_get_consecutive_slots():
+    limiter = DomainRateLimiter(delay=0.1, randomize=False)
+    
+    async def crawl():
+        return await asyncio.gather(*(limiter.acquire(URL) for _ in range(3)))
+    
+    waits = asyncio.run(crawl())
+    
+    assert sorted(waits) == pytest.approx([0.0, 0.1, 0.2], abs=0.02)
+
+
+def test_a_slot_too_far_away_is_deferred_without_being_reserved():
+    limiter = DomainRateLimiter(delay=10.0, randomize=False)
+    
+    async def crawl():
+        await limiter.acquire(URL)
+        with pytest.raises(RateLimitDeferred) as deferred:
+            await limiter.acquire(URL, max_wait=1.0)
+        return deferred.value
+    
+    deferred = asyncio.run(crawl())
+    
+    assert deferred.wait == pytest.approx(10.0, abs=0.1)
+    assert limiter.buckets['jobs.example.com'].tokens == pytest.approx(0.0, abs=0.01)
+    assert limiter.stats['deferred'] == 1
+    assert limiter.stats['requests'] == 1
+
+
+def test_other_domains_are_not_paced_together():
+    limiter = DomainRateLimiter(delay=10.0, randomize=False)
+    
+    async def crawl():
+        await limiter.acquire(URL)
+        return await limiter.acquire("https://www.other.example.org/jobs", max_wait=0.0)
+    
+    assert asyncio.run(crawl()) == 0.0
+
+
+def test_throttling_blocks_the_domain_until_retry_after():
+    limiter = DomainRateLimiter(delay=0.0, randomize=False)
+    limiter.record_response(URL, 429, retry_after='5')
+    
+    with pytest.raises(RateLimitDeferred) as deferred:
+        asyncio.run(limiter.acquire(URL, max_wait=1.0))
+    
+    assert deferred.value.wait == pytest.approx(5.0, abs=0.1)
+    assert limiter.buckets['jobs.example.com'].last_refill > time.monotonic()
@@ -0,0 +1,102 @@
+"""
+The distributed frontier against an in-process Redis fake
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("crawlee")
+fakeredis = pytest.importorskip("fakeredis")
+
+from crawlee import Request
+
+from src.utils.redis_request_queue import RedisRequestQueue
+
+
+def job_request(index: int) -> Request:
+    return Request.from_url(f"https://jobs.example.com/view/{index}")
+
+
+def test_workers_sharing_a_frontier_never_enqueue_a_request_twice():
+    async def scenario():
+        client = fakeredis.aioredis.FakeRedis()
+        first, second = RedisRequestQueue(client), RedisRequestQueue(client)
+        
+        await first.add_requests([job_request(1), job_request(2)])
+        processed = await second.add_request(job_request(2))
+        await second.add_requests([job_request(2), job_request(3)])
+        
+        fetched = []
+        while (request := await first.fetch_next_request()) is not None:
+            fetched.append(request.url)
+        return processed, fetched, first.stats, second.stats
+    
+    processed, fetched, first_stats, second_stats = asyncio.run(scenario())
+    
+    assert processed.was_already_present
+    assert fetched == [job_request(index).url for index in (1, 2, 3)]
+    assert first_stats['added'] == 2
+    assert second_stats['added'] == 1 and second_stats['duplicates'] == 2
+
+
+def test_an_expired_lease_is_fetched_again_by_another_worker():
+    async def scenario():
+        client = fakeredis.aioredis.FakeRedis()
+        dead_worker = RedisRequestQueue(client, lease_timeout=0.05)
+        live_worker = RedisRequestQueue(client, lease_timeout=0.05)
+        await dead_worker.add_request(job_request(1))
+        
+        leased = await dead_worker.fetch_next_request()
+        before_expiry = await live_worker.fetch_next_request()
+        await asyncio.sleep(0.1)
+        after_expiry = await live_worker.fetch_next_request()
+        return leased, before_expiry, after_expiry, live_worker.stats
+    
+    leased, before_expiry, after_expiry, stats = asyncio.run(scenario())
+    
+    assert leased.url == job_request(1).url
+    assert before_expiry is None
+    assert after_expiry.url == job_request(1).url
+    assert stats['leases_expired'] == 1
+
+
+def test_a_request_reclaimed_to_the_front_is_fetched_next():
+    async def scenario():
+        queue = RedisRequestQueue(fakeredis.aioredis.FakeRedis())
+        await queue.add_requests([job_request(1), job_request(2), job_request(3)])
+        
+        failed = await queue.fetch_next_request()
+        failed.retry_count += 1
+        await queue.reclaim_request(failed, forefront=True)
+        
+        fetched = []
+        while (request := await queue.fetch_next_request()) is not None:
+            fetched.append((request.url, request.retry_count))
+        return fetched, await queue.is_finished()
+    
+    fetched, finished = asyncio.run(scenario())
+    
+    assert fetched == [(job_request(1).url, 1), (job_request(2).url, 0), (job_request(3).url, 0)]
+    assert not finished
+
+
+def test_a_frontier_is_only_reset_once_no_lease_is_held():
+    async def scenario():
+        queue = RedisRequestQueue(fakeredis.aioredis.FakeRedis())
+        await queue.add_request(job_request(1))
+        request = await queue.fetch_next_request()
+        
+        reset_while_leased = await queue.reset_if_finished()
+        seen_while_leased = await queue.get_total_count()
+        
+        await queue.mark_request_as_handled(request)
+        reset_when_finished = await queue.reset_if_finished()
+        return reset_while_leased, seen_while_leased, reset_when_finished, await queue.get_total_count()
+    
+    reset_while_leased, seen_while_leased, reset_when_finished, seen_after_reset = asyncio.run(scenario())
+    
+    assert reset_while_leased is False
+    assert seen_while_leased == 1
+    assert reset_when_finished is True
+    assert seen_after_reset == 0
@@ -0,0 +1,41 @@
+"""
+Search handles of a kept-alive crawl once the crawl serving them ends
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("crawlee")
+
+from crawlee import Request
+
+from src.utils.search_handles import SearchHandle, SearchTracker
+
+
+def request(search_id: str, path: str) -> Request:
+    return Request.from_url(f"https://jobs.example.com/{path}", user_data={'search_id': search_id})
+
+
+def test_failing_outstanding_searches_releases_their_waiters():
+    tracker = SearchTracker()
+    running = tracker.open({'linkedin': {'keywords': 'python'}})
+    finished = tracker.open({'indeed': {'keywords': 'python'}})
+    tracker.track([request(running.search_id, 'a'), request(running.search_id, 'b'), request(finished.search_id, 'c')])
+    tracker.settle(request(running.search_id, 'a'))
+    tracker.settle(request(finished.search_id, 'c'))
+    
+    async def wait_and_fail():
+        waiter = asyncio.create_task(running.wait())
+        await asyncio.sleep(0)
+        tracker.fail_outstanding('Crawl ended')
+        return await asyncio.wait_for(waiter, 1.0)
+    
+    asyncio.run(wait_and_fail())
+    
+    assert running.status == SearchHandle.FAILED
+    assert running.error == 'Crawl ended'
+    assert running.stats['requests_failed'] == 1
+    assert finished.status == SearchHandle.FINISHED
+    assert tracker.get_stats()['requests_pending'] == 0
+    assert tracker.stats['searches_failed'] == 1